@@ -7,10 +7,6 @@ import datetime
 import os
 import time
 
-from pkt_kg.downloads import OntData, LinkedData
-from pkt_kg.edge_list import CreatesEdgeList
-from pkt_kg.knowledge_graph import FullBuild, PartialBuild, PostClosureBuild
-
 
 def main():
     parser = argparse.ArgumentParser(description=('PheKnowLator: This program builds a biomedical knowledge graph using'
@@ -18,17 +14,47 @@ def main():
                                                   'the following arguments:'))
     parser.add_argument('-g', '--onts', help='name/path to text file containing ontologies', required=True)
     parser.add_argument('-e', '--edg', help='name/path to text file containing edge sources', required=True)
-    parser.add_argument('-a', '--app', help='construction approach to use (i.e. instance or subclass', required=True)
+    parser.add_argument('-a', '--app', help='construction approach to use (i.e. instance or subclass; comma-separate '
+                                            'to build both)', required=True)
     parser.add_argument('-t', '--res', help='name/path to text file containing resource_info', required=True)
     parser.add_argument('-b', '--kg', help='the build, can be "partial", "full", or "post-closure"', required=True)
     parser.add_argument('-o', '--out', help='name/path to directory where to write knowledge graph', required=True)
     parser.add_argument('-n', '--nde', help='yes/no - adding node metadata to knowledge graph', required=True)
-    parser.add_argument('-r', '--rel', help='yes/no - adding inverse relations to knowledge graph', required=True)
-    parser.add_argument('-s', '--owl', help='yes/no - removing OWL Semantics from knowledge graph', required=True)
+    parser.add_argument('-r', '--rel', help='yes/no - adding inverse relations to knowledge graph (yes,no - both)',
+                        required=True)
+    parser.add_argument('-s', '--owl', help='yes/no - removing OWL Semantics from knowledge graph (yes,no - both)',
+                        required=True)
     parser.add_argument('-m', '--kgm', help='yes/no - adding node metadata to knowledge graph', required=True)
+    parser.add_argument('-c', '--cache', help='yes/no - skipping build stages whose inputs are unchanged',
+                        required=False, default='no')
+    parser.add_argument('-d', '--storage', help='memory/sqlite - storing triples in memory or on disk during the build',
+                        required=False, default='memory')
+    parser.add_argument('-p', '--cpus', help='number of processes used to create edge lists, construct edges, and '
+                                             'write outputs',
+                        required=False, default=1, type=int)
+    parser.add_argument('-f', '--ntriples', help='yes/no/gzip - streaming triples to an N-Triples file as edges are '
+                                                 'built', required=False, default='no')
+    parser.add_argument('-x', '--xml', help='yes/no - writing the knowledge graph to an RDF/XML (.owl) file',
+                        required=False, default='yes')
+    parser.add_argument('-q', '--parquet', help='yes/no - also writing the triple lists and node metadata to Parquet '
+                                                'files (requires pyarrow)', required=False, default='no')
+    parser.add_argument('-i', '--ids', help='name/path to the identifier-integer map (.json or .npz) of a previous '
+                                            'build, whose node integers are kept', required=False, default=None)
+    parser.add_argument('-k', '--chunks', help='number of rows of each edge source to read and process at a time '
+                                               '(default: read each edge source in full)', required=False,
+                        default=None, type=int)
+    parser.add_argument('-l', '--memory', help='memory budget (in MB) of the edge sources processed at the same time '
+                                               'when --cpus is greater than 1 (default: no budget)', required=False,
+                        default=None, type=float)
 
     args = parser.parse_args()
 
+    # the build modules are imported after the arguments are parsed so that -h and argument errors return quickly
+    from pkt_kg.downloads import OntData, LinkedData
+    from pkt_kg.edge_list import CreatesEdgeList
+    from pkt_kg.knowledge_graph import FullBuild, PartialBuild, PostClosureBuild, builds_knowledge_graph_variants
+    from pkt_kg.utils import BuildTelemetry
+
     ######################
     #### READ IN DATA ####
     ######################
@@ -74,7 +100,9 @@ def main():
     # STEP 1: create master resource dictionary
     combined_edges = dict(ent.data_files, **ont.data_files)
     # master_edges = CreatesEdgeList(data_files=combined_edges, source_file='./resources/resource_info.txt')
-    master_edges = CreatesEdgeList(data_files=combined_edges, source_file=args.res)
+    telemetry = BuildTelemetry()  # shared by the edge list and knowledge graph builds so one report covers both
+    master_edges = CreatesEdgeList(data_files=combined_edges, source_file=args.res, telemetry=telemetry,
+                                   chunk_size=args.chunks, cpus=args.cpus, memory_mb=args.memory)
     master_edges.creates_knowledge_graph_edges()
 
     end = time.time()
@@ -88,35 +116,24 @@ def main():
     print('\n' + '=' * 33 + '\nBUILDING KNOWLEDGE GRAPH\n' + '=' * 33 + '\n')
     start = time.time()
 
-    if args.kg == 'partial':
-        kg = PartialBuild(kg_version='v2.0.0',
-                          write_location=args.out,
-                          construction=args.app,
-                          edge_data='./resources/Master_Edge_List_Dict.json',
-                          node_data=args.nde,
-                          inverse_relations=args.rel,
-                          decode_owl=args.owl,
-                          kg_metadata_flag=args.kgm)
-    elif args.kg == 'post-closure':
-        kg = PostClosureBuild(kg_version='v2.0.0',
-                              write_location=args.out,
-                              construction=args.app,
-                              edge_data='./resources/Master_Edge_List_Dict.json',
-                              node_data=args.nde,
-                              inverse_relations=args.rel,
-                              decode_owl=args.owl,
-                              kg_metadata_flag=args.kgm)
-    else:
-        kg = FullBuild(kg_version='v2.0.0',
-                       write_location=args.out,
-                       construction=args.app,
-                       edge_data='./resources/Master_Edge_List_Dict.json',
-                       node_data=args.nde,
-                       inverse_relations=args.rel,
-                       decode_owl=args.owl,
-                       kg_metadata_flag=args.kgm)
-
-    kg.construct_knowledge_graph()
+    # build each requested variant - comma-separated arguments request several variants (e.g. -a instance,subclass)
+    build = PartialBuild if args.kg == 'partial' else PostClosureBuild if args.kg == 'post-closure' else FullBuild
+    variants = [{'construction': app, 'inverse_relations': rel, 'decode_owl': owl}
+                for app in args.app.split(',') for rel in args.rel.split(',') for owl in args.owl.split(',')]
+    builds_knowledge_graph_variants(build, variants,
+                                    kg_version='v2.0.0',
+                                    write_location=args.out,
+                                    edge_data='./resources/Master_Edge_List_Dict.json',
+                                    node_data=args.nde,
+                                    kg_metadata_flag=args.kgm,
+                                    cache=args.cache,
+                                    storage=args.storage,
+                                    cpus=args.cpus,
+                                    telemetry=telemetry,
+                                    ntriples=args.ntriples,
+                                    rdf_xml=args.xml,
+                                    parquet=args.parquet,
+                                    previous_map=args.ids)
 
     end = time.time()
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
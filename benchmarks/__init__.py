@@ -0,0 +1,7 @@
+"""
+Benchmarks for the pkt_kg knowledge graph build pipeline.
+
+The benchmarks run offline against deterministic synthetic data (see synthetic_data.py), which can be generated at any
+scale, and report the throughput and memory use of each benchmarked stage (see run_benchmarks.py). For example:
+    python -m benchmarks.run_benchmarks --scale 10000 --output ./benchmark_results
+"""
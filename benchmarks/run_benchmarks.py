@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Build Benchmarks.
+
+Generates synthetic build data (see synthetic_data.py) and then runs each benchmark in a new process, so that the peak
+memory reported for a benchmark is not affected by the benchmarks run before it. Each benchmark records its stages
+using a BuildTelemetry object and the records of all benchmarks are written to a single json report.
+
+Benchmarks
+* edge_list: CreatesEdgeList.creates_knowledge_graph_edges
+* construction_approaches: KGConstructionApproach.subclass_constructor and instance_constructor
+* owlnets: OwlNets.run_owl_nets
+* metadata: Metadata.node_metadata_processor, adds_node_metadata, and output_knowledge_graph_metadata
+* maps_node_ids_to_integers: maps_node_ids_to_integers
+* imports: importing pkt_kg, its most used modules, and Main.py in a new interpreter (i.e. startup time)
+
+Usage
+    python -m benchmarks.run_benchmarks --scale 10000 --output ./benchmark_results
+"""
+
+# import needed libraries
+import argparse
+import json
+import multiprocessing
+import os
+import os.path
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from rdflib import Graph  # type: ignore
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic_data import generates_synthetic_data  # noqa: E402
+from pkt_kg.construction_approaches import KGConstructionApproach  # noqa: E402
+from pkt_kg.edge_list import CreatesEdgeList  # noqa: E402
+from pkt_kg.metadata import Metadata  # noqa: E402
+from pkt_kg.owlnets import OwlNets  # noqa: E402
+from pkt_kg.utils import BuildTelemetry, maps_node_ids_to_integers  # noqa: E402
+
+# set global attributes
+kg_name = '/PheKnowLator_Synthetic_NoOWLSemantics_KG.owl'
+root_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+heavy_modules = ['networkx', 'pyarrow', 'rdflib.plugins.sparql']
+imports = {'pkt_kg': 'import pkt_kg',
+           'pkt_kg.utils.BuildTelemetry': 'from pkt_kg.utils import BuildTelemetry',
+           'pkt_kg.utils.kg_utils': 'import pkt_kg.utils.kg_utils',
+           'pkt_kg.knowledge_graph': 'import pkt_kg.knowledge_graph',
+           'Main': 'import Main'}
+
+
+def loads_graph(data: Dict, telemetry: BuildTelemetry) -> Graph:
+    """Reads the synthetic merged ontologies into a new graph.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        An RDFLib Graph object.
+    """
+
+    graph = Graph()
+    with telemetry.records_stage('loads_graph') as record:
+        graph.parse(data['merged_ontology'], format='xml')
+        record['items'] = record['triples'] = len(graph)
+
+    return graph
+
+
+def benchmarks_edge_list(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks the creation of the master edge list from the synthetic edge sources.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    edge_list = CreatesEdgeList(data['data_files'], data['resource_info'], telemetry)
+    edge_list.creates_knowledge_graph_edges()
+
+    return None
+
+
+def benchmarks_construction_approaches(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks the construction of the triples for each edge in the master edge list using the subclass and
+    instance construction approaches.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    for approach in ['subclass', 'instance']:
+        edge_builder = KGConstructionApproach(json.loads(json.dumps(data['edge_dict'])), data['resources'])
+        constructor = edge_builder.subclass_constructor if approach == 'subclass' else edge_builder.instance_constructor
+
+        for edge_type, edge_info in data['edge_dict'].items():
+            n1, n2 = edge_info['data_type'].split('-')
+            edge_builder.rejected_edges[edge_type] = set()
+            with telemetry.records_stage(approach + '_constructor', edge_type, len(edge_info['edge_list'])) as record:
+                triples: List = []
+                for edge in edge_info['edge_list']:
+                    triples += constructor({'n1': n1, 'n2': n2, 'rel': edge_info['edge_relation'], 'inv_rel': None,
+                                            'uri': edge_info['uri'], 'edges': edge}, edge_type)[1]
+                record['triples'] = len(set(triples))
+
+    return None
+
+
+def benchmarks_owlnets(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks decoding the OWL-encoded classes in the synthetic ontology with OWL-NETS.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    graph = loads_graph(data, telemetry)
+    owl_nets = OwlNets('subclass', graph, data['resources'] + '/knowledge_graphs', kg_name, telemetry)
+    owl_nets.run_owl_nets()
+
+    return None
+
+
+def benchmarks_metadata(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks reading the synthetic node metadata, adding it to the graph, and writing the node metadata file.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    graph = loads_graph(data, telemetry)
+    metadata = Metadata('v2.0.0', data['resources'] + '/knowledge_graphs', kg_name, data['node_data'], dict(),
+                        telemetry)
+    metadata.node_metadata_processor()
+    with telemetry.records_stage('adds_node_metadata') as record:
+        metadata.adds_node_metadata(graph, data['edge_dict'])
+        record['items'] = sum(len(x['edge_list']) for x in data['edge_dict'].values())
+        record['triples'] = len(graph)
+    metadata.output_knowledge_graph_metadata(graph)
+
+    return None
+
+
+def benchmarks_maps_node_ids_to_integers(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks writing the integer and identifier triple files and the integer identifier map.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    graph = loads_graph(data, telemetry)
+    with telemetry.records_stage('maps_node_ids_to_integers') as record:
+        record['items'] = record['triples'] = len(graph)
+        maps_node_ids_to_integers(graph, data['resources'] + '/knowledge_graphs', kg_name[:-6] + 'Triples_Integers.txt',
+                                  kg_name[:-6] + 'Triples_Integer_Identifier_Map.json')
+
+    return None
+
+
+def benchmarks_imports(data: Dict, telemetry: BuildTelemetry) -> None:
+    """Benchmarks the startup time of pkt_kg by running each statement in imports in a new interpreter. Each record
+    also lists the libraries which are only needed by some build stages (see heavy_modules) that the statement imported.
+
+    Args:
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()). Not used.
+        telemetry: A BuildTelemetry object.
+
+    Returns:
+        None.
+    """
+
+    for name, statement in imports.items():
+        code = statement + '; import json, sys; print(json.dumps([x for x in {} if x in sys.modules]))'
+        with telemetry.records_stage('imports', name) as record:
+            output = subprocess.check_output([sys.executable, '-c', code.format(heavy_modules)], cwd=root_directory)
+            record['imported_modules'] = json.loads(output.decode('utf-8').strip().split('\n')[-1])
+
+    return None
+
+
+benchmarks: Dict[str, Callable] = {'edge_list': benchmarks_edge_list,
+                                   'construction_approaches': benchmarks_construction_approaches,
+                                   'owlnets': benchmarks_owlnets,
+                                   'metadata': benchmarks_metadata,
+                                   'maps_node_ids_to_integers': benchmarks_maps_node_ids_to_integers,
+                                   'imports': benchmarks_imports}
+
+
+def runs_benchmark(name: str, data: Dict) -> List[Dict]:
+    """Runs a single benchmark.
+
+    Args:
+        name: A string containing the name of a benchmark (i.e. a key in benchmarks).
+        data: A dict containing the locations of the synthetic data (see generates_synthetic_data()).
+
+    Returns:
+        A list of the stage records created by the benchmark. Each record is labeled with the benchmark name.
+    """
+
+    telemetry = BuildTelemetry()
+    benchmarks[name](data, telemetry)
+
+    return [dict(record, benchmark=name) for record in telemetry.records]
+
+
+def runs_benchmarks(location: str, scale: int = 1000, seed: int = 1, names: Optional[List[str]] = None) -> str:
+    """Generates synthetic data and runs the requested benchmarks, each in a new process, and writes a json report
+    containing the records of every benchmark.
+
+    Args:
+        location: A string containing the directory to write the synthetic data and report to.
+        scale: An integer controlling the size of the synthetic data (see generates_synthetic_data()).
+        seed: An integer used to seed the synthetic data generator.
+        names: A list of benchmark names to run or None to run all benchmarks.
+
+    Returns:
+        A string containing the filepath of the report.
+
+    Raises:
+        ValueError: If names contains an unknown benchmark.
+    """
+
+    names = names if names else list(benchmarks.keys())
+    if any(x not in benchmarks for x in names):
+        raise ValueError('benchmarks must be one or more of: {}'.format(', '.join(benchmarks.keys())))
+
+    telemetry = BuildTelemetry()
+    data = generates_synthetic_data(location, scale, seed)
+
+    for name in names:
+        print('\n### Running Benchmark: {} (scale={}) ###'.format(name, scale))
+        pool = multiprocessing.get_context('spawn').Pool(1)
+        try:
+            telemetry.records += pool.apply(runs_benchmark, (name, data))
+        finally:
+            pool.close()
+            pool.join()
+
+    report = os.path.join(location, 'benchmark_report_scale{}.json'.format(scale))
+    telemetry.writes_report(report)
+
+    return report
+
+
+def prints_report(report: str) -> None:
+    """Prints a table summarizing the throughput and memory of each stage in a benchmark report.
+
+    Args:
+        report: A string containing the filepath of a benchmark report.
+
+    Returns:
+        None.
+    """
+
+    with open(report, 'r') as infile:
+        stages = json.load(infile)['stages']
+
+    row = '{:<26}{:<46}{:>10}{:>12}{:>14}{:>12}'
+    print('\n' + row.format('benchmark', 'stage', 'items', 'seconds', 'items/second', 'peak MB'))
+    for x in stages:
+        stage = x['stage'] + (' (' + x['edge_type'] + ')' if x['edge_type'] else '')
+        rate = '{:.1f}'.format(x['items_per_second']) if x['items_per_second'] is not None else '-'
+        memory = '{:.1f}'.format(x['process_peak_rss_mb']) if x['process_peak_rss_mb'] is not None else '-'
+        print(row.format(x['benchmark'], stage, x['items'] if x['items'] is not None else '-',
+                         '{:.3f}'.format(x['wall_seconds']), rate, memory))
+
+    return None
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Benchmarks the knowledge graph build using synthetic data.')
+    parser.add_argument('-s', '--scale', type=int, default=1000, help='size of the synthetic data')
+    parser.add_argument('-r', '--seed', type=int, default=1, help='seed for the synthetic data generator')
+    parser.add_argument('-b', '--benchmarks', nargs='+', default=None, choices=list(benchmarks.keys()),
+                        help='benchmarks to run (default: all)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='directory to write the synthetic data and report to (default: a temporary directory)')
+    args = parser.parse_args()
+
+    location = args.output if args.output else tempfile.mkdtemp(prefix='pkt_benchmarks_')
+    report = runs_benchmarks(location, args.scale, args.seed, args.benchmarks)
+    prints_report(report)
+
+    # only keep the report when writing to a temporary directory
+    if not args.output:
+        shutil.copy(report, os.path.basename(report))
+        shutil.rmtree(location)
+        report = os.path.basename(report)
+    print('\nReport: {}'.format(report))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic Knowledge Graph Build Data.
+
+Generates a deterministic, offline copy of each input needed to build a knowledge graph at a configurable scale:
+* An ontology containing class hierarchies, existential restrictions, and union and intersection constructors
+* Edge source data files (tsv) and the identifier mapping files they reference
+* A resource_info.txt file describing how each edge source is processed
+* A subclass_construction_map.pkl file mapping non-ontology nodes to ontology classes
+* Node metadata, relation and inverse relation, and OWL-NETS property files
+"""
+
+# import needed libraries
+import json
+import os
+import os.path
+import pickle
+import random
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef  # type: ignore
+from rdflib.collection import Collection  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+from typing import Dict, List, Tuple
+
+# set global attributes
+obo = Namespace('http://purl.obolibrary.org/obo/')
+oboinowl = Namespace('http://www.geneontology.org/formats/oboInOwl#')
+gene_uri = 'https://www.ncbi.nlm.nih.gov/gene/'
+relations = {'RO_0002606': 'is substance that treats', 'RO_0002302': 'is treated by substance',
+             'RO_0003302': 'causes or contributes to condition', 'RO_0002435': 'genetically interacts with',
+             'RO_0002202': 'develops from', 'BFO_0000050': 'part of'}
+inverse_relations = {'RO_0002606': 'RO_0002302'}
+
+
+def generates_ontology(classes: int, rng: random.Random) -> Graph:
+    """Generates an ontology with a single class hierarchy. Every class has a label, definition, and synonym and a
+    share of the classes are also defined using OWL constructors: every 5th class is a subclass of an existential
+    restriction, every 7th class is equivalent to the union of two classes, and every 11th class is equivalent to the
+    intersection of its parent class and an existential restriction.
+
+    Args:
+        classes: An integer specifying the number of classes to create.
+        rng: A seeded random.Random object.
+
+    Returns:
+        An RDFLib Graph object containing the ontology.
+    """
+
+    graph, nodes = Graph(), [obo['SYN_{:07d}'.format(x)] for x in range(1, classes + 1)]
+    graph.add((URIRef(obo + 'syn.owl'), RDF.type, OWL.Ontology))
+    for rel, label in relations.items():
+        graph.add((obo[rel], RDF.type, OWL.ObjectProperty))
+        graph.add((obo[rel], RDFS.label, Literal(label)))
+
+    for idx, node in enumerate(nodes):
+        graph.add((node, RDF.type, OWL.Class))
+        graph.add((node, RDFS.label, Literal('synthetic class {}'.format(idx + 1))))
+        graph.add((node, obo.IAO_0000115, Literal('A synthetic class generated for benchmarking.')))
+        graph.add((node, oboinowl.hasExactSynonym, Literal('syn class {}'.format(idx + 1))))
+        if idx == 0: continue
+        parent = nodes[rng.randrange(0, idx)]
+        graph.add((node, RDFS.subClassOf, parent))
+
+        if idx % 5 == 0:  # existential restriction
+            restriction = BNode()
+            graph.add((restriction, RDF.type, OWL.Restriction))
+            graph.add((restriction, OWL.onProperty, obo[rng.choice(['RO_0002202', 'BFO_0000050'])]))
+            graph.add((restriction, OWL.someValuesFrom, nodes[rng.randrange(0, classes)]))
+            graph.add((node, RDFS.subClassOf, restriction))
+        if idx % 7 == 0:  # union constructor
+            union, members = BNode(), BNode()
+            Collection(graph, members, [nodes[rng.randrange(0, classes)] for _ in range(2)])
+            graph.add((union, RDF.type, OWL.Class))
+            graph.add((union, OWL.unionOf, members))
+            graph.add((node, OWL.equivalentClass, union))
+        if idx % 11 == 0:  # intersection constructor containing a restriction
+            intersection, members, restriction = BNode(), BNode(), BNode()
+            graph.add((restriction, RDF.type, OWL.Restriction))
+            graph.add((restriction, OWL.onProperty, obo.RO_0002202))
+            graph.add((restriction, OWL.someValuesFrom, nodes[rng.randrange(0, classes)]))
+            Collection(graph, members, [parent, restriction])
+            graph.add((intersection, RDF.type, OWL.Class))
+            graph.add((intersection, OWL.intersectionOf, members))
+            graph.add((node, OWL.equivalentClass, intersection))
+
+    return graph
+
+
+def writes_tsv(filepath: str, rows: List[Tuple], header: List[str] = None) -> None:
+    """Writes a list of rows to a tab-delimited file.
+
+    Args:
+        filepath: A string containing the filepath to write to.
+        rows: A list of tuples, one per row.
+        header: A list of column names or None if the file has no header.
+
+    Returns:
+        None.
+    """
+
+    with open(filepath, 'w') as outfile:
+        if header: outfile.write('\t'.join(header) + '\n')
+        for row in rows:
+            outfile.write('\t'.join(str(x) for x in row) + '\n')
+
+    return None
+
+
+def generates_synthetic_data(location: str, scale: int = 1000, seed: int = 1) -> Dict:
+    """Generates a resources directory containing synthetic build inputs. The directory uses the same layout as the
+    resources directory used by the pkt_kg library (i.e. edge_data, knowledge_graphs, ontologies, etc.). The same
+    scale and seed always generate the same data.
+
+    The generated resource_info.txt file describes three edge types, one for each combination of node data types:
+        - chemical-disease (class-class): both columns are mapped to ontology classes and filtered by evidence type.
+        - gene-disease (entity-class): the disease column is mapped to ontology classes and filtered by score.
+        - gene-gene (entity-entity): the columns are used without mapping or filtering.
+    A small share of source identifiers are intentionally missing from the mapping files and a small share of genes
+    are missing from the subclass_construction_map.pkl file so that unmapped identifiers are exercised.
+
+    Args:
+        location: A string containing the directory to write the resources directory to.
+        scale: An integer controlling the size of the data. The ontology contains scale classes, there are scale
+            genes, and each edge source file contains 5 * scale rows.
+        seed: An integer used to seed the random number generator.
+
+    Returns:
+        A dict containing the locations of the generated data and the master edge list dict expected to be created
+        from the edge sources (i.e. after filtering and identifier mapping). For example:
+            {'resources': './synthetic/resources', 'resource_info': './synthetic/resources/resource_info.txt',
+             'data_files': {'gene-gene': './synthetic/resources/edge_data/gene-gene_synthetic.tsv', ...},
+             'merged_ontology': './synthetic/resources/knowledge_graphs/PheKnowLator_MergedOntologies.owl',
+             'node_data': ['./synthetic/resources/node_data/gene-gene_GENE_METADATA.txt', ...],
+             'edge_dict': {'gene-gene': {'data_type': 'entity-entity', 'edge_relation': 'RO_0002435', ...}}}
+
+    Raises:
+        ValueError: If scale is less than 20 (smaller edge source files are rejected by CreatesEdgeList).
+    """
+
+    if scale < 20:
+        raise ValueError('scale must be at least 20')
+
+    rng, res = random.Random(seed), os.path.join(location, 'resources')
+    for directory in ['construction_approach', 'edge_data', 'knowledge_graphs', 'node_data', 'ontologies',
+                      'owl_decoding', 'processed_data', 'relations_data']:
+        os.makedirs(os.path.join(res, directory), exist_ok=True)
+
+    # ontologies - the merged ontologies file is written so builds do not need to merge ontologies with OWLTools
+    ontology = generates_ontology(scale, rng)
+    ontology.serialize(destination=res + '/ontologies/syn_with_imports.owl', format='xml')
+    ontology.serialize(destination=res + '/knowledge_graphs/PheKnowLator_MergedOntologies.owl', format='xml')
+    classes, genes = ['SYN_{:07d}'.format(x) for x in range(1, scale + 1)], list(range(1, scale + 1))
+
+    # identifier maps - 5% of source identifiers are not mapped
+    chemical_map = {'MESH_C{:06d}'.format(x): rng.choice(classes) for x in range(scale) if rng.random() >= 0.05}
+    disease_map = {'C{:07d}'.format(x): rng.choice(classes) for x in range(scale) if rng.random() >= 0.05}
+    writes_tsv(res + '/processed_data/MESH_SYN_MAP.txt', sorted(chemical_map.items()))
+    writes_tsv(res + '/processed_data/DISEASE_SYN_MAP.txt', sorted(disease_map.items()))
+
+    # edge sources
+    chemicals, diseases = ['MESH_C{:06d}'.format(x) for x in range(scale)], ['C{:07d}'.format(x) for x in range(scale)]
+    evidence = ['therapeutic', 'marker/mechanism']
+    chem_dis = [(rng.choice(chemicals), rng.choice(diseases), rng.choice(evidence)) for _ in range(scale * 5)]
+    gene_dis = [(rng.choice(genes), rng.choice(diseases), round(rng.random(), 2)) for _ in range(scale * 5)]
+    gene_gene = [(rng.choice(genes), rng.choice(genes), round(rng.random(), 2)) for _ in range(scale * 5)]
+    data_files = {x: res + '/edge_data/' + x + '_synthetic.tsv' for x in ['chemical-disease', 'gene-disease',
+                                                                            'gene-gene']}
+    writes_tsv(data_files['chemical-disease'], chem_dis, ['ChemicalID', 'DiseaseID', 'DirectEvidence'])
+    writes_tsv(data_files['gene-disease'], gene_dis, ['GeneID', 'DiseaseID', 'Score'])
+    writes_tsv(data_files['gene-gene'], gene_gene, ['GeneA', 'GeneB', 'Score'])
+
+    # resource info
+    resource_info = [
+        ['chemical-disease', ';;', 'class-class', 'RO_0002606', str(obo), str(obo), 't', '0;1',
+         '0:' + res + '/processed_data/MESH_SYN_MAP.txt;1:' + res + '/processed_data/DISEASE_SYN_MAP.txt',
+         '2;==;therapeutic', 'None'],
+        ['gene-disease', ';;', 'entity-class', 'RO_0003302', gene_uri, str(obo), 't', '0;1',
+         '1:' + res + '/processed_data/DISEASE_SYN_MAP.txt', 'None', '2;>=;0.3'],
+        ['gene-gene', ';;', 'entity-entity', 'RO_0002435', gene_uri, gene_uri, 't', '0;1', 'None', 'None', 'None']]
+    with open(res + '/resource_info.txt', 'w') as outfile:
+        outfile.write('\n'.join('|'.join(x) for x in resource_info) + '\n')
+
+    # master edge list expected after filtering and mapping the edge sources
+    edge_lists = {'chemical-disease': [(chemical_map[x[0]], disease_map[x[1]]) for x in chem_dis
+                                       if x[2] == 'therapeutic' and x[0] in chemical_map and x[1] in disease_map],
+                  'gene-disease': [(str(x[0]), disease_map[x[1]]) for x in gene_dis
+                                   if x[2] >= 0.3 and x[1] in disease_map],
+                  'gene-gene': [(str(x[0]), str(x[1])) for x in gene_gene]}
+    edge_dict = {row[0]: {'source_labels': row[1], 'data_type': row[2], 'edge_relation': row[3],
+                          'uri': [row[4], row[5]], 'delimiter': row[6], 'column_idx': row[7],
+                          'identifier_maps': row[8], 'evidence_criteria': row[9], 'filter_criteria': row[10],
+                          'edge_list': [list(x) for x in sorted(set(edge_lists[row[0]]))]} for row in resource_info}
+    with open(res + '/Master_Edge_List_Dict.json', 'w') as outfile:
+        json.dump(edge_dict, outfile)
+
+    # subclass map - 1% of genes are not mapped to an ontology class
+    subclass_map = {str(x): [rng.choice(classes)] for x in genes if rng.random() >= 0.01}
+    with open(res + '/construction_approach/subclass_construction_map.pkl', 'wb') as outfile:
+        pickle.dump(subclass_map, outfile, protocol=4)
+
+    # node metadata
+    node_data = [res + '/node_data/' + x + '_GENE_METADATA.txt' for x in ['gene-disease', 'gene-gene']]
+    for filepath in node_data:
+        writes_tsv(filepath, [(x, 'GENE{}'.format(x), 'Synthetic gene {}.'.format(x), 'SG{}|gene-{}'.format(x, x))
+                              for x in genes], ['ID', 'Label', 'Description', 'Synonym'])
+
+    # relations and owl-nets property types
+    writes_tsv(res + '/relations_data/RELATIONS_LABELS.txt', sorted(relations.items()), ['Relation', 'Label'])
+    writes_tsv(res + '/relations_data/INVERSE_RELATIONS.txt', sorted(inverse_relations.items()),
+               ['Relation', 'Inverse_Relation'])
+    with open(res + '/owl_decoding/OWL_NETS_Property_Types.txt', 'w') as outfile:
+        outfile.write('\n'.join(str(obo) + x for x in sorted(relations)) + '\n')
+
+    return {'resources': res, 'resource_info': res + '/resource_info.txt', 'data_files': data_files,
+            'merged_ontology': res + '/knowledge_graphs/PheKnowLator_MergedOntologies.owl', 'node_data': node_data,
+            'edge_dict': edge_dict}
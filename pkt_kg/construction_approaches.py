@@ -41,6 +41,9 @@ class KGConstructionApproach(object):
              'uri': ['http://purl.obolibrary.org/obo/', 'https://reactome.org/content/detail/'], 'delimiter': 't',
              'column_idx': '0;1', 'identifier_maps': 'None', 'evidence_criteria': 'None', 'filter_criteria': 'None',
              'edge_list': [['CHEBI_24505', 'R-HSA-1006173'], ...] }, }
+        rejected_edges: A dict that stores the edges which should be removed from each edge type's edge list because
+            they contain a node that could not be mapped. Keys are edge_type and values are sets of edge tuples. For
+            example: {'gene-phenotype': {('2', 'HP_0002511'), ('2', 'HP_0000716')}}
         subclass_dict: A node data ontology class dict. Used for the subclass construction approach. Keys are
             non-ontology ids and values are lists of ontology classes mapped to each non-ontology id. For example,
             {'R-HSA-168277' :['http://purl.obolibrary.org/obo/PW_0001054','http://purl.obolibrary.org/obo/GO_0046730']}
@@ -58,6 +61,7 @@ class KGConstructionApproach(object):
 
     def __init__(self, edge_dict: Dict, write_location: str) -> None:
 
+        self.rejected_edges: Dict = dict()
         self.subclass_dict: Dict = dict()
         self.subclass_error: Dict = dict()
 
@@ -114,14 +118,33 @@ class KGConstructionApproach(object):
             else:
                 self.subclass_error[edge_type] = [entity]
 
-            # remove the edge from the edge_dict
-            self.edge_dict[edge_type]['edge_list'].pop(self.edge_dict[edge_type]['edge_list'].index(edge))
+            # mark the edge for removal from the edge_dict
+            self.rejected_edges.setdefault(edge_type, set()).add(tuple(edge))
             subclass_map = None
         else:
             subclass_map = self.subclass_dict[entity]
 
         return subclass_map
 
+    def removes_rejected_edges(self, edge_type: str) -> List:
+        """Removes the edges that were marked as rejected (see maps_node_to_class()) from an edge type's edge list. The
+        edge list is filtered in a single pass, which is done once after all of the edge type's edges are processed.
+
+        Args:
+            edge_type: A string containing the edge_type (e.g. "gene-pathway").
+
+        Returns:
+            A list of the edge type's edges which were not rejected.
+        """
+
+        rejected = self.rejected_edges.get(edge_type)
+
+        if rejected:
+            edge_list = [edge for edge in self.edge_dict[edge_type]['edge_list'] if tuple(edge) not in rejected]
+            self.edge_dict[edge_type]['edge_list'] = edge_list
+
+        return self.edge_dict[edge_type]['edge_list']
+
     @staticmethod
     def edge_constructor(node1: Union[BNode, URIRef], node2: Union[BNode, URIRef], relation: URIRef,
                          inverse_relation: Optional[URIRef]) -> Tuple:
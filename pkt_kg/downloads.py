@@ -375,6 +375,31 @@ class LinkedData(DataSource):
 
         return 'Edge Data'
 
+    @staticmethod
+    def links_data_file(source_file: str, link_file: str) -> None:
+        """Links a downloaded data file to the file name of another edge type using a hard link, so the data is only
+        stored once and CreatesEdgeList reads it once for all of the edge types. The file is copied instead when the
+        file system does not support hard links.
+
+        Args:
+            source_file: A string containing the filepath of a downloaded data file.
+            link_file: A string containing the filepath to link the data file to.
+
+        Returns:
+            None.
+        """
+
+        if os.path.exists(link_file):
+            if os.path.samefile(source_file, link_file): return None
+            else: os.remove(link_file)
+
+        try:
+            os.link(source_file, link_file)
+        except OSError:
+            shutil.copy(source_file, link_file)
+
+        return None
+
     def parses_resource_file(self) -> None:
         """Verifies a file contains data and then outputs a list where each item is a line from the input text file.
 
@@ -414,23 +439,25 @@ class LinkedData(DataSource):
         file_loc = '/'.join(self.data_path.split('/')[:-1]) + '/edge_data/'
         print('\n*** Downloading Data: {0} to "{1}" ***\n'.format(self.data_type, file_loc))
 
-        for i in tqdm(self.source_list.keys()):
-            source = self.source_list[i]
+        # group the edge types by url, so that each url is downloaded once and linked to the other edge types using it
+        urls: Dict[str, List[str]] = dict()
+        for i in self.source_list.keys(): urls.setdefault(self.source_list[i], []).append(i)
+
+        for source, edge_types in tqdm(urls.items()):
             file_name = re.sub('.gz|.zip|\\?.*', '', source.split('/')[-1])
             write_path = file_loc
-            print('\nEdge: {edge}'.format(edge=i))
+            print('\nEdge: {edge}'.format(edge=', '.join(edge_types)))
 
-            # if file has already been downloaded, rename it
+            # if file has already been downloaded, link it
             if any(x for x in os.listdir(write_path) if '_'.join(x.split('_')[1:]) == file_name):
-                self.data_files[i] = write_path + i + '_' + file_name
-
-                try:
-                    shutil.copy(glob.glob(write_path + '*' + file_name)[0], write_path + i + '_' + file_name)
-                except shutil.SameFileError:
-                    pass
+                self.links_data_file(glob.glob(write_path + '*' + file_name)[0], write_path + edge_types[0] + '_' +
+                                     file_name)
             else:
+                data_downloader(source, write_path, edge_types[0] + '_' + file_name)
+
+            for i in edge_types:
                 self.data_files[i] = write_path + i + '_' + file_name
-                data_downloader(source, write_path, i + '_' + file_name)
+                self.links_data_file(self.data_files[edge_types[0]], self.data_files[i])
 
         # generate metadata
         self.generates_source_metadata()
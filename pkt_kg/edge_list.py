@@ -2,18 +2,49 @@
 # -*- coding: utf-8 -*-
 
 # import needed libraries
+import ast
 import csv
+import itertools
 import json
+import multiprocessing
+import operator
+import os.path
 import pandas  # type: ignore
 import re
+import sys
 
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from difflib import SequenceMatcher
 from tqdm import tqdm  # type: ignore
-from typing import Any, Dict, IO, List, Optional, TextIO, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Union
 
-# TODO:
-#  (1) using eval() to handle filtering of downloaded data, should consider replacing this in a future release.
-#  (2) modify data_reader to stream/chunk large data files
+from pkt_kg.utils import BuildTelemetry, MappingDataCache, MappingLookup, hashes_file
+
+# set global attributes - the comparisons and string methods that can be used in filtering and evidence criteria
+comparisons: Dict[str, Callable] = {'==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le,
+                                    '>': operator.gt, '>=': operator.ge}
+string_methods: Set[str] = {'startswith', 'endswith', 'isalnum', 'isalpha', 'isdecimal', 'isdigit', 'islower',
+                            'isnumeric', 'isspace', 'istitle', 'isupper'}
+edge_list_worker_state: Optional[Any] = None  # CreatesEdgeList object inherited by each forked worker
+memory_factor = 10  # the estimated peak memory used to process a data file, as a multiple of its size on disk
+
+
+def creates_edge_list_worker(edge_types: List[str]) -> Tuple[Dict[str, List], List[Dict]]:
+    """Creates the edge lists for a group of edge types which share a data source in a worker process.
+
+    Args:
+        edge_types: A list of edge types whose data is read from the same source (see groups_edge_types()).
+
+    Returns:
+        A tuple containing a dictionary mapping each edge type to its edge list and the telemetry records created while
+        building them.
+    """
+
+    telemetry = BuildTelemetry()
+    edge_lists = edge_list_worker_state.creates_edge_lists(edge_types, telemetry)  # type: ignore
+
+    return edge_lists, telemetry.records
 
 
 class CreatesEdgeList(object):
@@ -33,13 +64,38 @@ class CreatesEdgeList(object):
             resource_info.txt file, which is used to process and generate the data. Additionally, this information
             also includes the type of edge (e.g. class or entity (non-ontology class data)) and a nested edge list. For
             additional information and an example, see the creates_knowledge_graph_edges() method.
-
+        telemetry: A BuildTelemetry object used to record the time and memory used to process each edge type. It can
+            be shared with the classes that build the knowledge graph so that a single report covers the entire build.
+        chunk_size: An integer containing the number of rows of an edge source to read and process at a time, or None
+            to read each edge source in full. See data_chunk_processor() for details.
+        mapping_cache: A MappingDataCache object which keeps the identifier mapping data sets in memory while the edge
+            lists are created, so that each mapping file is only read once. It is limited to mapping_cache_mb megabytes
+            (per process) and is cleared once all of the edge lists have been created.
+        cpus: An integer specifying the number of processes used to create the edge lists. The edge types which share
+            a data source (see groups_edge_types()) are processed by a single process.
+        memory_mb: A float containing the memory budget, in megabytes, of the edge sources processed at the same time
+            when cpus is greater than 1, or None for no budget. See estimates_edge_list_memory() for details.
+
+    Raises:
+        ValueError: If chunk_size is not None and is less than 1.
+        ValueError: If mapping_cache_mb is negative.
+        ValueError: If cpus is less than 1 or memory_mb is negative.
     """
 
-    def __init__(self, data_files: Dict[str, str], source_file: str) -> None:
+    def __init__(self, data_files: Dict[str, str], source_file: str,
+                 telemetry: Optional[BuildTelemetry] = None, chunk_size: Optional[int] = None,
+                 mapping_cache_mb: float = 1024.0, cpus: int = 1, memory_mb: Optional[float] = None) -> None:
 
         self.data_files = data_files
         self.source_file = source_file
+        self.telemetry = telemetry if telemetry is not None else BuildTelemetry()
+        if chunk_size is not None and chunk_size < 1: raise ValueError('chunk_size must be a positive integer or None')
+        else: self.chunk_size = chunk_size
+        self.mapping_cache = MappingDataCache(self.mapping_data_reader, mapping_cache_mb)
+        if cpus < 1: raise ValueError('cpus must be a positive integer')
+        else: self.cpus = cpus
+        if memory_mb is not None and memory_mb < 0: raise ValueError('memory_mb must not be negative')
+        else: self.memory_mb = memory_mb
 
         # convert edge data to a dictionary
         self.source_info: Dict[str, Dict[str, Any]] = dict()
@@ -98,6 +154,31 @@ class CreatesEdgeList(object):
         else:
             return None
 
+    @staticmethod
+    def skip_row_finder(file_path: str, delimiter: str = 't') -> Tuple[str, List[int]]:
+        """Streams a data source one line at a time to find the rows which are not valid data (i.e. rows that are empty
+        space or metadata), without holding the file in memory.
+
+        Args:
+            file_path: A Filepath to data.
+            delimiter: A Character used to split rows into columns.
+
+        Returns:
+            A tuple containing the string used to split rows into columns and a list of the indices of the rows to skip.
+        """
+
+        splitter = '\t' if 't' in delimiter else r"\s+" if '' in delimiter else delimiter
+        separator = delimiter if delimiter == '' or delimiter == ' ' else splitter
+
+        try:
+            with open(file_path, 'r') as input_data_r:
+                skip = [row for row, line in enumerate(input_data_r) if separator not in line.rstrip('\n')]
+        except ValueError:  # decode bytes to strings as utf-8 when they cannot be decoded with the default encoding
+            with open(file_path, 'r', encoding='utf-8') as input_data_u:
+                skip = [row for row, line in enumerate(input_data_u) if separator not in line.rstrip('\n')]
+
+        return splitter, skip
+
     def data_reader(self, file_path: str, delimiter: str = 't') -> pandas.DataFrame:
         """Takes a filepath pointing to data source and reads it into a Pandas DataFrame using information in the
         file and line splitter variables.
@@ -113,33 +194,88 @@ class CreatesEdgeList(object):
             Exception: If the Pandas DataFrame does not contain at least 2 columns and more than 10 rows.
         """
 
-        # temporarily read in the data
-        try:
-            with open(file_path, 'r') as input_data_r:  # type: IO[Any]
-                data = input_data_r.read().splitlines()
-            input_data_r.close()
-        except ValueError:
-            with open(file_path, 'rb') as input_data_rb:  # type: IO[Any]
-                data = input_data_rb.read().decode('utf-8').splitlines()  # decode bytes to strings
-            input_data_rb.close()
-
-        # clean up data to only keep valid rows (rows that are not empty space or metadata)
-        splitter = '\t' if 't' in delimiter else r"\s+" if '' in delimiter else delimiter
-        if delimiter == '' or delimiter == ' ':
-            skip = [row for row in range(0, len(data)) if delimiter not in data[row]]
-        else:
-            skip = [row for row in range(0, len(data)) if splitter not in data[row]]
-
-        # determine if file contains a header
+        # find valid rows (rows that are not empty space or metadata) and determine if file contains a header
+        splitter, skip = self.skip_row_finder(file_path, delimiter)
         edge_data = pandas.read_csv(file_path, header=self.identify_header(file_path, splitter, skip),
                                     delimiter=splitter, low_memory=False, skiprows=skip)
-        del data, skip
+        del skip
 
         if len(list(edge_data)) >= 2 and len(edge_data) > 10:
             return edge_data.fillna('None', inplace=False)
         else:
             raise ValueError('ERROR: Data could not be properly read in')
 
+    def mapping_data_reader(self, file_path: str) -> MappingLookup:
+        """Reads an identifier mapping data set into a lookup, converting every value to a string.
+
+        Args:
+            file_path: A Filepath to identifier mapping data.
+
+        Returns:
+            A MappingLookup object which maps the identifiers in the first column of the mapping data to those in the
+            second column.
+        """
+
+        map_data = self.data_reader(file_path).astype(str)
+
+        return MappingLookup(map_data[list(map_data)[0]], map_data[list(map_data)[1]])
+
+    def data_chunk_reader(self, file_path: str, delimiter: str = 't', chunk_size: int = 100000,
+                          columns: Optional[List[int]] = None, numeric_columns: Optional[Dict[int, bool]] = None) -> \
+            Iterator[pandas.DataFrame]:
+        """Reads a data source in chunks of rows. The data types of the columns are determined from every row before
+        the chunks are read (i.e. in a first pass over the data), so that each chunk is read the same way data_reader()
+        would have read it. For example, an integer column with an empty cell in a single row is read as float in every
+        chunk and a column containing text in a single row is read as text in every chunk.
+
+        Args:
+            file_path: A Filepath to data.
+            delimiter: A Character used to split rows into columns.
+            chunk_size: An integer containing the number of rows in each chunk.
+            columns: A list of the indices of the columns whose data types must match data_reader(), or None for all of
+                the columns.
+            numeric_columns: An optional dictionary which, before the first chunk is returned, is filled with whether
+                every value of each of the columns can be compared as a number by a numeric criteria (see
+                criteria_compiler()), keyed by column index.
+
+        Returns:
+            An iterator of Pandas DataFrames, each containing up to chunk_size rows of the data from the data_filepath.
+
+        Raises:
+            ValueError: If the data does not contain at least 2 columns.
+        """
+
+        splitter, skip = self.skip_row_finder(file_path, delimiter)
+        header = self.identify_header(file_path, splitter, skip)
+
+        # find the columns whose type differs between chunks, which are read as the type of the entire column, the
+        # columns with empty cells, which fillna() turns into object columns when the data is read in full, and the
+        # columns which numeric criteria compare as numbers when the data is read in full
+        kinds: Dict[Any, Set[str]] = dict()
+        missing: Set[Any] = set()
+        for edge_data in pandas.read_csv(file_path, header=header, delimiter=splitter, skiprows=skip,
+                                         usecols=None if columns is None else sorted(set(columns)),
+                                         chunksize=chunk_size):
+            for col in list(edge_data): kinds.setdefault(col, set()).add(edge_data[col].dtype.kind)
+            missing |= set(col for col in list(edge_data) if edge_data[col].isna().any())
+            if numeric_columns is None: continue
+            for idx, col in zip(sorted(set(columns)) if columns is not None else range(len(list(edge_data))),
+                                list(edge_data)):
+                if not numeric_columns.setdefault(idx, True): continue
+                try:
+                    edge_data[col].replace('None', 0).astype(float)
+                except (TypeError, ValueError):
+                    numeric_columns[idx] = False
+        dtypes = {col: 'float64' if kind <= {'i', 'f'} else object for col, kind in kinds.items() if len(kind) > 1}
+
+        for edge_data in pandas.read_csv(file_path, header=header, delimiter=splitter, skiprows=skip, dtype=dtypes,
+                                         chunksize=chunk_size):
+            if len(list(edge_data)) < 2: raise ValueError('ERROR: Data could not be properly read in')
+            edge_data = edge_data.fillna('None', inplace=False)
+            for col in missing: edge_data[col] = edge_data[col].astype(object)
+
+            yield edge_data
+
     @staticmethod
     def filter_fixer(criteria):
         """Processes empty strings by converting them to None.
@@ -160,6 +296,136 @@ class CreatesEdgeList(object):
 
             return fix_string
 
+    def filter_splitter(self, filter_criteria: str, evidence_criteria: str) -> List[str]:
+        """Splits a set of filtering and evidence criteria into the individual criteria, in the order they are applied.
+
+        Args:
+            filter_criteria: A '::' delimited string; each delimited item is a set of filtering criteria.
+            evidence_criteria: A '::' delimited string; each delimited item is a set of mapping criteria.
+
+        Returns:
+            A list of ';' delimited strings, one per criteria.
+        """
+
+        if filter_criteria == 'None' and evidence_criteria == 'None':
+            return []
+        else:
+            # fix known errors when filtering empty cells
+            map_filter_criteria = self.filter_fixer(filter_criteria) + '::' + self.filter_fixer(evidence_criteria)
+
+            return [x for x in map_filter_criteria.split('::') if x != 'None']
+
+    @staticmethod
+    def criteria_compiler(crit: str, numeric: Optional[bool] = None) -> Callable[[pandas.DataFrame], pandas.DataFrame]:
+        """Compiles a single filtering or evidence criteria (see filter_splitter()) into a function which applies it to
+        a Pandas DataFrame using vectorized operations. The criteria is parsed once, so the function can be applied to
+        many DataFrames (e.g. the chunks of a large data source). Each criteria contains a column index, an operation,
+        and a value, separated by ';' characters:
+            - 'dedup': '8-9;dedup;desc' sorts by column 8 (asc or desc) and keeps the first row for each column 9 value.
+            - numbers: '10;>=;0.70' converts the column to float, with "None" as 0, and compares it to the number.
+            - string methods: "5;.startswith('gene');" keeps the rows whose column value the method returns True for.
+            - lists: '24;in;["a", "b"]' keeps the rows whose column value is (or, with 'not in', is not) in the list.
+            - strings: '3;==;Homo sapiens' compares the column to the string (single quotes are removed).
+
+        Args:
+            crit: A ';' delimited string containing a single criteria.
+            numeric: Whether a numeric criteria compares the column as numbers (True) or as strings (False), or None to
+                decide from the column of each DataFrame it filters. data_chunk_processor() decides from the entire
+                column, so that each chunk is compared the same way.
+
+        Returns:
+            A function which takes a Pandas DataFrame and returns the rows which meet the criteria.
+
+        Raises:
+            ValueError: If the criteria uses an unsupported operation or value.
+        """
+
+        items = crit.split(';')
+        col_idx, op = items[0], items[1]
+
+        if op == 'dedup':
+            sort_idx, filter_idx = int(col_idx.split('-')[0]), int(col_idx.split('-')[1])
+            sort_dir = True if items[-1].lower() == 'asc' else False
+
+            def deduplicates(edge_data: pandas.DataFrame) -> pandas.DataFrame:
+                edge_data.sort_values(list(edge_data)[sort_idx], ascending=sort_dir, inplace=True)
+                edge_data.drop_duplicates(subset=list(edge_data)[filter_idx], keep='first', inplace=True)
+                return edge_data
+
+            return deduplicates
+
+        # numbers are compared to the column as floats - if the column is not numeric they are compared as strings
+        value, text = items[2], items[2].replace("'", '')
+        try:
+            number: Optional[float] = float(value)
+        except ValueError:
+            number = None
+        if number is not None and op not in comparisons:
+            raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+
+        if value == '' and '(' in op:
+            method = re.match(r'^\.(\w+)\((.*)\)$', op.strip())
+            if method is None or method.group(1) not in string_methods:
+                raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+            try:
+                name, args = method.group(1), ast.literal_eval('(' + method.group(2) + ',)') if method.group(2) else ()
+            except (SyntaxError, ValueError):
+                raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+
+            def compares(column: pandas.Series) -> pandas.Series:
+                return getattr(column.str, name)(*args).fillna(False).astype(bool)
+        elif ('(' in value or '[' in value) and op in ['in', 'not in']:
+            try:
+                values = ast.literal_eval(text)
+            except (SyntaxError, ValueError):
+                raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+
+            def compares(column: pandas.Series) -> pandas.Series:
+                return column.isin(list(values)) if op == 'in' else ~column.isin(list(values))
+        elif op in ['in', 'not in']:
+            def compares(column: pandas.Series) -> pandas.Series:  # checks whether the values are substrings of text
+                return pandas.Series([(x in text) == (op == 'in') for x in column], index=column.index, dtype=bool)
+        elif op in comparisons and '(' not in value and '[' not in value:
+            def compares(column: pandas.Series) -> pandas.Series:
+                return comparisons[op](column, text)
+        else:
+            raise ValueError('Unsupported filtering criteria: {}'.format(crit))
+
+        def filters(edge_data: pandas.DataFrame) -> pandas.DataFrame:
+            col = list(edge_data)[int(col_idx)]
+            if number is not None:
+                edge_data[col] = edge_data[col].replace('None', 0)
+                try:
+                    if numeric is not False:
+                        edge_data[col] = edge_data[col].astype(float)
+                        return edge_data.loc[comparisons[op](edge_data[col], number)]
+                except ValueError:  # compare the values as strings when the column is not numeric
+                    pass
+
+            return edge_data.loc[compares(edge_data[col])]
+
+        return filters
+
+    @staticmethod
+    def criteria_filter(edge_data: pandas.DataFrame, filters: List[Callable]) -> pandas.DataFrame:
+        """Applies a list of compiled filtering and/or evidence criteria (see criteria_compiler()) to a Pandas
+        DataFrame.
+
+        Args:
+            edge_data: A Pandas DataFrame.
+            filters: A list of functions returned by criteria_compiler(), in the order they are applied.
+
+        Returns:
+            edge_data: A filtered Pandas DataFrame, which may be empty.
+        """
+
+        for filters_data in filters:
+            edge_data = filters_data(edge_data)
+
+        return edge_data
+
     def filter_data(self, edge_data: pandas.DataFrame, filter_criteria: str, evidence_criteria: str) -> \
             pandas.DataFrame:
         """Applies a set of filtering and/or evidence criteria to specific columns in a Pandas DataFrame and returns a
@@ -180,41 +446,8 @@ class CreatesEdgeList(object):
         if filter_criteria == 'None' and evidence_criteria == 'None':
             return edge_data
         else:
-            # fix known errors when filtering empty cells
-            map_filter_criteria = self.filter_fixer(filter_criteria) + '::' + self.filter_fixer(evidence_criteria)
-
-            for crit in [x for x in map_filter_criteria.split('::') if x != 'None']:
-                # check if argument is to deduplicate data
-                if crit.split(';')[1] == 'dedup':
-                    sort_col = list(edge_data)[int(crit.split(';')[0].split('-')[0])]
-                    filter_col = list(edge_data)[int(crit.split(';')[0].split('-')[1])]
-
-                    # sort data
-                    sort_dir = [True if crit.split(';')[-1].lower() == 'asc' else False][0]
-                    edge_data.sort_values(sort_col, ascending=sort_dir, inplace=True)
-                    edge_data.drop_duplicates(subset=filter_col, keep='first', inplace=True)
-                else:
-                    col = list(edge_data)[int(crit.split(';')[0])]
-                    try:
-                        if type(float(crit.split(';')[2])) is float or type(int(crit.split(';')[2])) is int:
-                            edge_data[col] = edge_data[col].apply(lambda x: 0 if x == 'None' else x)
-
-                            if type(float(crit.split(';')[2])) is float:
-                                edge_data[col] = edge_data[col].astype(float)
-                            else:
-                                edge_data[col] = edge_data[col].astype(int)
-
-                            exp = '{} {} {}'.format('x', crit.split(';')[1], crit.split(';')[2])
-
-                    except ValueError:
-                        if crit.split(';')[2] == '' and '(' in crit.split(';')[1]:
-                            exp = '{}{}'.format('x', crit.split(';')[1])
-                        elif '(' in crit.split(';')[2] or '[' in crit.split(';')[2]:
-                            exp = '{} {} {}'.format('x', crit.split(';')[1], crit.split(';')[2].replace("'", ''))
-                        else:
-                            exp = '{} {} "{}"'.format('x', crit.split(';')[1], crit.split(';')[2].replace("'", ''))
-
-                    edge_data = edge_data.loc[edge_data[col].apply(lambda x: eval(exp))]
+            criteria = self.filter_splitter(filter_criteria, evidence_criteria)
+            edge_data = self.criteria_filter(edge_data, [self.criteria_compiler(x) for x in criteria])
 
             if len(list(edge_data)) >= 2 and len(edge_data) >= 1:
                 return edge_data
@@ -282,7 +515,8 @@ class CreatesEdgeList(object):
 
         This function assumes that the mapping data pointed to contains two columns: (1) identifier in edge_data to be
         mapped and (2) the desired identifier to map to. If one of the columns does not need to be mapped to an
-        identifier then the original node's column is used for the final merge.
+        identifier then the original node's column is used for the final merge. Mapping a column is an inner join: a
+        row is repeated once for each identifier its node maps to and is removed if its node is not in the mapping data.
 
         Args:
             node: A column integer.
@@ -302,21 +536,18 @@ class CreatesEdgeList(object):
             node2map = list(edge_data)[node]
 
             try:
-                map_data = self.data_reader(mapping_data.split(';')[node].split(':')[1]).astype(str)
+                lookup = self.mapping_cache.loads_mapping_data(mapping_data.split(';')[node].split(':')[1])
             except IndexError:
-                map_data = self.data_reader(mapping_data.split(';')[0].split(':')[1]).astype(str)
+                lookup = self.mapping_cache.loads_mapping_data(mapping_data.split(';')[0].split(':')[1])
 
-            # process mapping data
-            map_col = list(map_data)[0]
-            col_to_map = str(node2map) + '_' + str(map_col) + '_mapped'
-            map_data.rename(columns={list(map_data)[1]: str(col_to_map)}, inplace=True)
+            # update edge_data merge col type to match the mapping data identifiers, which are strings
+            if edge_data[node2map].dtype != object:
+                edge_data[node2map] = edge_data[node2map].astype(str)
 
-            try:
-                merged_data = pandas.merge(edge_data, map_data, left_on=node2map, right_on=map_col, how='inner')
-            except ValueError:
-                # update map_data merge col to match edge_data merge col type
-                edge_data[node2map], map_data[map_col] = edge_data[node2map].astype(str), map_data[map_col].astype(str)
-                merged_data = pandas.merge(edge_data, map_data, left_on=node2map, right_on=map_col, how='inner')
+            # look up each identifier and add a row for each identifier it maps to (without modifying the cached data)
+            col_to_map = str(node2map) + '_mapped'
+            rows, mapped_ids = lookup.maps(edge_data[node2map])
+            merged_data = edge_data.iloc[rows].assign(**{col_to_map: mapped_ids})
 
             # drop all columns but merge key and value columns
             merged_data = merged_data[[list(edge_data)[0], list(edge_data)[1], col_to_map]]
@@ -362,11 +593,235 @@ class CreatesEdgeList(object):
 
             return tuple(zip(list(merged_data[maps[0][0]]), list(merged_data[maps[1][0]])))
 
+    def data_chunk_processor(self, edge_types: List[str]) -> Tuple[Dict[str, pandas.DataFrame], int]:
+        """Reads, filters, reduces, and formats the data for one or more edge types which share a data source (i.e.
+        steps 1-4 of creates_edge_lists()) chunk_size rows at a time, so that only the filtered data is held in memory.
+        Each chunk is read once and a copy of it is filtered for each edge type.
+
+        Each chunk is filtered by the criteria that come before the first deduplication criteria (which must see every
+        row) or the first numeric criteria which may compare its column differently than when the data is read in full,
+        and, when every criteria is applied to the chunks, reduced to its two node columns. The chunks are then
+        concatenated, the remaining criteria are applied, and the result is reduced and then formatted. The labels are
+        formatted after the chunks are concatenated because label_formatter() chooses how to format a column from all
+        of its values.
+
+        Args:
+            edge_types: A list of edge types whose data is read from the same source (see groups_edge_types()).
+
+        Returns:
+            A tuple containing a dictionary mapping each edge type to a Pandas DataFrame of its formatted edge data,
+            which has two columns, and an integer containing the number of rows read from the edge source.
+
+        Raises:
+            ValueError: If the data does not contain at least 2 columns and more than 10 rows.
+            Exception: If no rows pass the filtering and/or evidence criteria of an edge type.
+        """
+
+        criteria, filters, splits, chunks = dict(), dict(), dict(), dict()  # type: Dict, Dict, Dict, Dict
+        columns: List[int] = []
+        for edge_type in edge_types:
+            info = self.source_info[edge_type]
+            criteria[edge_type] = self.filter_splitter(info['filter_criteria'], info['evidence_criteria'])
+            chunks[edge_type] = []
+            columns += [int(x) for x in info['column_idx'].split(';')[:2]]
+            columns += [int(col) for x in criteria[edge_type] for col in x.split(';')[0].split('-')]
+
+        # the types of the columns are found before the first chunk is returned
+        numeric: Dict[int, bool] = dict()
+        chunk_size = self.chunk_size if self.chunk_size is not None else 100000
+        reader = self.data_chunk_reader(self.data_files[edge_types[0]], self.source_info[edge_types[0]]['delimiter'],
+                                        chunk_size, columns, numeric)
+        first_chunk = next(reader, None)
+
+        # a numeric criteria compares a column as numbers when every value that reaches it can be converted to a
+        # number, which is only known from the entire column for the first criteria or when every value of the column
+        # is a number - any other numeric criteria must be applied after the chunks are concatenated
+        for edge_type in edge_types:
+            splits[edge_type] = len(criteria[edge_type])
+            for i, crit in enumerate(criteria[edge_type]):
+                items = crit.split(';')
+                if items[1] != 'dedup':
+                    try:
+                        float(items[2])
+                    except ValueError:
+                        continue
+                    if i == 0 or numeric.get(int(items[0]), True): continue
+                splits[edge_type] = i
+                break
+            filters[edge_type] = [self.criteria_compiler(x, numeric.get(int(x.split(';')[0]))
+                                                         if i < splits[edge_type] and x.split(';')[1] != 'dedup'
+                                                         else None) for i, x in enumerate(criteria[edge_type])]
+
+        rows = 0
+        for edge_data in itertools.chain([first_chunk] if first_chunk is not None else [], reader):
+            rows += len(edge_data)
+            for edge_type in edge_types:
+                # the last edge type filters the chunk itself, as the criteria can modify the data they filter
+                chunk = edge_data if edge_type == edge_types[-1] else edge_data.copy()
+                chunk = self.criteria_filter(chunk, filters[edge_type][:splits[edge_type]])
+                if splits[edge_type] == len(criteria[edge_type]):
+                    chunk = self.data_reducer(self.source_info[edge_type]['column_idx'], chunk)
+                chunks[edge_type].append(chunk)
+        if rows <= 10: raise ValueError('ERROR: Data could not be properly read in')
+
+        formatted_data = dict()
+        for edge_type in edge_types:
+            info, split = self.source_info[edge_type], splits[edge_type]
+            edge_data = pandas.concat(chunks.pop(edge_type), ignore_index=True)
+
+            edge_data = self.criteria_filter(edge_data, filters[edge_type][split:])
+            if len(edge_data) < 1: raise Exception('ERROR: Data could not be properly read in')
+            if split < len(criteria[edge_type]): edge_data = self.data_reducer(info['column_idx'], edge_data)
+            else: edge_data = edge_data.drop_duplicates(subset=None, keep='first', inplace=False)
+            formatted_data[edge_type] = self.label_formatter(edge_data, info['source_labels'])
+
+        return formatted_data, rows
+
+    def groups_edge_types(self) -> List[List[str]]:
+        """Groups the edge types whose data is read from the same source, so that each source is only read once. Edge
+        types share a source when their data files have the same delimiter and are the same file (e.g. the hard links
+        created by LinkedData) or have the same contents (e.g. copies of CTD_chem_gene_ixns.tsv downloaded for the
+        chemical-gene, chemical-protein, and chemical-rna edge types). Files are only hashed when another data file
+        has the same size.
+
+        Returns:
+            A list of lists of edge types, in the order of source_info. For example: [['chemical-gene',
+            'chemical-protein', 'chemical-rna'], ['gene-disease'], ...].
+        """
+
+        stats = {x: os.stat(self.data_files[x]) if os.path.exists(self.data_files[x]) else None
+                 for x in self.source_info.keys()}
+        sizes = Counter(x.st_size for x in stats.values() if x is not None)
+
+        groups: Dict[Tuple, List[str]] = dict()
+        hashes: Dict[Tuple, str] = dict()
+        source: Union[str, Tuple[int, int]]  # the filepath, the file's device and inode, or the hash of its contents
+        for edge_type, stat in stats.items():
+            if stat is None: source = self.data_files[edge_type]
+            elif sizes[stat.st_size] == 1: source = (stat.st_dev, stat.st_ino)
+            else:
+                if (stat.st_dev, stat.st_ino) not in hashes:
+                    hashes[(stat.st_dev, stat.st_ino)] = hashes_file(self.data_files[edge_type])
+                source = hashes[(stat.st_dev, stat.st_ino)]
+            groups.setdefault((source, self.source_info[edge_type]['delimiter']), []).append(edge_type)
+
+        return list(groups.values())
+
+    def creates_edge_lists(self, edge_types: List[str], telemetry: BuildTelemetry) -> Dict[str, List[Tuple]]:
+        """Creates the edge lists for one or more edge types which share a data source (see groups_edge_types()) in
+        six steps: (1) read in data; (2) apply filtering and evidence criteria; (3) reduce data to specific columns,
+        remove duplicates, and ensure proper formatting of column data; (4) update node column values; (5) rename
+        nodes; and (6) map identifiers. The data is only read once (step 1) and steps 2-6 are applied to a copy of it
+        for each edge type. The time taken to read the data is recorded with the first edge type.
+
+        Args:
+            edge_types: A list of edge types whose data is read from the same source (e.g. ['chemical-gene',
+                'chemical-protein']).
+            telemetry: A BuildTelemetry object used to record the time and memory used to create each edge list.
+
+        Returns:
+            A dictionary mapping each edge type to its edge list. For example: {'chemical-gene': [('CHEBI_24505',
+            'R-HSA-1006173'), ...], ...}.
+        """
+
+        shared_data: Any = None
+        rows, edge_lists = 0, dict()
+
+        for edge_type in edge_types:
+            print('\n\n### Processing Edge: {}'.format(edge_type))
+
+            with telemetry.records_stage('creates_edge_list', edge_type) as record:
+                if self.chunk_size is not None:
+                    # STEPS 1-4: read, filter, reduce, and format the data one chunk at a time
+                    if shared_data is None:
+                        print('*** Reading, Filtering, and Reformatting Edge Data in Chunks ***')
+                        shared_data, rows = self.data_chunk_processor(edge_types)
+                    edge_data = shared_data.pop(edge_type)
+                else:
+                    # STEP 1: read in data
+                    if shared_data is None:
+                        print('*** Reading Edge Data ***')
+                        shared_data = self.data_reader(self.data_files[edge_type],
+                                                       self.source_info[edge_type]['delimiter'])
+                        rows = len(shared_data)
+                    # the last edge type uses the data itself, as the criteria can modify the data they filter
+                    edge_data = shared_data if edge_type == edge_types[-1] else shared_data.copy()
+
+                    # STEP 2: apply filtering and evidence criteria
+                    print('*** Applying Filtering and/or Mapping Criteria to Edge Data ***')
+                    edge_data = self.filter_data(edge_data,
+                                                 self.source_info[edge_type]['filter_criteria'],
+                                                 self.source_info[edge_type]['evidence_criteria'])
+
+                    # STEP 3: reduce data to specific columns, remove duplicates, and ensure proper formatting of columns
+                    edge_data = self.data_reducer(self.source_info[edge_type]['column_idx'], edge_data)
+
+                    # STEP 4: update node column values
+                    print('*** Reformatting Node Values ***')
+                    edge_data = self.label_formatter(edge_data, self.source_info[edge_type]['source_labels'])
+                record['items'] = rows
+
+                # STEP 5: rename nodes
+                edge_data.rename(columns={list(edge_data)[0]: str(list(edge_data)[0]) + '-' + edge_type.split('-')[0],
+                                          list(edge_data)[1]: str(list(edge_data)[1]) + '-' + edge_type.split('-')[1]},
+                                 inplace=True)
+
+                # STEP 6: map identifiers
+                print('*** Performing Identifier Mapping ***')
+                mapped_data = self.process_mapping_data(self.source_info[edge_type]['identifier_maps'], edge_data)
+
+                edge_lists[edge_type] = [edge for edge in mapped_data if 'None' not in edge]
+                record['edges'] = len(edge_lists[edge_type])
+
+        return edge_lists
+
+    def prints_edge_list_statistics(self, edge_type: str) -> None:
+        """Prints the number of unique edges and nodes in an edge type's edge list.
+
+        Args:
+            edge_type: A string containing the edge type (e.g. 'chemical-gene').
+
+        Returns:
+            None.
+        """
+
+        unique_edges = [list(y) for y in set([tuple(x) for x in self.source_info[edge_type]['edge_list']])]
+        print('\nPROCESSED EDGE: {}'.format(edge_type))
+        print('Total Unique Edge Count: {}'.format(len(unique_edges)))
+        print('{}: Unique Node Count = {}'.format(edge_type.split('-')[0], len(set([x[0] for x in unique_edges]))))
+        print('{}: Unique Node Count = {}'.format(edge_type.split('-')[1], len(set([x[1] for x in unique_edges]))))
+
+        return None
+
+    def estimates_edge_list_memory(self, edge_types: List[str]) -> float:
+        """Estimates the peak memory used to create the edge lists of a group of edge types which share a data source
+        as memory_factor times the size of the data file and of their identifier mapping files (or of a single chunk of
+        the data file when it is read in chunks). The estimate is only used to decide how many groups of edge types can
+        be processed at the same time.
+
+        Args:
+            edge_types: A list of edge types whose data is read from the same source (see groups_edge_types()).
+
+        Returns:
+            A float containing the estimated memory in megabytes.
+        """
+
+        data_file = self.data_files[edge_types[0]]
+        data_size = os.path.getsize(data_file) if os.path.exists(data_file) else 0
+        if self.chunk_size is not None: data_size = min(data_size, self.chunk_size * 1024)
+        mapping_data = [self.source_info[x]['identifier_maps'] for x in edge_types]
+        mapping_files = set(x.split(':', 1)[1] for maps in mapping_data if maps != 'None'
+                            for x in maps.split(';') if ':' in x)
+        mapping_size = sum(os.path.getsize(x) for x in mapping_files if os.path.exists(x))
+
+        return memory_factor * (data_size + mapping_size) / (1024 * 1024)
+
     def creates_knowledge_graph_edges(self) -> None:
         """Generates edge lists for each edge type in an input dictionary. In order to generate the edge list,
         the function performs six steps: (1) read in data; (2) apply filtering and evidence criteria; (3) reduce data
         to specific columns, remove duplicates, and ensure proper formatting of column data; (4) update node column
-        values; (5) rename nodes; and (6) map identifiers.
+        values; (5) rename nodes; and (6) map identifiers. The edge types which share a data source are processed
+        together, so that each source is only read once (see creates_edge_lists()).
 
         Returns:
             source_info: A dictionary that contains all of the master information for each edge type resource. For
@@ -384,48 +839,57 @@ class CreatesEdgeList(object):
                         }
         """
 
-        for edge_type in tqdm(self.source_info.keys()):
-            print('\n\n### Processing Edge: {}'.format(edge_type))
-
-            # STEP 1: read in data
-            print('*** Reading Edge Data ***')
-            edge_data = self.data_reader(self.data_files[edge_type],
-                                         self.source_info[edge_type]['delimiter'])
-
-            # STEP 2: apply filtering and evidence criteria
-            print('*** Applying Filtering and/or Mapping Criteria to Edge Data ***')
-            edge_data = self.filter_data(edge_data,
-                                         self.source_info[edge_type]['filter_criteria'],
-                                         self.source_info[edge_type]['evidence_criteria'])
-
-            # STEP 3: reduce data to specific columns, remove duplicates, and ensure proper formatting of column data
-            edge_data = self.data_reducer(self.source_info[edge_type]['column_idx'], edge_data)
-
-            # STEP 4: update node column values
-            print('*** Reformatting Node Values ***')
-            edge_data = self.label_formatter(edge_data, self.source_info[edge_type]['source_labels'])
-
-            # STEP 5: rename nodes
-            edge_data.rename(columns={list(edge_data)[0]: str(list(edge_data)[0]) + '-' + edge_type.split('-')[0],
-                                      list(edge_data)[1]: str(list(edge_data)[1]) + '-' + edge_type.split('-')[1]},
-                             inplace=True)
-
-            # STEP 6: map identifiers
-            print('*** Performing Identifier Mapping ***')
-            mapped_data = self.process_mapping_data(self.source_info[edge_type]['identifier_maps'],
-                                                    edge_data)
-
-            self.source_info[edge_type]['edge_list'] = [edge for edge in mapped_data if 'None' not in edge]
+        groups = self.groups_edge_types()
+
+        if self.cpus > 1 and len(groups) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            processes = min(self.cpus, len(groups))
+            estimates = [self.estimates_edge_list_memory(x) for x in groups]
+            budget = self.memory_mb if self.memory_mb is not None else float('inf')
+            print('\n*** Creating Edge Lists Using {} Processes ***'.format(processes))
+
+            # start the largest groups first - a group only starts while the estimated memory of the running groups
+            # fits the memory budget, unless no other group is running. A worker which dies (e.g. killed for running
+            # out of memory) breaks the executor, so BrokenProcessPool is raised instead of waiting for it forever
+            pending, running = sorted(range(len(groups)), key=lambda x: -estimates[x]), dict()  # type: List, Dict
+            # workers are forked, so they inherit this object without it being pickled (mp_context needs Python 3.7)
+            global edge_list_worker_state
+            edge_list_worker_state = self
+            if sys.version_info < (3, 7): executor = ProcessPoolExecutor(processes)
+            else: executor = ProcessPoolExecutor(processes, multiprocessing.get_context('fork'))
+            try:
+                while pending or running:
+                    while pending and len(running) < processes:
+                        used = sum(estimates[x] for x in running.values())
+                        fits = [x for x in pending if used + estimates[x] <= budget]
+                        if not fits and running: break
+                        group = fits[0] if fits else pending[0]
+                        pending.remove(group)
+                        running[executor.submit(creates_edge_list_worker, groups[group])] = group
+
+                    done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        group = running.pop(future)
+                        edge_lists, records = future.result()
+                        self.telemetry.records += records
+                        for edge_type in groups[group]:
+                            self.source_info[edge_type]['edge_list'] = edge_lists[edge_type]
+                            self.prints_edge_list_statistics(edge_type)
+            finally:
+                for future in running: future.cancel()
+                executor.shutdown(wait=True)
+                edge_list_worker_state = None
+        else:
+            for edge_types in tqdm(groups):
+                edge_lists = self.creates_edge_lists(edge_types, self.telemetry)
+                for edge_type in edge_types:
+                    self.source_info[edge_type]['edge_list'] = edge_lists[edge_type]
+                    self.prints_edge_list_statistics(edge_type)
 
-            # print edge statistics
-            unique_edges = [list(y) for y in set([tuple(x) for x in self.source_info[edge_type]['edge_list']])]
-            print('\nPROCESSED EDGE: {}'.format(edge_type))
-            print('Total Unique Edge Count: {}'.format(len(unique_edges)))
-            print('{}: Unique Node Count = {}'.format(edge_type.split('-')[0], len(set([x[0] for x in unique_edges]))))
-            print('{}: Unique Node Count = {}'.format(edge_type.split('-')[1], len(set([x[1] for x in unique_edges]))))
+        self.mapping_cache.clears()
 
         # save a copy of the final master edge list
         with open('/'.join(self.source_file.split('/')[:-1]) + '/Master_Edge_List_Dict.json', 'w') as filepath:
             json.dump(self.source_info, filepath)
+        self.telemetry.writes_report('/'.join(self.source_file.split('/')[:-1]) + '/Master_Edge_List_Telemetry.json')
 
         return None
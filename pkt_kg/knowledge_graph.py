@@ -2,10 +2,11 @@
 # -*- coding: utf-8 -*-
 
 # import needed libraries
-import copy
+import gc
 import glob
+import importlib.util
 import json
-import networkx  # type: ignore
+import multiprocessing
 import os
 import os.path
 import pandas  # type: ignore
@@ -16,7 +17,7 @@ from abc import ABCMeta, abstractmethod
 from rdflib import Graph, Namespace, URIRef, BNode  # type: ignore
 from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
-from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple, Type
 
 from pkt_kg.construction_approaches import KGConstructionApproach
 from pkt_kg.metadata import Metadata
@@ -25,6 +26,79 @@ from pkt_kg.utils import *
 
 # set global attributes
 obo = Namespace('http://purl.obolibrary.org/obo/')
+edge_worker_state: Optional[Tuple] = None  # (KGBuilder, KGConstructionApproach) inherited by each forked worker
+variant_build_state: Dict = dict()  # inputs loaded once and inherited by each forked knowledge graph variant build
+output_worker_state: Optional[Tuple] = None  # (KGBuilder, encoded triples) inherited by each forked output writer
+
+
+def initializes_edge_worker(kg: Any, edge_builder: KGConstructionApproach) -> None:
+    """Stores the objects needed to construct edges in a worker process. Used as the initializer of the process pool
+    created by KGBuilder.creates_knowledge_graph_edges(). Workers are forked, so the objects are not copied until
+    they are written to.
+
+    Args:
+        kg: A KGBuilder object.
+        edge_builder: A KGConstructionApproach object.
+
+    Returns:
+        None.
+    """
+
+    global edge_worker_state
+    edge_worker_state = (kg, edge_builder)
+
+    return None
+
+
+def creates_edge_chunk_worker(task: Tuple) -> Tuple:
+    """Constructs the edges for a chunk of an edge type's edge list in a worker process.
+
+    Args:
+        task: A tuple containing an edge type, a list of edges, and an inverse relation (or None).
+
+    Returns:
+        A tuple containing the edge type and the output of KGBuilder.creates_edge_chunk().
+    """
+
+    kg, edge_builder = edge_worker_state  # type: ignore
+    edge_type, edge_list, invrel = task
+
+    return (edge_type,) + kg.creates_edge_chunk(edge_builder, edge_type, edge_list, invrel, False)
+
+
+def initializes_output_worker(kg: Any, encodings: Dict) -> None:
+    """Stores the objects needed to write output files in a worker process. Used as the initializer of the process
+    pool created by KGBuilder.writes_output_files(). Workers are forked, so the encoded triples are not copied.
+
+    Args:
+        kg: A KGBuilder object.
+        encodings: A dict of encoded triples (see KGBuilder.writes_output_file()).
+
+    Returns:
+        None.
+    """
+
+    global output_worker_state
+    output_worker_state = (kg, encodings)
+
+    return None
+
+
+def writes_output_file_worker(writer: str) -> List[Dict]:
+    """Runs a single output file writer in a worker process.
+
+    Args:
+        writer: A string containing the name of the writer (see KGBuilder.writes_output_file()).
+
+    Returns:
+        A list of the telemetry records created by the writer.
+    """
+
+    kg, encodings = output_worker_state  # type: ignore
+    telemetry = BuildTelemetry()
+    kg.writes_output_file(writer, encodings, telemetry)
+
+    return telemetry.records
 
 
 class KGBuilder(object):
@@ -50,6 +124,8 @@ class KGBuilder(object):
              'column_idx': '0;1', 'identifier_maps': 'None', 'evidence_criteria': 'None', 'filter_criteria': 'None',
              'edge_list': [['CHEBI_24505', 'R-HSA-1006173'], ...] }, }
         graph: An rdflib graph object which stores the knowledge graph.
+        graph_file: A string containing the filepath of the .owl file written by the most recent build stage that was
+            skipped because it was cached. The file is only read into graph once a later stage needs it.
         inverse_relations: A filepath to a directory called 'relations_data' containing the relations data.
         inverse_relations_dict: A dict storing relations ids and their inverse relation ids. For example:
             {'RO_0000056': 'RO_0000057', 'RO_0000079': 'RO_0000085'}
@@ -59,7 +135,9 @@ class KGBuilder(object):
                 {'6469': {'Label': 'SHH', 'Description': 'Sonic Hedgehog Signaling Molecule is a protein-coding gene
                  located on chromosome 7 (map_location: 7q36.3).', 'Synonym': 'HHG1|HLP3|HPE3|ShhNC|TPT'}}
         kg_metadata: A flag that indicates whether or not to add metadata to the knowledge graph.
-        ont_classes: A list of all ontology classes in a graph.
+        ont_classes: A set of all ontology classes in the merged ontologies graph, used to verify edges.
+        obj_properties: A set of all object properties in the knowledge graph, which is updated as new relations
+            are added to the knowledge graph.
         owl_tools: A string pointing to the location of the owl tools library.
         relations_dict: A dict storing the relation identifiers and labels. For example,
             {'RO_0002616': 'related via evidence or inference to', 'RO_0002442': 'mutualistically interacts with}
@@ -72,6 +150,23 @@ class KGBuilder(object):
         decode_owl: A string indicating whether edges containing owl semantics should be removed.
         full_kg: A string containing the filename for the full knowledge graph.
         nx_mdg: A networkx MultiDiGraph object which is only created if the user requests owl semantics be removed.
+        stage_cache: A StageCache object which checkpoints each build stage so that stages whose inputs are unchanged
+            are skipped when a build is re-run.
+        cpus: An integer specifying the number of processes used to construct the knowledge graph edges and to
+            write the knowledge graph output files.
+        storage: A string indicating where graph triples are stored while the knowledge graph is built (i.e. "memory"
+            or "sqlite").
+        triple_store: A string containing the filepath of the sqlite database used when storage is "sqlite".
+        telemetry: A BuildTelemetry object which records the wall time, cpu time, peak memory, and throughput of each
+            build stage and edge type. The records are written to a json report alongside the knowledge graph.
+        ntriples: A string containing the extension of the N-Triples file the knowledge graph is streamed to while its
+            edges are constructed (i.e. ".nt" or ".nt.gz") or None if no N-Triples file is written.
+        rdf_xml: A bool indicating whether or not the knowledge graph is serialized to an RDF/XML (.owl) file once its
+            edges have been constructed.
+        parquet: A bool indicating whether or not the triple lists and node metadata are also written to Parquet
+            files, whose identifier columns are dictionary-encoded.
+        previous_map: A string containing the filepath of the identifier-integer map (.json or .npz) of a previous
+            build, whose integers are kept for the nodes that are still in the knowledge graph, or None.
 
     Raises:
         ValueError: If the formatting of kg_version is incorrect (i.e. not "v.#.#.#").
@@ -79,21 +174,36 @@ class KGBuilder(object):
         OSError: If the ontologies, edge_data, subclass_dict files don't not exist.
         TypeError: If the edge_data and subclass_dict files contains no data.
         TypeError: If the relations_data, node_data, ontologies directories do not contain any data.
-        TypeError: If construction, inverse_relations, node_data, and decode_owl are not strings.
-        ValueError: If relations_data, node_data and decode_owl_semantics do not contain "yes" or "no".
+        TypeError: If construction, inverse_relations, node_data, decode_owl, and cache are not strings.
+        ValueError: If relations_data, node_data, decode_owl_semantics, and cache do not contain "yes" or "no".
         ValueError: If construction does not contain "instance" or "subclass".
+        TypeError: If cpus is not an integer.
+        ValueError: If cpus is less than 1.
+        TypeError: If storage is not a string.
+        ValueError: If storage does not contain "memory" or "sqlite".
+        TypeError: If ntriples or rdf_xml are not strings.
+        ValueError: If ntriples does not contain "yes", "no", or "gzip" or rdf_xml does not contain "yes" or "no".
+        ValueError: If rdf_xml is "no" and ntriples is not "yes" or "gzip".
+        TypeError: If parquet is not a string.
+        ValueError: If parquet does not contain "yes" or "no".
+        ImportError: If parquet is "yes" and pyarrow is not installed.
+        OSError: If the previous_map file does not exist.
     """
 
     __metaclass__ = ABCMeta
 
     def __init__(self, kg_version: str, write_location: str, construction: str, edge_data: str, kg_metadata_flag: str,
                  node_data: Optional[str] = None, inverse_relations: Optional[str] = None, decode_owl: Optional[str]
-                 = None) -> None:
+                 = None, cache: Optional[str] = None, storage: Optional[str] = None,
+                 cpus: int = 1, telemetry: Optional[BuildTelemetry] = None, ntriples: Optional[str] = None,
+                 rdf_xml: Optional[str] = None, parquet: Optional[str] = None,
+                 previous_map: Optional[str] = None) -> None:
 
         self.build: str = self.gets_build_type().lower().split()[0]
         self.decode_owl: Optional[str] = None
         self.edge_dict: Dict = dict()
         self.graph: Graph = Graph()
+        self.graph_file: Optional[str] = None
         self.inverse_relations: Optional[List] = None
         self.inverse_relations_dict: Optional[Dict] = None
         self.node_data: Optional[List] = None
@@ -103,6 +213,7 @@ class KGBuilder(object):
         self.obj_properties: Set = set()
         self.owl_tools = './pkt_kg/libs/owltools'
         self.relations_dict: Dict = dict()
+        self.telemetry = telemetry if telemetry is not None else BuildTelemetry()
 
         # BUILD TYPE
         if kg_version is None:
@@ -147,8 +258,12 @@ class KGBuilder(object):
         elif os.stat(edge_data).st_size == 0:
             raise TypeError('The input file: {} is empty'.format(edge_data))
         else:
-            with open(edge_data, 'r') as edge_filepath:
-                self.edge_dict = json.load(edge_filepath)
+            self.edge_data = edge_data
+            if variant_build_state.get('edge_dict', (None,))[0] == edge_data:  # see builds_knowledge_graph_variants()
+                self.edge_dict = variant_build_state['edge_dict'][1]
+            else:
+                with open(edge_data, 'r') as edge_filepath:
+                    self.edge_dict = json.load(edge_filepath)
 
         # RELATIONS DATA
         if inverse_relations and not isinstance(inverse_relations, str):
@@ -197,6 +312,62 @@ class KGBuilder(object):
                 self.full_kg = kg_node + 'OWLSemantics_KG.owl'
                 self.decode_owl = None
 
+        # STAGE CACHE
+        if cache and not isinstance(cache, str):
+            raise TypeError('cache must be type string')
+        elif cache and cache.lower() not in ['yes', 'no']:
+            raise ValueError('cache must be "no" or "yes"')
+        else:
+            cache_file = self.write_location + self.full_kg[:-4] + '_StageCache.json'
+            self.stage_cache = StageCache(cache_file, enabled=cache is not None and cache.lower() == 'yes')
+
+        # TRIPLE STORAGE
+        if storage and not isinstance(storage, str):
+            raise TypeError('storage must be type string')
+        elif storage and storage.lower() not in ['memory', 'sqlite']:
+            raise ValueError('storage must be "memory" or "sqlite"')
+        else:
+            self.storage: str = storage.lower() if storage else 'memory'
+            self.triple_store: str = self.write_location + self.full_kg[:-4] + '_TripleStore.db'
+
+        # PARALLEL EDGE CONSTRUCTION
+        if not isinstance(cpus, int):
+            raise TypeError('cpus must be type integer')
+        elif cpus < 1:
+            raise ValueError('cpus must be a positive integer')
+        else:
+            self.cpus = cpus
+
+        # KNOWLEDGE GRAPH OUTPUT FORMATS
+        if (ntriples and not isinstance(ntriples, str)) or (rdf_xml and not isinstance(rdf_xml, str)):
+            raise TypeError('ntriples and rdf_xml must be type string')
+        elif ntriples and ntriples.lower() not in ['yes', 'no', 'gzip']:
+            raise ValueError('ntriples must be "no", "yes", or "gzip"')
+        elif rdf_xml and rdf_xml.lower() not in ['yes', 'no']:
+            raise ValueError('rdf_xml must be "no" or "yes"')
+        elif rdf_xml and rdf_xml.lower() == 'no' and (not ntriples or ntriples.lower() == 'no'):
+            raise ValueError('rdf_xml can only be "no" when ntriples is "yes" or "gzip"')
+        else:
+            if ntriples and ntriples.lower() != 'no':
+                self.ntriples: Optional[str] = '.nt.gz' if ntriples.lower() == 'gzip' else '.nt'
+            else:
+                self.ntriples = None
+            self.rdf_xml: bool = rdf_xml is None or rdf_xml.lower() == 'yes'
+        if parquet and not isinstance(parquet, str):
+            raise TypeError('parquet must be type string')
+        elif parquet and parquet.lower() not in ['yes', 'no']:
+            raise ValueError('parquet must be "no" or "yes"')
+        elif parquet and parquet.lower() == 'yes' and importlib.util.find_spec('pyarrow') is None:
+            raise ImportError('parquet requires pyarrow to be installed (e.g. pip install pyarrow)')
+        else:
+            self.parquet: bool = parquet is not None and parquet.lower() == 'yes'
+
+        # STABLE NODE INTEGERS
+        if previous_map and not os.path.exists(previous_map):
+            raise OSError('The {} file does not exist!'.format(previous_map))
+        else:
+            self.previous_map: Optional[str] = previous_map if previous_map else None
+
     def sets_up_environment(self) -> None:
         """Sets-up the environment by checking for the existence and/or creating the following directories:
             - 'knowledge_graphs' directory in the `resources` directory
@@ -243,7 +414,8 @@ class KGBuilder(object):
 
     def verifies_object_property(self, object_property: URIRef) -> None:
         """Takes a string that contains an object property, representing a relation between two nodes, and adds it to
-        the knowledge graph.
+        the knowledge graph. The object property is also added to obj_properties, the index of the object properties in
+        the knowledge graph, so that the graph does not need to be re-queried each time a new relation is added.
 
         Args:
             object_property: A string containing an obo ontology object property.
@@ -260,7 +432,7 @@ class KGBuilder(object):
         else:
             if object_property not in self.obj_properties:
                 self.graph.add((object_property, RDF.type, OWL.ObjectProperty))
-                self.obj_properties = gets_object_properties(self.graph)  # refresh list of object properties
+                self.obj_properties.add(object_property)
             else:
                 pass
 
@@ -291,6 +463,53 @@ class KGBuilder(object):
 
         return class_found
 
+    def prints_edge_type_statistics(self, edge_type: str, triple_count: int, invrel: Optional[str]) -> None:
+        """Prints the number of edges and unique nodes added to the knowledge graph for an edge type.
+
+        Args:
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            triple_count: An integer containing the number of unique triples added to the knowledge graph for the
+                edge type.
+            invrel: A string containing the inverse relation for the edge type or None.
+
+        Returns:
+            None.
+        """
+
+        n1, n2, edges = edge_type.split('-')[0], edge_type.split('-')[1], self.edge_dict[edge_type]['edge_list']
+        print('Total OWL Edges: {}'.format(triple_count))
+        print('Unique Non-OWL Edges: {}'.format(len(edges) * 2 if invrel else len(edges)))
+        print('Unique {}: {}'.format(n1, len(set([x[0] for x in edges]))))
+        print('Unique {}: {}'.format(n2, len(set([x[1] for x in edges]))))
+
+        return None
+
+    def completes_edge_type(self, edge_type: str, edge_type_cache: EdgeTypeCache, key: str, edge_results: List,
+                            kept_edges: List, errors: List, invrel: Optional[str]) -> int:
+        """Updates an edge type's edge list once all of its edges have been constructed, records the triples it added
+        to the knowledge graph in the edge type cache, and prints its statistics.
+
+        Args:
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            edge_type_cache: An EdgeTypeCache object.
+            key: A string containing the key of the edge type's edge_dict entry.
+            edge_results: A list of the triples added to the knowledge graph for the edge type.
+            kept_edges: A list of the edge type's edges that were not rejected.
+            errors: A list of the edge type's nodes that could not be mapped to the subclass_dict.
+            invrel: A string containing the inverse relation for the edge type or None.
+
+        Returns:
+            An integer containing the number of unique triples added to the knowledge graph for the edge type.
+        """
+
+        triples, edge_list = set(edge_results), self.edge_dict[edge_type]['edge_list']
+        rejected_edges = set(map(tuple, edge_list)) - set(map(tuple, kept_edges)) if edge_list != kept_edges else set()
+        self.edge_dict[edge_type]['edge_list'] = kept_edges
+        edge_type_cache.records_edge_type(edge_type, key, triples, rejected_edges, errors)
+        self.prints_edge_type_statistics(edge_type, len(triples), invrel)
+
+        return len(triples)
+
     def checks_for_inverse_relations(self, relation: str, edge_list: List[List[str]]) -> Optional[str]:
         """Checks a relation to determine whether or not edges for an inverse relation should be created and added to
         the knowledge graph. The function also verifies that input relation and its inverse (if it exists) are both an
@@ -324,11 +543,70 @@ class KGBuilder(object):
 
         return inverse_relation
 
+    def creates_edge_chunk(self, edge_builder: KGConstructionApproach, edge_type: str, edge_list: List,
+                           invrel: Optional[str], progress: bool = True) -> Tuple[List, List, List]:
+        """Constructs the edges for a list of edges belonging to a single edge type. The method does not modify the
+        knowledge graph or edge_dict, which allows it to be run over chunks of an edge list in separate processes.
+        Edges containing a node that is not in the knowledge graph or subclass_dict are marked as rejected as they are
+        found and removed from the returned edge list in a single pass once all edges have been processed.
+
+        Args:
+            edge_builder: A KGConstructionApproach object.
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            edge_list: A list of knowledge graph edges. For example: [["8837", "4283"], ["8837", "839"]]
+            invrel: A string containing the inverse relation for the edge type or None.
+            progress: A bool indicating whether or not to display a progress bar.
+
+        Returns:
+            new_edges: A list of triples to add to the knowledge graph.
+            kept_edges: The edges in edge_list that were not removed because they contain an unknown node.
+            subclass_errors: A list of non-ontology node identifiers that were not found in the subclass_dict.
+        """
+
+        n1_type, n2_type = self.edge_dict[edge_type]['data_type'].split('-')
+        uri, rel = self.edge_dict[edge_type]['uri'], self.edge_dict[edge_type]['edge_relation']
+        edge_builder.edge_dict = {edge_type: dict(self.edge_dict[edge_type], edge_list=edge_list)}
+        edge_builder.rejected_edges, edge_builder.subclass_error = {edge_type: set()}, dict()
+        new_edges: List = []
+
+        for edge in tqdm(edge_list, disable=not progress):
+            edge_info = {'n1': n1_type, 'n2': n2_type, 'rel': rel, 'inv_rel': invrel, 'uri': uri, 'edges': edge}
+
+            if self.check_ontology_class_nodes(edge_info):  # verify edges - make sure ont class nodes are in KG
+                if self.construct_approach == 'subclass':
+                    new_edges += edge_builder.subclass_constructor(edge_info, edge_type)[1]
+                else:
+                    new_edges += edge_builder.instance_constructor(edge_info, edge_type)[1]
+            else:
+                edge_builder.rejected_edges[edge_type].add(tuple(edge))
+
+        kept_edges = edge_builder.removes_rejected_edges(edge_type)
+
+        return new_edges, kept_edges, edge_builder.subclass_error.get(edge_type, [])
+
     def creates_knowledge_graph_edges(self, node_metadata_func: Callable, ontology_annotator_func: Callable) -> None:
         """Takes a nested dictionary of edge lists and adds them to an existing knowledge graph by their edge_type (
         e.g. chemical-gene). Once the knowledge graph is complete, it is written out as an `.owl` file to the
         write_location  directory.
 
+        When the stage cache is enabled, the triples added by each edge type are cached (see EdgeTypeCache). Edge types
+        whose edge_dict entry is unchanged since the prior build are then read from the cache instead of being
+        constructed, so only new or changed edge types are rebuilt.
+
+        When cpus is greater than 1 (and processes can be forked), each edge list is split into chunks which are
+        constructed by a pool of worker processes. Chunks are returned and merged in their original order, so the
+        resulting knowledge graph, edge_dict, and error log are the same as those created by a single process.
+
+        When ntriples is set, the triples are appended to an N-Triples file as they are added to the knowledge graph:
+        the merged ontologies and cached edge types first, then each edge type as soon as it is constructed, then the
+        node metadata, and finally the ontology annotations, which replace those of the merged ontologies. Triples
+        already in the knowledge graph are not written again. Serializing the graph to RDF/XML, which is
+        slow and memory intensive for large graphs, is then only done if rdf_xml is True.
+
+        Once every edge type is constructed, the edges that were added to the knowledge graph are also written as one
+        integer array per subject type, relation, and object type (see writes_typed_edges()), which can be used to
+        train heterogeneous graph models without re-reading the knowledge graph.
+
         Args:
             node_metadata_func: A function that adds metadata for non-ontology classes to a knowledge graph.
             ontology_annotator_func: A function that adds annotations to an existing ontology.
@@ -338,52 +616,405 @@ class KGBuilder(object):
         """
 
         edge_builder = KGConstructionApproach(self.edge_dict, self.res_dir)  # initialize construction approaches
-
-        for edge_type in self.edge_dict.keys():
-            n1_type, n2_type = self.edge_dict[edge_type]['data_type'].split('-')
-            uri = self.edge_dict[edge_type]['uri']
-            edge_list = copy.deepcopy(self.edge_dict[edge_type]['edge_list'])
-            edge_results: List = []
-
-            # identify relations
-            rel = self.edge_dict[edge_type]['edge_relation']
-            self.verifies_object_property(URIRef(obo + rel))  # verify object property in knowledge graph
-            invrel = self.checks_for_inverse_relations(rel, edge_list) if self.inverse_relations else None
-
-            print('\nCreating {} ({}-{}) Edges ***'.format(edge_type.upper(), n1_type, n2_type))
-
-            for edge in tqdm(edge_list):
-                edge_info = {'n1': n1_type, 'n2': n2_type, 'rel': rel, 'inv_rel': invrel, 'uri': uri, 'edges': edge}
-
-                if self.check_ontology_class_nodes(edge_info):  # verify edges - make sure ont class nodes are in KG
-                    if self.construct_approach == 'subclass':
-                        self.edge_dict, new_edges = edge_builder.subclass_constructor(edge_info, edge_type)
-                        self.graph = adds_edges_to_graph(self.graph, new_edges)  # add new edges to graph
-                        edge_results += new_edges  # update list of added edges
-                    else:
-                        self.edge_dict, new_edges = edge_builder.instance_constructor(edge_info, edge_type)
-                        self.graph = adds_edges_to_graph(self.graph, new_edges)  # add new edges to graph
-                        edge_results += new_edges  # update list of added edges
-                else:
-                    self.edge_dict[edge_type]['edge_list'].pop(self.edge_dict[edge_type]['edge_list'].index(edge))
-
-            n1, n2, edges = edge_type.split('-')[0], edge_type.split('-')[1], self.edge_dict[edge_type]['edge_list']
-            print('Total OWL Edges: {}'.format(len(set(edge_results))))
-            print('Unique Non-OWL Edges: {}'.format(len(edges) * 2 if invrel else len(edges)))
-            print('Unique {}: {}'.format(n1, len(set([x[0] for x in self.edge_dict[edge_type]['edge_list']]))))
-            print('Unique {}: {}'.format(n2, len(set([x[1] for x in self.edge_dict[edge_type]['edge_list']]))))
+        edge_type_cache = EdgeTypeCache(self.write_location + self.full_kg[:-4] + '_EdgeTypeCache',
+                                        hashes_build_inputs(self.gets_edge_type_cache_inputs(),
+                                                            self.stage_cache.manifest['files']),
+                                        enabled=self.stage_cache.enabled)
+        writer = NTriplesWriter(self.write_location + self.full_kg[:-4] + self.ntriples) if self.ntriples else None
+        subclass_error: Dict = dict()
+        invrels: Dict = dict()
+        edge_keys: Dict = dict()
+
+        # identify relations - verify object properties in knowledge graph and reuse unchanged edge types
+        for edge_type in list(self.edge_dict.keys()):
+            rel, edge_list = self.edge_dict[edge_type]['edge_relation'], self.edge_dict[edge_type]['edge_list']
+            self.verifies_object_property(URIRef(obo + rel))
+            invrels[edge_type] = self.checks_for_inverse_relations(rel, edge_list) if self.inverse_relations else None
+            key = edge_type_cache.creates_edge_type_key(self.edge_dict[edge_type])
+
+            if edge_type_cache.checks_edge_type(edge_type, key):
+                print('\nReusing {} ({}) Edges - Inputs Unchanged ***'.format(edge_type.upper(),
+                                                                           self.edge_dict[edge_type]['data_type']))
+                with self.telemetry.records_stage('loads_cached_edge_type', edge_type, len(edge_list)) as record:
+                    rejected_edges, errors, triple_count = edge_type_cache.loads_edge_type(edge_type, self.graph)
+                    record['triples'] = triple_count
+                self.edge_dict[edge_type]['edge_list'] = [x for x in edge_list if tuple(x) not in rejected_edges]
+                if errors: subclass_error[edge_type] = errors
+                self.prints_edge_type_statistics(edge_type, triple_count, invrels[edge_type])
+            else:
+                edge_keys[edge_type] = key
+
+        if writer:  # the ontology annotations are written last, as ontology_annotator_func replaces them
+            ontology_iris = set(self.graph.subjects(RDF.type, OWL.Ontology))
+            writer.writes_triples(x for x in self.graph if x[0] not in ontology_iris)
+
+        if self.cpus > 1 and len(edge_keys) > 0 and 'fork' in multiprocessing.get_all_start_methods():
+            print('\nCreating Edges Using {} Processes ***'.format(self.cpus))
+            tasks, chunk_counts = [], {}
+            for edge_type in edge_keys.keys():
+                edge_list = self.edge_dict[edge_type]['edge_list']
+                size = max(1000, -(-len(edge_list) // (self.cpus * 4)))
+                chunks = [edge_list[i:i + size] for i in range(0, len(edge_list), size)] or [[]]
+                tasks += [(edge_type, chunk, invrels[edge_type]) for chunk in chunks]
+                chunk_counts[edge_type] = len(chunks)
+
+            pool = multiprocessing.get_context('fork').Pool(self.cpus, initializes_edge_worker, (self, edge_builder))
+            try:
+                # results are returned in task order, so each edge type's chunks are consumed together
+                results = pool.imap(creates_edge_chunk_worker, tasks)
+                for edge_type in edge_keys.keys():
+                    edge_count = len(self.edge_dict[edge_type]['edge_list'])
+                    with self.telemetry.records_stage('creates_knowledge_graph_edges', edge_type, edge_count) as record:
+                        edge_results, kept_edges, errors = [], [], []
+                        for _ in range(chunk_counts[edge_type]):
+                            _, new_edges, chunk_kept_edges, chunk_errors = next(results)
+                            if writer: writer.writes_triples(new_edges, self.graph)
+                            self.graph = adds_edges_to_graph(self.graph, new_edges)
+                            edge_results += new_edges
+                            kept_edges += chunk_kept_edges
+                            errors += chunk_errors
+
+                        if errors: subclass_error[edge_type] = errors
+                        print('\nCreated {} ({}) Edges ***'.format(edge_type.upper(),
+                                                                   self.edge_dict[edge_type]['data_type']))
+                        record['triples'] = self.completes_edge_type(edge_type, edge_type_cache, edge_keys[edge_type],
+                                                                     edge_results, kept_edges, errors,
+                                                                     invrels[edge_type])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for edge_type in edge_keys.keys():
+                n1_type, n2_type = self.edge_dict[edge_type]['data_type'].split('-')
+                print('\nCreating {} ({}-{}) Edges ***'.format(edge_type.upper(), n1_type, n2_type))
+
+                edge_list = self.edge_dict[edge_type]['edge_list']
+                with self.telemetry.records_stage('creates_knowledge_graph_edges', edge_type, len(edge_list)) as record:
+                    edge_results, kept_edges, errors = \
+                        self.creates_edge_chunk(edge_builder, edge_type, edge_list, invrels[edge_type])
+                    if writer: writer.writes_triples(edge_results, self.graph)
+                    self.graph = adds_edges_to_graph(self.graph, edge_results)  # add new edges to graph
+                    if errors: subclass_error[edge_type] = errors
+                    record['triples'] = self.completes_edge_type(edge_type, edge_type_cache, edge_keys[edge_type],
+                                                                 edge_results, kept_edges, errors, invrels[edge_type])
+        edge_type_cache.writes_manifest(list(self.edge_dict.keys()))
+        with self.telemetry.records_stage('writes_typed_edges') as record:
+            record['items'] = sum(len(x['edge_list']) for x in self.edge_dict.values())
+            writes_typed_edges(self.edge_dict, self.write_location + self.full_kg[:-6] + 'Typed_Edges.npz')
 
         # output error logs
-        if len(edge_builder.subclass_error.keys()) > 0:
+        if len(subclass_error.keys()) > 0:
             log_file = glob.glob(self.res_dir + '/construction*')[0] + '/subclass_map_missing_node_log.json'
             print('\nSome edge lists nodes were missing from subclass_dict, see log: {}'.format(log_file))
-            outputs_dictionary_data(edge_builder.subclass_error, log_file)
+            outputs_dictionary_data(subclass_error, log_file)
 
         # add ontology metadata and annotations, serialize graph, and apply OWL API formatting to output
-        if self.kg_metadata == 'yes': node_metadata_func(self.graph, self.edge_dict)
+        if self.kg_metadata == 'yes':
+            with self.telemetry.records_stage('adds_node_metadata') as record:
+                metadata_graph = Graph() if writer else self.graph
+                node_metadata_func(metadata_graph, self.edge_dict)
+                if writer:
+                    writer.writes_triples(metadata_graph, self.graph)
+                    self.graph = adds_edges_to_graph(self.graph, list(metadata_graph))
+                record['triples'] = len(self.graph)
         self.graph = ontology_annotator_func(self.full_kg.split('/')[-1], self.graph)
-        self.graph.serialize(destination=self.write_location + self.full_kg, format='xml')
-        ontology_file_formatter(self.write_location, self.full_kg, self.owl_tools)
+        with self.telemetry.records_stage('serializes_knowledge_graph', items=len(self.graph)) as record:
+            if writer:
+                ontology_iris = set(self.graph.subjects(RDF.type, OWL.Ontology))
+                writer.writes_triples(x for iri in ontology_iris for x in self.graph.triples((iri, None, None)))
+                writer.close()
+            if self.rdf_xml:
+                self.graph.serialize(destination=self.write_location + self.full_kg, format='xml')
+                ontology_file_formatter(self.write_location, self.full_kg, self.owl_tools)
+            record['triples'] = len(self.graph)
+
+        return None
+
+    def loads_stage_graph(self) -> None:
+        """Reads in the knowledge graph written by the most recently skipped build stage. The graph is only read in if
+        it is not already in memory, which is the case when the stage that produced it was skipped because it was
+        cached.
+
+        Returns:
+            None.
+        """
+
+        if len(self.graph) == 0 and self.graph_file:
+            print('*** Loading Cached Knowledge Graph: {} ***'.format(self.graph_file.split('/')[-1]))
+            with self.telemetry.records_stage('loads_stage_graph') as record:
+                self.graph = creates_graph(self.storage, self.triple_store)
+                if self.graph_file.endswith('.owl'):
+                    self.graph.parse(self.graph_file, format='xml')
+                else:
+                    reads_ntriples(self.graph, self.graph_file)
+                record['items'] = record['triples'] = len(self.graph)
+
+        return None
+
+    def loads_merged_ontologies(self) -> None:
+        """Reads the merged ontologies into a new graph and gets the ontology classes and object properties it contains.
+        After the merged ontologies .owl file is first parsed, a binary encoding of its triples is written next to it
+        (see writes_graph_cache()), which is read instead of the .owl file by later builds until the .owl file's
+        contents change. When the build is one of several variants run by builds_knowledge_graph_variants(), the graph
+        loaded by the parent process is used instead (in-memory builds use the forked copy of the graph directly).
+
+        Returns:
+            None.
+        """
+
+        graph_cache = self.merged_ont_kg[:-4] + '_GraphCache.npz'
+        source_hash = hashes_build_inputs([self.merged_ont_kg], self.stage_cache.manifest['files'])
+        shared = variant_build_state.get('merged_ontologies')
+        self.graph = creates_graph(self.storage, self.triple_store)
+
+        with self.telemetry.records_stage('loads_merged_ontologies') as record:
+            if shared and shared[0] == self.merged_ont_kg:
+                print('Using Merged Ontologies Loaded for All Knowledge Graph Variants')
+                if self.storage == 'memory':
+                    self.graph = shared[1]
+                else:
+                    self.graph.addN((s, p, o, self.graph) for s, p, o in shared[1])
+                self.ont_classes, self.obj_properties = shared[2], shared[3]
+            else:
+                if loads_graph_cache(self.graph, graph_cache, source_hash):
+                    print('Loaded Merged Ontologies from Binary Cache: {}'.format(graph_cache.split('/')[-1]))
+                else:
+                    self.graph.parse(self.merged_ont_kg, format='xml')
+                    writes_graph_cache(self.graph, graph_cache, source_hash)
+                self.ont_classes = gets_ontology_classes(self.graph)
+                self.obj_properties = gets_object_properties(self.graph)
+            record['items'] = record['triples'] = len(self.graph)
+
+        return None
+
+    def gets_edge_type_cache_inputs(self) -> List:
+        """Gathers the inputs which are shared by the construction of every edge type, which are used to key the
+        edge type cache (i.e. if any of these inputs change, every edge type is rebuilt).
+
+        Returns:
+            A list of filepaths and build flags.
+        """
+
+        inputs = [self.merged_ont_kg] + glob.glob(self.res_dir + '/construction_*/*.pkl')
+        inputs += sorted(self.inverse_relations) if self.inverse_relations else []
+
+        return inputs + [self.construct_approach]
+
+    def gets_edge_stage_inputs(self) -> List:
+        """Gathers the inputs which determine the output of the edge construction stage, which are used to key that
+        stage in the stage_cache.
+
+        Returns:
+            A list of filepaths and build flags.
+        """
+
+        inputs = [self.merged_ont_kg, self.edge_data] + glob.glob(self.res_dir + '/construction_*/*.pkl')
+        inputs += sorted(self.inverse_relations) if self.inverse_relations else []
+        inputs += sorted(self.node_data) if self.node_data else []
+
+        inputs += [self.ntriples, str(self.rdf_xml)] if self.ntriples else []
+
+        return inputs + [self.construct_approach, self.kg_metadata, self.kg_version, self.full_kg]
+
+    def gets_knowledge_graph_files(self) -> List[str]:
+        """Returns the files the knowledge graph is written to once its edges have been constructed (i.e. the RDF/XML
+        file and/or the N-Triples file).
+
+        Returns:
+            A list of filepaths. The RDF/XML file is listed first when it is written.
+        """
+
+        kg_files = [self.write_location + self.full_kg] if self.rdf_xml else []
+        kg_files += [self.write_location + self.full_kg[:-4] + self.ntriples] if self.ntriples else []
+
+        return kg_files
+
+    def writes_knowledge_graph_outputs(self, metadata: Metadata) -> None:
+        """Runs the build stages that follow the addition of the edge data to the knowledge graph: (1) Extract and
+        write node metadata; (2) Decode OWL-encoded classes; and (3) Output knowledge graph files and create edge
+        lists. Each stage is skipped if its output is cached and its inputs (and the inputs of all prior stages) are
+        unchanged.
+
+        Args:
+            metadata: A Metadata object.
+
+        Returns:
+            None.
+        """
+
+        owl_nets_kg = self.write_location + self.full_kg[:-21] + 'OWLNETS.owl'
+        int_outputs = [self.write_location + self.full_kg[:-6] + x for x in ['Triples_Integers.txt',
+                                                                              'Triples_Identifiers.txt',
+                                                                              'Triples_Integers.npz',
+                                                                              'Triples_Integer_Identifier_Map.npz']]
+        int_outputs += [self.write_location + self.full_kg[:-6] + 'Triples_Integer_Identifier_Map.json']
+        int_outputs += [x[:-4] + '.parquet' for x in int_outputs[:2]] if self.parquet else []
+        node_outputs = [self.write_location + self.full_kg[:-6] + 'NodeLabels.' + x
+                        for x in ['txt'] + (['parquet'] if self.parquet else [])]
+
+        # EXTRACT AND WRITE NODE METADATA
+        print('\n*** Processing Knowledge Graph Metadata ***')
+        self.stage_cache.creates_stage_key('output_knowledge_graph_metadata', [self.node_data is not None,
+                                                                               self.parquet] +
+                                           (sorted(self.node_data) if self.node_data else []))
+        if self.stage_cache.checks_stage('output_knowledge_graph_metadata'):
+            print('Skipping Stage - Inputs Unchanged')
+        else:
+            if self.node_data is not None:
+                self.loads_stage_graph()
+                metadata.output_knowledge_graph_metadata(self.graph, self.parquet)
+            self.stage_cache.records_stage('output_knowledge_graph_metadata', node_outputs)
+        del metadata, self.edge_dict, self.node_dict, self.relations_dict, self.inverse_relations_dict
+
+        # DECODE OWL SEMANTICS
+        if self.decode_owl:
+            print('\n*** Running OWL-NETS - Decoding OWL-Encoded Classes and Removing OWL Semantics ***')
+            self.stage_cache.creates_stage_key('run_owl_nets', [self.construct_approach] +
+                                               glob.glob(self.res_dir + '/owl_decoding/*Property*'))
+            if self.stage_cache.checks_stage('run_owl_nets'):
+                print('Skipping Stage - Inputs Unchanged')
+                self.graph, self.graph_file = creates_graph(self.storage, self.triple_store), owl_nets_kg
+            else:
+                self.loads_stage_graph()
+                owl_nets = OwlNets(self.construct_approach, self.graph, self.write_location, self.full_kg,
+                                   self.telemetry)
+                self.graph = owl_nets.run_owl_nets()
+
+                # reformat output and output stats
+                if self.rdf_xml:
+                    gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+                    ontology_file_formatter(self.write_location, self.full_kg, self.owl_tools)
+                self.stage_cache.records_stage('run_owl_nets', [owl_nets_kg])
+
+        # WRITE OUT KNOWLEDGE GRAPH DATA AND CREATE EDGE LISTS
+        print('\n*** Writing Knowledge Graph Edge Lists ***')
+        outputs = {'maps_node_ids_to_integers': ([self.parquet, self.previous_map], int_outputs,
+                                                 'Skipping Stage - Inputs Unchanged'),
+                   'writes_csr_adjacency': ([], [self.write_location + self.full_kg[:-4] + '_CSR_Adjacency.npz'],
+                                            '\nSkipping CSR Adjacency Matrix Export - Inputs Unchanged'),
+                   'converts_rdflib_to_networkx': ([], [self.write_location + self.full_kg[:-4] +
+                                                        '_Networkx_MultiDiGraph.gpickle'],
+                                                   '\nSkipping MultiDiGraph Conversion - Inputs Unchanged')}
+        stages = []
+        for stage, (inputs, _, message) in outputs.items():
+            self.stage_cache.creates_stage_key(stage, inputs)
+            if self.stage_cache.checks_stage(stage):
+                print(message)
+            else:
+                stages.append(stage)
+        self.writes_output_files(stages)
+        for stage in stages:
+            self.stage_cache.records_stage(stage, outputs[stage][1])
+
+        return None
+
+    def writes_output_files(self, stages: List[str]) -> None:
+        """Writes the output files of the final build stages: (1) the edge lists and identifier maps
+        ("maps_node_ids_to_integers"); (2) the CSR adjacency matrix ("writes_csr_adjacency"); and (3) the networkx
+        MultiDiGraph ("converts_rdflib_to_networkx"). When OWL semantics are decoded, the edge lists are written from
+        the OWL-NETS graph and the CSR adjacency matrix and MultiDiGraph from the knowledge graph.
+
+        The triples of each graph are read and mapped to integers once (see encodes_triples()) and every writer except
+        the MultiDiGraph conversion, which needs the graph's rdflib terms, only uses the encoded triples. When cpus is
+        greater than 1 (and processes can be forked), those writers are run concurrently by a pool of worker processes
+        while the MultiDiGraph is built by the main process, so the writers take about as long as the slowest one.
+
+        Args:
+            stages: A list of the names of the stages whose output files are written.
+
+        Returns:
+            None.
+        """
+
+        writers, encodings = [], dict()
+        if 'maps_node_ids_to_integers' in stages:
+            self.loads_stage_graph()
+            with self.telemetry.records_stage('encodes_triples') as record:
+                record['items'] = record['triples'] = len(self.graph)
+                encodings['edge_lists'] = encodes_triples(self.graph, self.previous_map)
+            writers += ['writes_integer_triples', 'writes_identifier_triples', 'writes_node_id_map']
+
+        if 'writes_csr_adjacency' in stages or 'converts_rdflib_to_networkx' in stages:
+            if self.decode_owl or len(self.graph) == 0:  # read in the knowledge graph instead of the OWL-NETS graph
+                self.graph, self.graph_file = creates_graph(self.storage, self.triple_store), \
+                    self.gets_knowledge_graph_files()[0]
+                self.loads_stage_graph()
+            if 'writes_csr_adjacency' in stages:
+                if self.decode_owl or 'edge_lists' not in encodings:
+                    with self.telemetry.records_stage('encodes_triples') as record:
+                        record['items'] = record['triples'] = len(self.graph)
+                        encodings['knowledge_graph'] = encodes_triples(self.graph)
+                else:  # the edge lists and CSR adjacency matrix are written from the same graph
+                    encodings['knowledge_graph'] = encodings['edge_lists']
+                writers += ['writes_csr_adjacency']
+
+        # the main process converts the graph to a MultiDiGraph while the worker processes run the other writers
+        networkx_stage = 'converts_rdflib_to_networkx' in stages
+        processes = min(self.cpus - 1 if networkx_stage else self.cpus, len(writers))
+        if (processes > 1 or (networkx_stage and processes > 0)) and 'fork' in multiprocessing.get_all_start_methods():
+            print('\nWriting Output Files Using {} Processes ***'.format(processes + networkx_stage))
+            pool = multiprocessing.get_context('fork').Pool(processes, initializes_output_worker, (self, encodings))
+            try:
+                results = pool.map_async(writes_output_file_worker, writers)
+                if networkx_stage: self.converts_graph_to_networkx()
+                for records in results.get():
+                    self.telemetry.records += records
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for writer in writers:
+                self.writes_output_file(writer, encodings, self.telemetry)
+            if networkx_stage: self.converts_graph_to_networkx()
+        self.graph = creates_graph(self.storage, self.triple_store)  # the graph is no longer needed
+
+        return None
+
+    def writes_output_file(self, writer: str, encodings: Dict, telemetry: BuildTelemetry) -> None:
+        """Runs a single output file writer using the encoded triples created by writes_output_files().
+
+        Args:
+            writer: A string containing the name of the writer (i.e. "writes_integer_triples",
+                "writes_identifier_triples", "writes_node_id_map", or "writes_csr_adjacency").
+            encodings: A dict keyed by graph ("edge_lists" or "knowledge_graph") containing the tuple returned by
+                encodes_triples() for that graph.
+            telemetry: A BuildTelemetry object used to record the writer.
+
+        Returns:
+            None.
+        """
+
+        kg_name = self.full_kg[:-6]
+        codes, nodes = encodings['knowledge_graph' if writer == 'writes_csr_adjacency' else 'edge_lists']
+
+        with telemetry.records_stage(writer) as record:
+            record['items'] = record['triples'] = len(codes)
+            if writer == 'writes_integer_triples':
+                writes_integer_triples(codes, self.write_location, kg_name + 'Triples_Integers.txt',
+                                       kg_name + 'Triples_Integers.npz', self.parquet)
+            elif writer == 'writes_identifier_triples':
+                writes_identifier_triples(codes, nodes, self.write_location, kg_name + 'Triples_Identifiers.txt',
+                                          self.parquet)
+            elif writer == 'writes_node_id_map':
+                record['items'] = len(nodes)
+                writes_node_id_map(nodes, self.write_location, kg_name + 'Triples_Integer_Identifier_Map.json',
+                                   kg_name + 'Triples_Integer_Identifier_Map.npz')
+            else:
+                writes_encoded_csr_adjacency(codes, nodes, self.write_location + self.full_kg[:-4] +
+                                             '_CSR_Adjacency.npz')
+
+        return None
+
+    def converts_graph_to_networkx(self) -> None:
+        """Converts the knowledge graph to a networkx MultiDiGraph (see converts_rdflib_to_networkx()).
+
+        Returns:
+            None.
+        """
+
+        with self.telemetry.records_stage('converts_rdflib_to_networkx') as record:
+            record['items'] = record['triples'] = len(self.graph)
+            converts_rdflib_to_networkx(self.write_location, self.full_kg, self.graph)
 
         return None
 
@@ -435,31 +1066,26 @@ class PartialBuild(KGBuilder):
 
         # STEP 2: PROCESS RELATION AND INVERSE RELATION DATA
         print('*** Loading Relations Data ***')
-        self.reverse_relation_processor()
+        with self.telemetry.records_stage('reverse_relation_processor'):
+            self.reverse_relation_processor()
 
         # STEP 3: PROCESS NODE METADATA
         print('*** Loading Node Metadata Data ***')
-        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
+        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict,
+                            self.telemetry)
         if self.node_data: metadata.node_metadata_processor()
 
         # STEP 4: MERGE ONTOLOGIES
-        if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
-            print('*** Loading Merged Ontologies ***')
-            self.graph.parse(self.merged_ont_kg, format='xml')
-            gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
-        else:
+        if self.merged_ont_kg not in glob.glob(self.write_location + '/*.owl'):
             if len(self.ontologies) == 0:
                 raise TypeError('ERROR: the ontologies directory: {} is empty'.format(
                     self.write_location + '/' + glob.glob('*/ontologies')[0]))
             else:
                 print('*** Merging Ontology Data ***')
-                merges_ontologies(self.ontologies,
-                                  self.write_location, '/' + self.merged_ont_kg.split('/')[-1],
-                                  self.owl_tools)
-
-                # load the merged ontology
-                self.graph.parse(self.merged_ont_kg, format='xml')
-                gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
+                with self.telemetry.records_stage('merges_ontologies', items=len(self.ontologies)):
+                    merges_ontologies(self.ontologies,
+                                      self.write_location, '/' + self.merged_ont_kg.split('/')[-1],
+                                      self.owl_tools)
 
         # STEP 5: ADD MASTER EDGE DATA TO KNOWLEDGE GRAPH
         # create temporary directory to store partial builds and update path to write data to
@@ -470,11 +1096,20 @@ class PartialBuild(KGBuilder):
 
         # build knowledge graph
         print('*** Building Knowledge Graph Edges ***')
-        self.ont_classes = gets_ontology_classes(self.graph)
-        self.obj_properties = gets_object_properties(self.graph)
-        self.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
+        self.stage_cache.creates_stage_key('creates_knowledge_graph_edges', self.gets_edge_stage_inputs())
+        if self.stage_cache.checks_stage('creates_knowledge_graph_edges'):
+            print('Skipping Stage - Inputs Unchanged')
+        else:
+            print('*** Loading Merged Ontologies ***')
+            self.loads_merged_ontologies()
+            gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
+
+            self.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
+            if self.rdf_xml: gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+            self.stage_cache.records_stage('creates_knowledge_graph_edges', self.gets_knowledge_graph_files() +
+                                           [self.write_location + self.full_kg[:-6] + 'Typed_Edges.npz'])
         del self.graph, self.edge_dict, self.node_dict, self.relations_dict, self.inverse_relations_dict, metadata
-        gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+        self.telemetry.writes_report(self.write_location + self.full_kg[:-4] + '_Telemetry.json')
 
         return None
 
@@ -511,14 +1146,16 @@ class PostClosureBuild(KGBuilder):
 
         # STEP 2: PROCESS RELATION AND INVERSE RELATION DATA
         print('*** Loading Relations Data ***')
-        self.reverse_relation_processor()
+        with self.telemetry.records_stage('reverse_relation_processor'):
+            self.reverse_relation_processor()
 
         # STEP 3: PROCESS NODE METADATA
         print('*** Loading Node Metadata Data ***')
-        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
+        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict,
+                            self.telemetry)
         if self.node_data: metadata.node_metadata_processor()
 
-        # STEP 3: LOAD CLOSED KNOWLEDGE GRAPH
+        # STEP 4: LOAD CLOSED KNOWLEDGE GRAPH
         closed_kg_location = glob.glob(self.write_location + '/'.join(self.full_kg.split('/')[0:2]) + '/*.owl')
 
         if len(closed_kg_location) == 0:
@@ -528,32 +1165,14 @@ class PostClosureBuild(KGBuilder):
         else:
             print('*** Loading Closed Knowledge Graph ***')
             os.rename(closed_kg_location[0], self.write_location + self.full_kg)  # rename closed kg file
-            self.graph = Graph()
-            self.graph.parse(self.write_location + self.full_kg, format='xml')
+            self.graph = creates_graph(self.storage, self.triple_store)
+            self.graph_file = self.write_location + self.full_kg  # read in by the first stage
             gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+            self.stage_cache.creates_stage_key('loads_closed_knowledge_graph', [self.graph_file, self.kg_version])
 
-        # STEP 5: EXTRACT AND WRITE NODE METADATA
-        print('\n*** Processing Knowledge Graph Metadata ***')
-        if self.node_data is not None: metadata.output_knowledge_graph_metadata(self.graph)
-        del metadata, self.edge_dict, self.node_dict, self.relations_dict, self.inverse_relations_dict
-
-        # STEP 6: DECODE OWL SEMANTICS
-        if self.decode_owl:
-            print('*** Running OWL-NETS - Decoding OWL-Encoded Classes and Removing OWL Semantics ***')
-            owl_nets = OwlNets(self.construct_approach, self.graph, self.write_location, self.full_kg)
-            self.graph = owl_nets.run_owl_nets()
-
-            # reformat output and output stats
-            gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
-            ontology_file_formatter(self.write_location, self.full_kg, self.owl_tools)
-
-        # STEP 7: WRITE OUT KNOWLEDGE GRAPH DATA AND CREATE EDGE LISTS
-        print('*** Writing Knowledge Graph Edge Lists ***')
-        maps_node_ids_to_integers(self.graph, self.write_location,
-                                  self.full_kg[:-6] + 'Triples_Integers.txt',
-                                  self.full_kg[:-6] + 'Triples_Integer_Identifier_Map.json')
-
-        converts_rdflib_to_networkx(self.write_location, self.full_kg, self.graph)
+        # STEPS 5-7: EXTRACT AND WRITE NODE METADATA, DECODE OWL SEMANTICS, AND WRITE OUT KNOWLEDGE GRAPH DATA
+        self.writes_knowledge_graph_outputs(metadata)
+        self.telemetry.writes_report(self.write_location + self.full_kg[:-4] + '_Telemetry.json')
 
         return None
 
@@ -587,59 +1206,135 @@ class FullBuild(KGBuilder):
 
         # STEP 2: PROCESS RELATION AND INVERSE RELATION DATA
         print('*** Loading Relations Data ***')
-        self.reverse_relation_processor()
+        with self.telemetry.records_stage('reverse_relation_processor'):
+            self.reverse_relation_processor()
 
         # STEP 3: PROCESS NODE METADATA
         print('*** Loading Node Metadata Data ***')
-        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict)
+        metadata = Metadata(self.kg_version, self.write_location, self.full_kg, self.node_data, self.node_dict,
+                            self.telemetry)
         if self.node_data: metadata.node_metadata_processor()
 
         # STEP 4: MERGE ONTOLOGIES
-        if self.merged_ont_kg in glob.glob(self.write_location + '/*.owl'):
-            print('*** Loading Merged Ontologies ***')
-            self.graph.parse(self.merged_ont_kg, format='xml')
-            gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
-        else:
+        if self.merged_ont_kg not in glob.glob(self.write_location + '/*.owl'):
             if len(self.ontologies) == 0:
                 raise TypeError('The ontologies directory is empty')
             else:
                 print('*** Merging Ontology Data ***')
-                merges_ontologies(self.ontologies,
-                                  self.write_location, '/' + self.merged_ont_kg.split('/')[-1],
-                                  self.owl_tools)
-                # load the merged ontology
-                self.graph.parse(self.merged_ont_kg, format='xml')
-                gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
-
-        self.ont_classes = gets_ontology_classes(self.graph)
-        self.obj_properties = gets_object_properties(self.graph)
+                with self.telemetry.records_stage('merges_ontologies', items=len(self.ontologies)):
+                    merges_ontologies(self.ontologies,
+                                      self.write_location, '/' + self.merged_ont_kg.split('/')[-1],
+                                      self.owl_tools)
 
         # STEP 5: ADD EDGE DATA TO KNOWLEDGE GRAPH DATA
         print('\n*** Building Knowledge Graph Edges ***')
-        self.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
-        gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+        self.stage_cache.creates_stage_key('creates_knowledge_graph_edges', self.gets_edge_stage_inputs())
+        if self.stage_cache.checks_stage('creates_knowledge_graph_edges'):
+            print('Skipping Stage - Inputs Unchanged')
+            self.graph = creates_graph(self.storage, self.triple_store)
+            self.graph_file = self.gets_knowledge_graph_files()[0]
+        else:
+            print('*** Loading Merged Ontologies ***')
+            self.loads_merged_ontologies()
+            gets_ontology_statistics(self.merged_ont_kg, self.owl_tools)
 
-        # STEP 6: EXTRACT AND WRITE NODE METADATA
-        print('\n*** Processing Knowledge Graph Metadata ***')
-        if self.node_data is not None: metadata.output_knowledge_graph_metadata(self.graph)
-        del metadata, self.edge_dict, self.node_dict, self.relations_dict, self.inverse_relations_dict
+            self.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
+            if self.rdf_xml: gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
+            self.stage_cache.records_stage('creates_knowledge_graph_edges', self.gets_knowledge_graph_files() +
+                                           [self.write_location + self.full_kg[:-6] + 'Typed_Edges.npz'])
 
-        # STEP 7: DECODE OWL SEMANTICS
-        if self.decode_owl:
-            print('\n*** Running OWL-NETS - Decoding OWL-Encoded Classes and Removing OWL Semantics ***')
-            owl_nets = OwlNets(self.construct_approach, self.graph, self.write_location, self.full_kg)
-            self.graph = owl_nets.run_owl_nets()
+        # STEPS 6-8: EXTRACT AND WRITE NODE METADATA, DECODE OWL SEMANTICS, AND WRITE OUT KNOWLEDGE GRAPH DATA
+        self.writes_knowledge_graph_outputs(metadata)
+        self.telemetry.writes_report(self.write_location + self.full_kg[:-4] + '_Telemetry.json')
 
-            # reformat output and output stats
-            gets_ontology_statistics(self.write_location + self.full_kg, self.owl_tools)
-            ontology_file_formatter(self.write_location, self.full_kg, self.owl_tools)
+        return None
 
-        # STEP 8: WRITE OUT KNOWLEDGE GRAPH DATA AND CREATE EDGE LISTS
-        print('\n*** Writing Knowledge Graph Edge Lists ***')
-        maps_node_ids_to_integers(self.graph, self.write_location,
-                                  self.full_kg[:-6] + 'Triples_Integers.txt',
-                                  self.full_kg[:-6] + 'Triples_Integer_Identifier_Map.json')
 
-        converts_rdflib_to_networkx(self.write_location, self.full_kg, self.graph)
+def builds_knowledge_graph_variants(build: Type[KGBuilder], variants: List[Dict[str, str]], owl_tools: Optional[str]
+                                    = None, **kwargs) -> List[str]:
+    """Builds several variants of a knowledge graph, which differ by construction approach, inverse relations, and/or
+    decoding of OWL semantics (e.g. the release matrix), while only merging and reading the ontologies and master edge
+    list once. The merged ontologies graph, its classes and object properties, and the master edge list are loaded by
+    the current process and then each variant is built in a forked child process, which inherits a copy-on-write copy
+    of them instead of re-loading them. The variants are built one at a time so only one copy of the graph is being
+    modified at a time. Variants are built in the current process, without sharing inputs, when only one variant is
+    requested, the build is a post-closure build (which does not use the merged ontologies), or processes cannot be
+    forked. When the variants use more than one construction approach, the approach is added to the filename of each
+    knowledge graph (e.g. PheKnowLator_full_Subclass_...) so the variants do not overwrite each other.
+
+    Args:
+        build: A KGBuilder subclass (i.e. FullBuild, PartialBuild, or PostClosureBuild).
+        variants: A list of dicts, one per variant, containing the construction, inverse_relations, and decode_owl
+            arguments of the variant. For example:
+                [{'construction': 'subclass', 'inverse_relations': 'yes', 'decode_owl': 'no'},
+                 {'construction': 'instance', 'inverse_relations': 'yes', 'decode_owl': 'no'}]
+        owl_tools: A string pointing to the location of the owl tools library or None to use the default location.
+        **kwargs: The arguments shared by all variants, which are passed to build (e.g. kg_version, write_location,
+            edge_data, kg_metadata_flag, node_data, cache, storage, cpus, and telemetry).
+
+    Returns:
+        A list of strings containing the filepath of the knowledge graph built for each variant.
 
-        return None
+    Raises:
+        ValueError: If variants is empty or more than one variant builds the same knowledge graph.
+        RuntimeError: If the build of a variant fails.
+    """
+
+    if len(variants) == 0:
+        raise ValueError('variants must contain at least one knowledge graph variant')
+    shares_inputs = len(variants) > 1 and not issubclass(build, PostClosureBuild) and \
+        'fork' in multiprocessing.get_all_start_methods()
+
+    try:
+        if shares_inputs:  # read the master edge list once
+            with open(kwargs['edge_data'], 'r') as edge_filepath:
+                variant_build_state['edge_dict'] = (kwargs['edge_data'], json.load(edge_filepath))
+        builders = [build(**dict(kwargs, **variant)) for variant in variants]
+        if len(set(kg.construct_approach for kg in builders)) > 1:  # filenames do not include construction approach
+            for kg in builders:
+                kg_dir, kg_name = kg.full_kg.rsplit('/', 1)
+                kg_name = '_'.join(kg_name.split('_')[:2] + [kg.construct_approach.title()] + kg_name.split('_')[2:])
+                kg.full_kg = kg_dir + '/' + kg_name
+                kg.stage_cache = StageCache(kg.write_location + kg.full_kg[:-4] + '_StageCache.json',
+                                            enabled=kg.stage_cache.enabled)
+                kg.triple_store = kg.write_location + kg.full_kg[:-4] + '_TripleStore.db'
+        kg_files = [kg.write_location + kg.full_kg for kg in builders]
+        if len(set(kg_files)) != len(kg_files):
+            raise ValueError('each variant must build a different knowledge graph')
+        for kg in builders:
+            if owl_tools: kg.owl_tools = owl_tools
+
+        if not shares_inputs:
+            for kg in builders:
+                kg.construct_knowledge_graph()
+        else:
+            # merge the ontologies (if needed) and read them once
+            loader = builders[0]
+            if not os.path.exists(loader.merged_ont_kg):
+                print('*** Merging Ontology Data ***')
+                merges_ontologies(loader.ontologies, loader.write_location, '/PheKnowLator_MergedOntologies.owl',
+                                  loader.owl_tools)
+                for kg in builders:
+                    kg.merged_ont_kg = loader.write_location + '/PheKnowLator_MergedOntologies.owl'
+            print('*** Loading Merged Ontologies for {} Knowledge Graph Variants ***'.format(len(builders)))
+            storage, loader.storage = loader.storage, 'memory'
+            loader.loads_merged_ontologies()
+            variant_build_state['merged_ontologies'] = (loader.merged_ont_kg, loader.graph, loader.ont_classes,
+                                                        loader.obj_properties)
+            loader.storage, loader.graph = storage, Graph()
+
+            # build each variant in a forked process - shared objects are excluded from garbage collection so they are
+            # not written to (and copied) when the collector runs in the child processes (gc.freeze needs Python 3.7)
+            if hasattr(gc, 'freeze'): gc.freeze()
+            for kg, kg_file in zip(builders, kg_files):
+                print('\n### Building Knowledge Graph Variant: {} ###'.format(kg_file.split('/')[-1]))
+                process = multiprocessing.get_context('fork').Process(target=kg.construct_knowledge_graph)
+                process.start()
+                process.join()
+                if process.exitcode != 0:
+                    raise RuntimeError('The build of knowledge graph variant {} failed'.format(kg_file))
+    finally:
+        variant_build_state.clear()
+        if hasattr(gc, 'unfreeze'): gc.unfreeze()
+
+    return kg_files
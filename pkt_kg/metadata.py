@@ -16,6 +16,8 @@ from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
 from typing import Dict, List, Optional, Union
 
+from pkt_kg.utils import BuildTelemetry, writes_parquet
+
 
 class Metadata(object):
     """Class helps manage knowledge graph metadata.
@@ -34,16 +36,18 @@ class Metadata(object):
                           'Synonym': 'HHG1|HLP3|HPE3|MCOPCB5|SMMCI|ShhNC|TPT|TPTPS|sonic hedgehog protein'
                           },
                 }
+        telemetry: A BuildTelemetry object used to record the time and memory used to process node metadata.
     """
 
     def __init__(self, kg_version: str, write_location: str, kg_location: str, node_data: Optional[List],
-                 node_dict: Optional[Dict]) -> None:
+                 node_dict: Optional[Dict], telemetry: Optional[BuildTelemetry] = None) -> None:
 
         self.kg_version = kg_version
         self.write_location = write_location
         self.full_kg = kg_location
         self.node_data = node_data
         self.node_dict = node_dict
+        self.telemetry = telemetry if telemetry is not None else BuildTelemetry()
 
     def node_metadata_processor(self) -> None:
         """Processes a directory of node data sets by reading in each data set and then converting the read in data
@@ -72,19 +76,21 @@ class Metadata(object):
         if self.node_data:
             print('Loading and Processing Node Metadata')
 
-            # create list where first item is edge type and the second item is the df
-            dfs = [[re.sub('.*/', '', re.sub('((_[^/]*)_.*$)', '', x)),
-                    pandas.read_csv(x, header=0, delimiter='\t')] for x in self.node_data]
+            with self.telemetry.records_stage('node_metadata_processor') as record:
+                # create list where first item is edge type and the second item is the df
+                dfs = [[re.sub('.*/', '', re.sub('((_[^/]*)_.*$)', '', x)),
+                        pandas.read_csv(x, header=0, delimiter='\t')] for x in self.node_data]
 
-            # convert each data frame to dictionary, using the "ID" column as the index
-            for i in range(0, len(dfs)):
-                df_processed = dfs[i][1].astype(str)
-                df_processed.drop_duplicates(keep='first', inplace=True)
-                df_processed.set_index('ID', inplace=True)
-                df_dict = df_processed.to_dict('index')
+                # convert each data frame to dictionary, using the "ID" column as the index
+                for i in range(0, len(dfs)):
+                    df_processed = dfs[i][1].astype(str)
+                    df_processed.drop_duplicates(keep='first', inplace=True)
+                    df_processed.set_index('ID', inplace=True)
+                    df_dict = df_processed.to_dict('index')
 
-                # add data frame to master node metadata dictionary
-                self.node_dict[dfs[i][0]] = df_dict  # type: ignore
+                    # add data frame to master node metadata dictionary
+                    self.node_dict[dfs[i][0]] = df_dict  # type: ignore
+                record['items'] = sum(len(x[1]) for x in dfs)
 
     def creates_node_metadata(self, node: str, edge_type: str, url: str, graph: Graph) -> Graph:
         """Given a node in the knowledge graph, if the node has metadata information, new edges are created to add
@@ -275,43 +281,54 @@ class Metadata(object):
 
         return None
 
-    def output_knowledge_graph_metadata(self, graph: Graph) -> None:
+    def output_knowledge_graph_metadata(self, graph: Graph, output_parquet: bool = False) -> None:
         """Loops over the self.node_dict dictionary and writes out the data to a file locally. The data is stored as
         a tab-delimited '.txt' file with four columns: (1) node identifier; (2) node label; (3) node description or
-        definition; and (4) node synonym.
+        definition; and (4) node synonym. If output_parquet is True, the same data is also written to a '.parquet'
+        file (see writes_parquet()).
 
         Args:
             graph: A rdflib graph object.
+            output_parquet: A bool indicating whether or not to also write the node metadata as Parquet.
 
         Returns:
             None.
         """
 
         # add metadata for nodes that are data type class to self.node_dict
-        self.extracts_class_metadata(graph)
+        with self.telemetry.records_stage('extracts_class_metadata', items=len(graph)) as record:
+            self.extracts_class_metadata(graph)
+            record['triples'] = len(graph)
 
         if self.node_dict:
-            # create and write edge list data locally
-            print('\nWriting Class Metadata')
-            with open(self.write_location + self.full_kg[:-6] + 'NodeLabels.txt', 'w') as outfile:
-                outfile.write('node_id' + '\t' + 'label' + '\t' + 'description/definition' + '\t' + 'synonym' + '\n')
-
-                for edge_type in tqdm(self.node_dict.keys()):
-                    for node in self.node_dict[edge_type]:
-                        node_id = node
-                        label = self.node_dict[edge_type][node]['Label']
-                        desc = self.node_dict[edge_type][node]['Description']
-                        syn_list = self.node_dict[edge_type][node]['Synonym']
-
-                        if isinstance(syn_list, list) and len(syn_list) > 1:
-                            syn = '|'.join(syn_list)
-                        elif isinstance(syn_list, list) and len(syn_list) == 1:
-                            syn = syn_list[0]
-                        else:
-                            syn = syn_list
-
-                        outfile.write(node_id + '\t' + label + '\t' + desc + '\t' + syn + '\n')
-            outfile.close()
+            with self.telemetry.records_stage('output_knowledge_graph_metadata') as record:
+                # create and write edge list data locally
+                print('\nWriting Class Metadata')
+                columns, rows = ['node_id', 'label', 'description/definition', 'synonym'], []
+                with open(self.write_location + self.full_kg[:-6] + 'NodeLabels.txt', 'w') as outfile:
+                    outfile.write('\t'.join(columns) + '\n')
+
+                    for edge_type in tqdm(self.node_dict.keys()):
+                        for node in self.node_dict[edge_type]:
+                            node_id = node
+                            label = self.node_dict[edge_type][node]['Label']
+                            desc = self.node_dict[edge_type][node]['Description']
+                            syn_list = self.node_dict[edge_type][node]['Synonym']
+
+                            if isinstance(syn_list, list) and len(syn_list) > 1:
+                                syn = '|'.join(syn_list)
+                            elif isinstance(syn_list, list) and len(syn_list) == 1:
+                                syn = syn_list[0]
+                            else:
+                                syn = syn_list
+
+                            outfile.write(node_id + '\t' + label + '\t' + desc + '\t' + syn + '\n')
+                            if output_parquet: rows.append((node_id, label, desc, syn))
+                outfile.close()
+                if output_parquet:
+                    writes_parquet(pandas.DataFrame(rows, columns=columns),
+                                   self.write_location + self.full_kg[:-6] + 'NodeLabels.parquet')
+                record['items'] = sum(len(self.node_dict[x]) for x in self.node_dict.keys())
 
         return None
 
@@ -3,7 +3,6 @@
 
 # import needed libraries
 import glob
-import networkx   # type: ignore
 import os
 import os.path
 import pickle
@@ -14,7 +13,7 @@ from rdflib.namespace import RDF, RDFS, OWL  # type: ignore
 from tqdm import tqdm  # type: ignore
 from typing import Any, Dict, IO, List, Optional, Set, Tuple
 
-from pkt_kg.utils import adds_edges_to_graph, gets_ontology_classes
+from pkt_kg.utils import BuildTelemetry, adds_edges_to_graph, gets_ontology_classes
 
 
 class OwlNets(object):
@@ -36,7 +35,7 @@ class OwlNets(object):
         nx_mdg: A networkx graph object that contains the same edges as knowledge_graph.
         keep_properties: A list of owl:Property types to keep when filtering triples from knowledge graph.
         class_list: A list of owl classes from the input knowledge graph.
-
+        telemetry: A BuildTelemetry object used to record the time and memory used by each step of the pipeline.
 
     Raises:
         TypeError: If graph is not an rdflib.graph object.
@@ -45,8 +44,10 @@ class OwlNets(object):
         TypeError: If the file containing owl object properties is empty.
     """
 
-    def __init__(self, kg_construct_approach: str, graph: Graph, write_location: str, full_kg: str) -> None:
+    def __init__(self, kg_construct_approach: str, graph: Graph, write_location: str, full_kg: str,
+                 telemetry: Optional[BuildTelemetry] = None) -> None:
 
+        self.telemetry = telemetry if telemetry is not None else BuildTelemetry()
         self.kg_construct_approach = kg_construct_approach
         self.write_location = write_location
         self.res_dir = os.path.relpath('/'.join(self.write_location.split('/')[:-1]))
@@ -60,12 +61,15 @@ class OwlNets(object):
         else:
             self.graph = graph
 
-        # convert RDF graph to networkx MultiDiGraph
+        # convert RDF graph to networkx MultiDiGraph (networkx is only imported when owl semantics are removed)
+        import networkx  # type: ignore
         print('\nConverting knowledge graph to MultiDiGraph. Note, this process can take up to 20 minutes.')
         self.nx_mdg: networkx.MultiDiGraph = networkx.MultiDiGraph()
 
-        for s, p, o in tqdm(self.graph):
-            self.nx_mdg.add_edge(s, o, **{'key': p})
+        with self.telemetry.records_stage('owl_nets/converts_to_multidigraph', items=len(self.graph)) as record:
+            for s, p, o in tqdm(self.graph):
+                self.nx_mdg.add_edge(s, o, **{'key': p})
+            record['triples'] = self.nx_mdg.number_of_edges()
 
         # set a list of owl:Property types to keep when filtering triples from knowledge graph
         file_name = self.res_dir + '/owl_decoding/*Property*'
@@ -470,15 +474,24 @@ class OwlNets(object):
         print('\nCreating OWL-NETS graph')
 
         # check if instance build and if so, rollback identifiers
-        if self.kg_construct_approach == 'instance': self.updates_class_instance_identifiers()
+        if self.kg_construct_approach == 'instance':
+            with self.telemetry.records_stage('owl_nets/updates_class_instance_identifiers') as record:
+                self.updates_class_instance_identifiers()
+                record['triples'] = len(self.graph)
 
         # decode owl-encoded class and prune OWL triples
-        filtered_graph = self.removes_edges_with_owl_semantics()  # filter out owl-encoded triples from original KG
-        self.graph = self.cleans_owl_encoded_classes()  # decode owl constructors and restrictions
-        owl_nets = filtered_graph + self.removes_edges_with_owl_semantics()  # prune bad triples from decoded classes
+        with self.telemetry.records_stage('owl_nets/removes_edges_with_owl_semantics', items=len(self.graph)) as record:
+            filtered_graph = self.removes_edges_with_owl_semantics()  # filter out owl-encoded triples from original KG
+            record['triples'] = len(filtered_graph)
+        with self.telemetry.records_stage('owl_nets/cleans_owl_encoded_classes', items=len(self.class_list)) as record:
+            self.graph = self.cleans_owl_encoded_classes()  # decode owl constructors and restrictions
+            owl_nets = filtered_graph + self.removes_edges_with_owl_semantics()  # prune decoded classes
+            record['triples'] = len(owl_nets)
 
         # write out owl-nets graph
-        file_name = self.write_location + '/' + self.full_kg[:-21] + 'OWLNETS.owl'
-        owl_nets.serialize(destination=file_name, format='xml')
+        file_name = self.write_location + self.full_kg[:-21] + 'OWLNETS.owl'
+        with self.telemetry.records_stage('owl_nets/serializes_graph', items=len(owl_nets)) as record:
+            owl_nets.serialize(destination=file_name, format='xml')
+            record['triples'] = len(owl_nets)
 
         return owl_nets
@@ -4,6 +4,10 @@
 
 from .data_utils import *
 from .kg_utils import *
+from .cache_utils import *
+from .store_utils import *
+from .telemetry_utils import *
+from .output_utils import *
 
 
 __all__ = ['url_download', 'ftp_url_download', 'gzipped_ftp_url_download', 'zipped_url_download',
@@ -11,4 +15,11 @@ __all__ = ['url_download', 'ftp_url_download', 'gzipped_ftp_url_download', 'zipp
            'metadata_api_mapper', 'mesh_finder', 'genomic_id_mapper', 'outputs_dictionary_data',
            'gets_ontology_statistics', 'gets_ontology_classes', 'gets_deprecated_ontology_classes',
            'gets_object_properties', 'merges_ontologies', 'ontology_file_formatter', 'adds_edges_to_graph',
-           'finds_node_type', 'maps_node_ids_to_integers', 'converts_rdflib_to_networkx']
+           'finds_node_type', 'maps_node_ids_to_integers', 'encodes_triples', 'writes_integer_triples',
+           'writes_identifier_triples', 'writes_node_id_map', 'converts_rdflib_to_networkx', 'hashes_file',
+           'hashes_build_inputs', 'StageCache', 'EdgeTypeCache', 'writes_graph_cache', 'loads_graph_cache',
+           'MappingLookup', 'MappingDataCache', 'SQLiteStore', 'creates_graph', 'gets_resource_usage', 'BuildTelemetry',
+           'NTriplesWriter', 'reads_ntriples', 'writes_csr_adjacency', 'writes_encoded_csr_adjacency',
+           'loads_csr_adjacency', 'CSRAdjacency', 'writes_binary_triples', 'loads_binary_triples', 'BinaryTriples',
+           'writes_identifier_map', 'loads_identifier_map', 'IdentifierMap', 'reads_identifier_map',
+           'writes_typed_edges', 'loads_typed_edges', 'TypedEdges', 'writes_parquet']
@@ -0,0 +1,539 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Build Cache Utility Functions.
+
+Fingerprints Build Inputs
+* hashes_file
+* hashes_build_inputs
+
+Checkpoints Build Stages
+* StageCache
+* EdgeTypeCache
+
+Caches Parsed Graphs
+* writes_graph_cache
+* loads_graph_cache
+
+Caches Identifier Mapping Data
+* MappingLookup
+* MappingDataCache
+"""
+
+# import needed libraries
+import hashlib
+import json
+import numpy  # type: ignore
+import os
+import os.path
+import pandas  # type: ignore
+
+from collections import OrderedDict
+from rdflib import Graph  # type: ignore
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pkt_kg.utils.store_utils import SQLiteStore
+
+
+def hashes_file(file_path: str, chunk_size: int = 1048576) -> str:
+    """Computes a sha256 digest of a file's contents. The file is read in fixed-size chunks so that very large
+    ontology and edge files can be fingerprinted without reading them into memory.
+
+    Args:
+        file_path: A string containing a filepath.
+        chunk_size: An integer specifying the number of bytes to read at a time.
+
+    Returns:
+        A string containing the hexadecimal sha256 digest of the file.
+
+    Raises:
+        OSError: If file_path points to a non-existent file.
+    """
+
+    if not os.path.exists(file_path):
+        raise OSError('The {} file does not exist!'.format(file_path))
+    else:
+        file_hash = hashlib.sha256()
+
+        with open(file_path, 'rb') as input_file:
+            for chunk in iter(lambda: input_file.read(chunk_size), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+
+def hashes_build_inputs(inputs: List[Any], file_hashes: Optional[Dict] = None) -> str:
+    """Computes a single sha256 digest over a list of build inputs. Inputs which are paths to existing files are
+    represented by the hash of their contents and all other inputs (e.g. flags, version strings, or lists of
+    strings) are represented by their json serialization.
+
+    Args:
+        inputs: A list of build inputs (e.g. ['resources/ontologies/go_with_imports.owl', 'subclass', 'yes']).
+        file_hashes: A dictionary used to memoize file hashes, keyed by the absolute filepath. Each value is a dict
+            storing the file's size, modification time, and digest. For example:
+                {'/resources/Master_Edge_List_Dict.json': {'size': 1062, 'mtime': 1591632024.0, 'hash': '3a7f...'}}
+
+    Returns:
+        A string containing the hexadecimal sha256 digest of the inputs.
+    """
+
+    input_hash = hashlib.sha256()
+
+    for item in inputs:
+        if isinstance(item, str) and os.path.isfile(item):
+            path, stats = os.path.abspath(item), os.stat(item)
+            memo = file_hashes.get(path) if file_hashes is not None else None
+
+            if memo and memo['size'] == stats.st_size and memo['mtime'] == stats.st_mtime:
+                digest = memo['hash']
+            else:
+                digest = hashes_file(item)
+                if file_hashes is not None:
+                    file_hashes[path] = {'size': stats.st_size, 'mtime': stats.st_mtime, 'hash': digest}
+
+            input_hash.update(('file:' + digest).encode('utf-8'))
+        else:
+            input_hash.update(('value:' + json.dumps(item, sort_keys=True, default=str)).encode('utf-8'))
+
+    return input_hash.hexdigest()
+
+
+class StageCache(object):
+    """Class checkpoints the stages of a knowledge graph build so that an interrupted or repeated build can skip every
+    stage whose inputs are unchanged and resume at the first stage that is no longer valid.
+
+    Each stage is keyed by a hash of its inputs and of the key of the stage that preceded it, which means that once a
+    stage is invalidated every downstream stage is invalidated with it. A stage is only considered valid if its key
+    matches the key recorded in the manifest and all of the output files recorded for it still exist with the same
+    size.
+
+    Attributes:
+        cache_file: A string containing the filepath of the json manifest which stores the stage checkpoints.
+        enabled: A bool indicating whether or not stages can be skipped and new checkpoints should be recorded.
+        manifest: A nested dictionary storing the recorded stages and memoized file hashes. For example:
+            {'stages': {'run_owl_nets': {'key': '9c1e...',
+                                         'outputs': {'resources/knowledge_graphs/PheKnowLator_OWLNETS.owl': 10}}},
+             'files': {'/resources/ontologies/hp_with_imports.owl': {'size': 10, 'mtime': 1591632024.0, 'hash': 'ab..'}}
+            }
+        stage_keys: A dictionary storing the key computed for each stage during the current build.
+        upstream_key: A string containing the key of the most recently keyed stage.
+    """
+
+    def __init__(self, cache_file: str, enabled: bool = True) -> None:
+
+        self.cache_file = cache_file
+        self.enabled = enabled
+        self.manifest: Dict = {'stages': {}, 'files': {}}
+        self.stage_keys: Dict = dict()
+        self.upstream_key: str = ''
+
+        if self.enabled and os.path.exists(self.cache_file) and os.stat(self.cache_file).st_size != 0:
+            with open(self.cache_file, 'r') as filepath:
+                self.manifest = json.load(filepath)
+
+    def creates_stage_key(self, stage: str, inputs: List[Any]) -> str:
+        """Creates the key for a build stage. The key combines the stage name, the stage inputs, and the key of the
+        preceding stage. Stages must therefore be keyed in the order that they are run.
+
+        Args:
+            stage: A string containing the name of a build stage (e.g. 'creates_knowledge_graph_edges').
+            inputs: A list of build inputs. See hashes_build_inputs() for more information.
+
+        Returns:
+            A string containing the stage key.
+        """
+
+        key = hashes_build_inputs([stage, self.upstream_key] + inputs, self.manifest['files'])
+        self.stage_keys[stage], self.upstream_key = key, key
+
+        return key
+
+    def checks_stage(self, stage: str) -> bool:
+        """Determines whether a previously recorded stage can be skipped.
+
+        Args:
+            stage: A string containing the name of a build stage that has already been keyed.
+
+        Returns:
+            True - if the stage was recorded with the same key and all of its outputs are present.
+            False - if caching is disabled, the stage was never recorded, its inputs changed, or an output is missing.
+        """
+
+        record = self.manifest['stages'].get(stage)
+
+        if not self.enabled or record is None or record['key'] != self.stage_keys.get(stage):
+            return False
+        else:
+            return all(os.path.exists(x) and os.stat(x).st_size == size for x, size in record['outputs'].items())
+
+    def records_stage(self, stage: str, outputs: List[str]) -> None:
+        """Records a completed stage and its output files and writes the manifest to disk. The manifest is first
+        written to a temporary file and then moved into place so that a crash cannot leave a corrupt manifest.
+
+        Args:
+            stage: A string containing the name of a build stage that has already been keyed.
+            outputs: A list of filepaths written by the stage.
+
+        Returns:
+            None.
+        """
+
+        if self.enabled:
+            self.manifest['stages'][stage] = {'key': self.stage_keys[stage],
+                                              'outputs': {x: os.stat(x).st_size for x in outputs if os.path.exists(x)}}
+
+            with open(self.cache_file + '.tmp', 'w') as filepath:
+                json.dump(self.manifest, filepath, indent=2)
+            os.replace(self.cache_file + '.tmp', self.cache_file)
+
+        return None
+
+
+def writes_graph_cache(graph: Union[Graph, Iterable[Tuple]], cache_file: str, source_hash: str) -> None:
+    """Writes a compact binary encoding of an rdflib graph, which can be read back in a fraction of the time it takes
+    to parse the RDF/XML file the graph was created from. The encoding consists of a term dictionary, stored as the
+    utf-8 bytes of all terms and the offset of each term, and an integer array with one (subject, predicate, object)
+    row of term indices per triple. The file is written to a temporary file and then moved into place so that a crash
+    cannot leave a partially written cache.
+
+    Args:
+        graph: An rdflib graph object or any other iterable of triples (e.g. a set of triples).
+        cache_file: A string containing the filepath to write the cache to (e.g. 'PheKnowLator_MergedOntologies.npz').
+        source_hash: A string containing the hash of the file the graph was parsed from, which is stored in the cache
+            and used by loads_graph_cache() to detect a stale cache.
+
+    Returns:
+        None.
+    """
+
+    term_ids: Dict = dict()
+    triples: List = []
+
+    for triple in graph:
+        triples.extend(term_ids.setdefault(SQLiteStore.encodes_term(x), len(term_ids)) for x in triple)
+
+    encoded_terms = [x.encode('utf-8') for x in term_ids.keys()]
+    offsets = numpy.cumsum([0] + [len(x) for x in encoded_terms], dtype=numpy.int64)
+
+    with open(cache_file + '.tmp', 'wb') as output_file:
+        numpy.savez(output_file, source_hash=numpy.array(source_hash),
+                    terms=numpy.frombuffer(b''.join(encoded_terms), dtype=numpy.uint8), offsets=offsets,
+                    triples=numpy.array(triples, dtype=numpy.uint32).reshape(-1, 3))
+    os.replace(cache_file + '.tmp', cache_file)
+
+    return None
+
+
+def loads_graph_cache(graph: Graph, cache_file: str, source_hash: str) -> bool:
+    """Adds the triples stored in a binary graph cache, written by writes_graph_cache(), to an rdflib graph.
+
+    Args:
+        graph: An rdflib graph object.
+        cache_file: A string containing the filepath of the cache.
+        source_hash: A string containing the hash of the file the graph would otherwise be parsed from.
+
+    Returns:
+        True - if the cache exists and was created from a file with the same hash and its triples were added to graph.
+        False - if the cache does not exist, is unreadable, or is stale, in which case graph is not modified.
+    """
+
+    if not os.path.exists(cache_file):
+        return False
+    else:
+        try:
+            with numpy.load(cache_file) as cache:
+                if str(cache['source_hash']) != source_hash: return False
+                terms, offsets, triples = cache['terms'].tobytes(), cache['offsets'], cache['triples']
+        except (OSError, KeyError, ValueError):
+            return False
+
+        term_list = [SQLiteStore.decodes_term(terms[offsets[i]:offsets[i + 1]].decode('utf-8'))
+                     for i in range(len(offsets) - 1)]
+        graph.addN((term_list[s], term_list[p], term_list[o], graph) for s, p, o in triples.tolist())
+
+        return True
+
+
+class EdgeTypeCache(object):
+    """Class stores the triples that each edge type contributed to a knowledge graph build, so that a later build
+    only needs to construct the edge types whose data changed. The triples of every other edge type are read back
+    from the cache and added to the merged ontologies.
+
+    Each edge type is keyed by a fingerprint of its edge_dict entry (i.e. its edge list and resource_info.txt fields).
+    The cache as a whole is keyed by a base key computed from the inputs that are shared by all edge types (e.g. the
+    merged ontologies, the subclass_dict, and the construction approach) and is discarded when any of them change.
+    The triples for each edge type are written with writes_graph_cache() to a file named after the edge type.
+
+    Attributes:
+        base_key: A string containing the key of the inputs shared by all edge types.
+        cache_dir: A string containing the filepath of the directory that stores the cached edge types.
+        enabled: A bool indicating whether or not cached edge types can be reused and new edge types recorded.
+        manifest: A nested dictionary storing the key of each cached edge type, the number of unique triples it
+            contributed, the edges that were removed from its edge list, and the nodes which could not be mapped to
+            the subclass_dict. For example:
+                {'base_key': '7d1f...',
+                 'edge_types': {'gene-phenotype': {'key': '9c1e...', 'triples': 1020,
+                                                   'rejected_edges': [['2', 'HP_0002511']], 'subclass_errors': ['2']}}}
+    """
+
+    def __init__(self, cache_dir: str, base_key: str, enabled: bool = True) -> None:
+
+        self.base_key = base_key
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.manifest: Dict = {'base_key': base_key, 'edge_types': {}}
+
+        manifest_file = self.cache_dir + '/manifest.json'
+        if self.enabled and os.path.exists(manifest_file) and os.stat(manifest_file).st_size != 0:
+            with open(manifest_file, 'r') as filepath:
+                manifest = json.load(filepath)
+            if manifest['base_key'] == self.base_key: self.manifest = manifest
+
+    @staticmethod
+    def creates_edge_type_key(edge_info: Dict) -> str:
+        """Creates the key for an edge type from its edge_dict entry.
+
+        Args:
+            edge_info: A dict containing an edge type's edge_dict entry. For example:
+                {'data_type': 'entity-class', 'edge_relation': 'RO_0003302', 'uri': [...], 'edge_list': [...]}
+
+        Returns:
+            A string containing the edge type key.
+        """
+
+        return hashes_build_inputs([edge_info])
+
+    def checks_edge_type(self, edge_type: str, key: str) -> bool:
+        """Determines whether the triples for an edge type can be reused.
+
+        Args:
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            key: A string containing the key created for the edge type by creates_edge_type_key().
+
+        Returns:
+            True - if the edge type was recorded with the same key and its triples are present.
+            False - if caching is disabled, the edge type was never recorded, or its data changed.
+        """
+
+        record = self.manifest['edge_types'].get(edge_type)
+
+        if not self.enabled or record is None or record['key'] != key:
+            return False
+        else:
+            return os.path.exists(self.cache_dir + '/' + edge_type + '.npz')
+
+    def loads_edge_type(self, edge_type: str, graph: Graph) -> Tuple[Set, List, int]:
+        """Adds the cached triples for an edge type to a graph.
+
+        Args:
+            edge_type: A string containing the name of an edge_type which passed checks_edge_type().
+            graph: An rdflib graph object.
+
+        Returns:
+            rejected_edges: A set of edge tuples that were removed from the edge type's edge list.
+            subclass_errors: A list of the edge type's nodes that could not be mapped to the subclass_dict.
+            triple_count: An integer containing the number of unique triples contributed by the edge type.
+
+        Raises:
+            ValueError: If the cached triples could not be read.
+        """
+
+        record = self.manifest['edge_types'][edge_type]
+
+        if not loads_graph_cache(graph, self.cache_dir + '/' + edge_type + '.npz', record['key']):
+            raise ValueError('The cached triples for the {} edge type could not be read'.format(edge_type))
+        else:
+            return set(tuple(x) for x in record['rejected_edges']), record['subclass_errors'], record['triples']
+
+    def records_edge_type(self, edge_type: str, key: str, triples: Set, rejected_edges: Set,
+                          subclass_errors: List) -> None:
+        """Writes the triples contributed by an edge type and records the edge type in the manifest.
+
+        Args:
+            edge_type: A string containing the name of the edge_type (e.g. "gene-disease", "chemical-gene").
+            key: A string containing the key created for the edge type by creates_edge_type_key().
+            triples: A set of the triples contributed by the edge type.
+            rejected_edges: A set of edge tuples that were removed from the edge type's edge list.
+            subclass_errors: A list of the edge type's nodes that could not be mapped to the subclass_dict.
+
+        Returns:
+            None.
+        """
+
+        if self.enabled:
+            if not os.path.isdir(self.cache_dir): os.mkdir(self.cache_dir)
+            writes_graph_cache(triples, self.cache_dir + '/' + edge_type + '.npz', key)
+            self.manifest['edge_types'][edge_type] = {'key': key, 'triples': len(triples),
+                                                      'rejected_edges': sorted(rejected_edges),
+                                                      'subclass_errors': subclass_errors}
+
+        return None
+
+    def writes_manifest(self, edge_types: List[str]) -> None:
+        """Removes any cached edge types that are no longer part of the build and writes the manifest to disk. The
+        manifest is first written to a temporary file and then moved into place so that a crash cannot leave a corrupt
+        manifest.
+
+        Args:
+            edge_types: A list of the edge types included in the current build.
+
+        Returns:
+            None.
+        """
+
+        if self.enabled and os.path.isdir(self.cache_dir):
+            for edge_type in set(self.manifest['edge_types'].keys()) - set(edge_types):
+                del self.manifest['edge_types'][edge_type]
+                if os.path.exists(self.cache_dir + '/' + edge_type + '.npz'):
+                    os.remove(self.cache_dir + '/' + edge_type + '.npz')
+
+            with open(self.cache_dir + '/manifest.json.tmp', 'w') as filepath:
+                json.dump(self.manifest, filepath, indent=2)
+            os.replace(self.cache_dir + '/manifest.json.tmp', self.cache_dir + '/manifest.json')
+
+        return None
+
+
+class MappingLookup(object):
+    """Class stores an identifier mapping data set as a lookup from each identifier to the identifiers it maps to. The
+    lookup is built once and can then map any number of identifier columns (e.g. the same mapping file used by several
+    edge types) without re-hashing the mapping data: the identifiers are stored in a Pandas Index, whose hash table is
+    built the first time it is searched, and the identifiers they map to are stored in a single array, grouped by
+    identifier in the order they appear in the mapping data. For example:
+        lookup = MappingLookup(['MESH_D1', 'MESH_D2', 'MESH_D1'], ['CHEBI_1', 'CHEBI_2', 'CHEBI_3'])
+        rows, identifiers = lookup.maps(['MESH_D1', 'MESH_D3'])  # [0, 0], ['CHEBI_1', 'CHEBI_3']
+
+    Attributes:
+        index: A Pandas Index of the unique identifiers in the first column of the mapping data.
+        offsets: A numpy array, where index[i] maps to the identifiers in values[offsets[i]:offsets[i + 1]].
+        values: A numpy array of the identifiers in the second column of the mapping data, grouped by identifier.
+    """
+
+    def __init__(self, keys: Iterable[str], values: Iterable[str]) -> None:
+
+        codes, uniques = pandas.factorize(numpy.asarray(list(keys), dtype=object))
+        self.index: pandas.Index = pandas.Index(uniques, dtype=object)
+        counts = numpy.bincount(codes, minlength=len(uniques))
+        self.offsets: numpy.ndarray = numpy.concatenate([[0], numpy.cumsum(counts)])
+        self.values: numpy.ndarray = numpy.asarray(list(values), dtype=object)[numpy.argsort(codes, kind='stable')]
+
+    def __len__(self) -> int:
+
+        return len(self.values)
+
+    def maps(self, identifiers: Iterable[str]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Maps a sequence of identifiers like an inner join: an identifier is repeated once for each identifier it
+        maps to and is removed if it does not map to any identifier.
+
+        Args:
+            identifiers: A sequence of strings (e.g. a column of a Pandas DataFrame) containing the identifiers to map.
+
+        Returns:
+            A tuple containing a numpy array of the position in identifiers of each mapped identifier and a numpy array
+            of the identifiers they were mapped to, in the order of identifiers.
+        """
+
+        codes = self.index.get_indexer(identifiers)
+        rows = numpy.flatnonzero(codes >= 0)
+        starts, counts = self.offsets[codes[rows]], numpy.diff(self.offsets)[codes[rows]]
+        positions = numpy.arange(counts.sum()) + numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+
+        return numpy.repeat(rows, counts), self.values[positions]
+
+    def memory_usage(self) -> int:
+        """Estimates the memory used by the lookup, including the strings it stores.
+
+        Returns:
+            An integer containing the size of the lookup in bytes.
+        """
+
+        return int(self.index.memory_usage(deep=True) + self.offsets.nbytes +
+                   pandas.Series(self.values).memory_usage(index=False, deep=True))
+
+
+class MappingDataCache(object):
+    """Class keeps the identifier mapping data sets read during a build in memory, so that a mapping file referenced
+    by several edge types (e.g. MESH_CHEBI_MAP.txt, which is used by every chemical edge type) is only read and parsed
+    once. The data sets are keyed by filepath. When the total size of the cached data sets exceeds the memory cap, the
+    least recently used data sets are evicted. A data set larger than the memory cap is returned without being cached.
+
+    Attributes:
+        loader: A function which reads the mapping data set stored at a filepath into a MappingLookup, so that the
+            lookup is only built once per file.
+        max_size_mb: A float containing the maximum total size, in megabytes, of the cached data sets.
+        cache: An ordered dictionary keyed by filepath whose values are tuples containing a cached data set and its
+            size in bytes. The least recently used data set is first.
+        size: An integer containing the total size in bytes of the cached data sets.
+        hits: An integer containing the number of data sets returned from the cache.
+        misses: An integer containing the number of data sets read by the loader.
+        evictions: An integer containing the number of data sets evicted to keep the cache under the memory cap.
+
+    Raises:
+        ValueError: If max_size_mb is negative.
+    """
+
+    def __init__(self, loader: Callable[[str], MappingLookup], max_size_mb: float = 1024.0) -> None:
+
+        if max_size_mb < 0: raise ValueError('max_size_mb must not be negative')
+        else: self.max_size_mb = max_size_mb
+        self.loader = loader
+        self.cache: OrderedDict = OrderedDict()
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def gets_data_size(data: MappingLookup) -> int:
+        """Estimates the memory used by a mapping data set, including the strings it stores.
+
+        Args:
+            data: A MappingLookup object.
+
+        Returns:
+            An integer containing the size of the data set in bytes.
+        """
+
+        return data.memory_usage()
+
+    def loads_mapping_data(self, file_path: str) -> MappingLookup:
+        """Returns the mapping data set stored at a filepath, reading it with the loader if it is not cached. The data
+        set is shared by every caller and must not be modified.
+
+        Args:
+            file_path: A string containing the filepath of a mapping data set.
+
+        Returns:
+            The mapping data set returned by the loader.
+        """
+
+        if file_path in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(file_path)
+
+            return self.cache[file_path][0]
+        else:
+            self.misses += 1
+            data = self.loader(file_path)
+            size, max_size = self.gets_data_size(data), int(self.max_size_mb * 1024 * 1024)
+            if size <= max_size:
+                while self.cache and self.size + size > max_size:
+                    self.size -= self.cache.popitem(last=False)[1][1]
+                    self.evictions += 1
+                self.cache[file_path] = (data, size)
+                self.size += size
+
+            return data
+
+    def clears(self) -> None:
+        """Removes every data set from the cache.
+
+        Returns:
+            None.
+        """
+
+        self.cache.clear()
+        self.size = 0
+
+        return None
@@ -16,6 +16,10 @@ Interacts with Knowledge Graphs
 
 Writes Triple Lists
 * maps_node_ids_to_integers
+* encodes_triples
+* writes_integer_triples
+* writes_identifier_triples
+* writes_node_id_map
 
 File Type Conversion
 * converts_rdflib_to_networkx
@@ -24,13 +28,15 @@ File Type Conversion
 # import needed libraries
 import glob
 import json
-import networkx  # type: ignore
+import numpy  # type: ignore
 import os
 import os.path
+import pandas  # type: ignore
 from rdflib import Graph, URIRef  # type: ignore
 from rdflib.namespace import RDF, OWL  # type: ignore
 import subprocess
 
+from pkt_kg.utils.output_utils import reads_identifier_map, writes_binary_triples, writes_identifier_map, writes_parquet
 from tqdm import tqdm  # type: ignore
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -50,15 +56,8 @@ def gets_ontology_classes(graph: Graph) -> Set:
 
     print('\nQuerying Knowledge Graph to Obtain all OWL:Class Nodes')
 
-    # find all classes in graph
-    kg_classes = graph.query(
-        """SELECT DISTINCT ?c
-             WHERE {?c rdf:type owl:Class . }
-        """, initNs={'rdf': RDF, 'owl': OWL}
-    )
-
-    # convert results to list of classes
-    class_list = set([res[0] for res in tqdm(kg_classes) if isinstance(res[0], URIRef)])
+    # find all classes in graph - a triple pattern lookup uses the graph's indices instead of a SPARQL query
+    class_list = set([res for res in tqdm(graph.subjects(RDF.type, OWL.Class)) if isinstance(res, URIRef)])
 
     if len(class_list) > 0:
         return class_list
@@ -109,15 +108,9 @@ def gets_object_properties(graph: Graph) -> Set:
 
     print('\nQuerying Knowledge Graph to Obtain all OWL:ObjectProperty Nodes')
 
-    # find all classes in graph
-    kg_object_properties = graph.query(
-        """SELECT DISTINCT ?p
-             WHERE {?p rdf:type owl:ObjectProperty . }
-        """, initNs={'rdf': RDF, 'owl': OWL}
-    )
-
-    # convert results to list of classes
-    object_property_list = set([res[0] for res in tqdm(kg_object_properties) if isinstance(res[0], URIRef)])
+    # find all object properties in graph - a triple pattern lookup uses the graph's indices instead of a SPARQL query
+    object_property_list = set([res for res in tqdm(graph.subjects(RDF.type, OWL.ObjectProperty))
+                                if isinstance(res, URIRef)])
 
     if len(object_property_list) > 0:
         return object_property_list
@@ -293,7 +286,9 @@ def finds_node_type(edge_info: Dict) -> Dict:
     return nodes
 
 
-def maps_node_ids_to_integers(graph: Graph, write_location: str, output_ints: str, output_ints_map: str) -> None:
+def maps_node_ids_to_integers(graph: Graph, write_location: str, output_ints: str, output_ints_map: Optional[str],
+                              output_binary: Optional[str] = None, output_parquet: bool = False,
+                              output_binary_map: Optional[str] = None, previous_map: Optional[str] = None) -> None:
     """Loops over the knowledge graph in order to create three different types of files:
         - Integers: a tab-delimited `.txt` file containing three columns, one for each part of a triple (i.e.
         subject, predicate, object). The subject, predicate, and object identifiers have been mapped to integers.
@@ -301,69 +296,177 @@ def maps_node_ids_to_integers(graph: Graph, write_location: str, output_ints: st
         subject, predicate, object). Both the subject and object identifiers have not been mapped to integers.
         - Identifier-Integer Map: a `.json` file containing a dictionary where the keys are node identifiers and
         the values are integers.
+        - Binary Integers (optional): a memory-mappable `.npz` file containing the integer triples sorted by subject,
+        predicate, and object, which can be queried using loads_binary_triples() (see writes_binary_triples()).
+        - Parquet (optional): the Integers and Identifiers files are also written as `.parquet` files, whose
+        identifier columns are dictionary-encoded (see writes_parquet()).
+        - Binary Identifier-Integer Map (optional): a memory-mappable `.npz` file containing the sorted node
+        identifiers and their integers, which can be searched using loads_identifier_map() without reading the entire
+        map (see writes_identifier_map()).
+
+    The triples are encoded once (see encodes_triples()) and each file is then written from the encoded triples (see
+    writes_integer_triples(), writes_identifier_triples(), and writes_node_id_map()). The graph is not modified.
 
     Args:
         graph: An rdflib graph object.
         write_location: A string pointing to a local directory for writing data.
         output_ints: the name and file path to write out results.
-        output_ints_map: the name and file path to write out results.
+        output_ints_map: the name and file path to write out results or None to skip this file.
+        output_binary: the name and file path to write out the binary integer triples or None to skip this file.
+        output_parquet: A bool indicating whether or not to also write the Integers and Identifiers files as Parquet.
+        output_binary_map: the name and file path to write out the binary identifier map or None to skip this file.
+        previous_map: A string containing the filepath of an identifier map (`.json` or `.npz`) to seed the integers
+            from or None to assign integers from 1 (see encodes_triples()).
 
     Returns:
         None.
 
     Raises:
         ValueError: If the length of the graph is not the same as the number of extracted triples.
+        OSError: If the file referenced by previous_map does not exist.
+        ValueError: If the integers in previous_map are not the integers 1 to the number of identifiers.
     """
 
-    # create dictionary for mapping and list to write edges to
-    node_map, output_triples, node_counter = {}, 0, 0  # type: ignore
-    graph_len = len(graph)
+    codes, nodes = encodes_triples(graph, previous_map)
+    output_ids = '_'.join(output_ints.split('_')[:-1]) + '_Identifiers.txt'
+    writes_integer_triples(codes, write_location, output_ints, output_binary, output_parquet)
+    writes_identifier_triples(codes, nodes, write_location, output_ids, output_parquet)
+    writes_node_id_map(nodes, write_location, output_ints_map, output_binary_map)
+
+    return None
+
 
-    # build graph from input file and set counter
-    out_ints = open(write_location + output_ints, 'w')
-    out_ids = open(write_location + '_'.join(output_ints.split('_')[:-1]) + '_Identifiers.txt', 'w')
+def encodes_triples(graph: Graph, previous_map: Optional[str] = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Maps the subject, predicate, and object identifiers of every triple in a graph to integers. The triples are read
+    from the graph in a single pass, after which all of the identifiers are mapped to integers at once. Integers are
+    assigned in the order the identifiers first appear, reading each triple's subject, predicate, and object in turn.
+    The encoded triples are used by all of the edge list writers, so the graph is only read once.
 
-    # write file headers
-    out_ints.write('subject' + '\t' + 'predicate' + '\t' + 'object' + '\n')
-    out_ids.write('subject' + '\t' + 'predicate' + '\t' + 'object' + '\n')
+    When previous_map is provided (e.g. the identifier map of a previous release), identifiers in the previous map keep
+    their integers and new identifiers are given the integers that follow the largest integer in the previous map.
+    Identifiers in the previous map which are no longer in the graph are kept in the new map, so their integers are
+    never reused and the integers of the map are always 1 to the number of identifiers in it.
 
-    for edge in tqdm(graph):
-        if str(edge[0]) not in node_map:
-            node_counter += 1
-            node_map[str(edge[0])] = node_counter
-        if str(edge[1]) not in node_map:
-            node_counter += 1
-            node_map[str(edge[1])] = node_counter
-        if str(edge[2]) not in node_map:
-            node_counter += 1
-            node_map[str(edge[2])] = node_counter
+    Args:
+        graph: An rdflib graph object.
+        previous_map: A string containing the filepath of an identifier map (`.json` or `.npz`) to seed the integers
+            from or None to assign integers from 1.
+
+    Returns:
+        A tuple containing: (1) an integer array with shape (number of triples, 3), where each value is the integer
+        of an identifier minus 1; and (2) an object array of identifiers, where the identifier with integer i is at
+        index i - 1.
 
-        # convert edge labels to ints
-        subj, pred, obj = str(edge[0]), str(edge[1]), str(edge[2])
-        out_ints.write('%d' % node_map[subj] + '\t' + '%d' % node_map[pred] + '\t' + '%d' % node_map[obj] + '\n')
-        out_ids.write(subj + '\t' + pred + '\t' + obj + '\n')
+    Raises:
+        ValueError: If the length of the graph is not the same as the number of extracted triples.
+        OSError: If the file referenced by previous_map does not exist.
+        ValueError: If the integers in previous_map are not the integers 1 to the number of identifiers.
+    """
 
-        # update counter and delete edge
-        output_triples += 1
-        graph.remove(edge)
+    previous_nodes = reads_identifier_map(previous_map) if previous_map else None
+    graph_len = len(graph)
 
-    out_ints.close(), out_ids.close()
+    # read triples - each node identifier is converted to a string once, in subject, predicate, object order
+    identifiers = list(map(str, (node for edge in tqdm(graph, total=graph_len) for node in edge)))
 
     # CHECK - verify we get the number of edges that we would expect to get
-    if graph_len != output_triples:
+    if graph_len != len(identifiers) // 3:
         raise ValueError('ERROR: The number of triples is incorrect!')
-    else:
-        with open(write_location + '/' + output_ints_map, 'w') as file_name:
-            json.dump(node_map, file_name)
 
-    # clean up environment
-    del graph
+    # map node identifiers to integers
+    codes, nodes = pandas.factorize(numpy.array(identifiers, dtype=object), sort=False)
+    del identifiers
+    if previous_nodes is not None:  # keep the integers of known identifiers and append the new identifiers
+        node_codes = pandas.Index(previous_nodes).get_indexer(nodes)
+        new_nodes = node_codes == -1
+        node_codes[new_nodes] = numpy.arange(len(previous_nodes), len(previous_nodes) + new_nodes.sum())
+        codes, nodes = node_codes[codes], numpy.concatenate([numpy.array(previous_nodes, dtype=object),
+                                                             nodes[new_nodes]])
+
+    return codes.reshape(-1, 3), nodes
+
+
+def writes_integer_triples(codes: numpy.ndarray, write_location: str, output_ints: str,
+                           output_binary: Optional[str] = None, output_parquet: bool = False) -> None:
+    """Writes encoded triples (see encodes_triples()) to a tab-delimited `.txt` file with a subject, predicate, and
+    object column, containing the integer of each identifier, and optionally to a binary `.npz` file (see
+    writes_binary_triples()) and a `.parquet` file (see writes_parquet()).
+
+    Args:
+        codes: An integer array with shape (number of triples, 3) returned by encodes_triples().
+        write_location: A string pointing to a local directory for writing data.
+        output_ints: the name and file path to write out results.
+        output_binary: the name and file path to write out the binary integer triples or None to skip this file.
+        output_parquet: A bool indicating whether or not to also write the triples as Parquet.
+
+    Returns:
+        None.
+    """
+
+    int_triples = pandas.DataFrame(codes + 1, columns=['subject', 'predicate', 'object'])
+    with open(write_location + output_ints, 'w', buffering=1 << 20) as out_ints:
+        int_triples.to_csv(out_ints, sep='\t', index=False)
+    if output_binary: writes_binary_triples(int_triples.values, write_location + output_binary)
+    if output_parquet: writes_parquet(int_triples, write_location + output_ints[:-4] + '.parquet')
+
+    return None
+
+
+def writes_identifier_triples(codes: numpy.ndarray, nodes: numpy.ndarray, write_location: str, output_ids: str,
+                              output_parquet: bool = False) -> None:
+    """Writes encoded triples (see encodes_triples()) to a tab-delimited `.txt` file with a subject, predicate, and
+    object column, containing the identifiers of each triple, and optionally to a `.parquet` file whose columns are
+    dictionary-encoded using the identifiers (see writes_parquet()).
+
+    Args:
+        codes: An integer array with shape (number of triples, 3) returned by encodes_triples().
+        nodes: An array of identifiers returned by encodes_triples().
+        write_location: A string pointing to a local directory for writing data.
+        output_ids: the name and file path to write out results.
+        output_parquet: A bool indicating whether or not to also write the triples as Parquet.
+
+    Returns:
+        None.
+    """
+
+    with open(write_location + output_ids, 'w', buffering=1 << 20) as out_ids:
+        out_ids.write('subject' + '\t' + 'predicate' + '\t' + 'object' + '\n')
+        out_ids.writelines(subj + '\t' + pred + '\t' + obj + '\n' for subj, pred, obj in nodes[codes].tolist())
+    if output_parquet:  # the identifier columns share the categories created when mapping identifiers to integers
+        id_triples = pandas.DataFrame({col: pandas.Categorical.from_codes(codes[:, i], nodes)
+                                       for i, col in enumerate(['subject', 'predicate', 'object'])})
+        writes_parquet(id_triples, write_location + output_ids[:-4] + '.parquet')
+
+    return None
+
+
+def writes_node_id_map(nodes: numpy.ndarray, write_location: str, output_ints_map: Optional[str],
+                       output_binary_map: Optional[str] = None) -> None:
+    """Writes the map between identifiers and integers created by encodes_triples() to a `.json` file containing a
+    dictionary where the keys are node identifiers and the values are integers and optionally to a binary `.npz` file
+    (see writes_identifier_map()).
+
+    Args:
+        nodes: An array of identifiers returned by encodes_triples().
+        write_location: A string pointing to a local directory for writing data.
+        output_ints_map: the name and file path to write out results or None to skip this file.
+        output_binary_map: the name and file path to write out the binary identifier map or None to skip this file.
+
+    Returns:
+        None.
+    """
+
+    if output_ints_map:
+        with open(write_location + output_ints_map, 'w') as file_name:
+            json.dump(dict(zip(nodes, range(1, len(nodes) + 1))), file_name)
+    if output_binary_map: writes_identifier_map(nodes, write_location + output_binary_map)
 
     return None
 
 
 def converts_rdflib_to_networkx(write_location: str, full_kg: str, graph: Optional[Graph] = None) -> None:
-    """Converts an RDFLib.Graph object into a Networkx MultiDiGraph and pickles a copy locally.
+    """Converts an RDFLib.Graph object into a Networkx MultiDiGraph and pickles a copy locally. The graph is not
+    modified.
 
     Args:
         write_location: A string pointing to a local directory for writing data.
@@ -377,6 +480,9 @@ def converts_rdflib_to_networkx(write_location: str, full_kg: str, graph: Option
         IOError: If the file referenced by filename does not exist.
     """
 
+    # networkx is only used here, so it is imported when needed rather than with the other utilities
+    import networkx  # type: ignore
+
     print('\nConverting Knowledge Graph to MultiDiGraph')
 
     # read in knowledge graph if class graph attribute is not present
@@ -388,7 +494,6 @@ def converts_rdflib_to_networkx(write_location: str, full_kg: str, graph: Option
     nx_mdg = networkx.MultiDiGraph()
 
     for s, p, o in tqdm(graph):
-        graph.remove((s, p, o))
         nx_mdg.add_edge(s, o, **{'key': p})
 
     # pickle networkx graph
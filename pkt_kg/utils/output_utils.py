@@ -0,0 +1,810 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Output Utility Functions.
+
+Streams Triples to N-Triples Files
+* NTriplesWriter
+
+Reads N-Triples Files
+* reads_ntriples
+
+Compressed Sparse Row (CSR) Adjacency Files
+* writes_csr_adjacency
+* writes_encoded_csr_adjacency
+* loads_csr_adjacency
+* CSRAdjacency
+
+Memory-Mapped Binary Triple Files
+* writes_binary_triples
+* loads_binary_triples
+* BinaryTriples
+
+Memory-Mapped Identifier Maps
+* writes_identifier_map
+* loads_identifier_map
+* IdentifierMap
+* reads_identifier_map
+
+Typed Edge Arrays
+* writes_typed_edges
+* loads_typed_edges
+* TypedEdges
+
+Columnar (Parquet) Files
+* writes_parquet
+"""
+
+# import needed libraries
+import gzip
+import json
+import numpy  # type: ignore
+import os
+import os.path
+import pandas  # type: ignore
+import zipfile
+
+from numpy.lib import format as npy_format  # type: ignore
+from rdflib import Graph, Literal  # type: ignore
+from tqdm import tqdm  # type: ignore
+from typing import Any, Dict, IO, Iterable, List, Optional, Sequence, Tuple, Union, cast
+
+
+class NTriplesWriter(object):
+    """Class appends triples to an N-Triples file as they are created, which allows a knowledge graph to be written
+    incrementally (e.g. one edge type at a time) instead of serializing the entire graph once it is complete. Triples
+    are de-duplicated against the graph they are added to, so the writer does not keep a copy of the written triples,
+    and files whose name ends in '.gz' are gzip-compressed. For example:
+        with NTriplesWriter('PheKnowLator_full_NotClosed_OWLSemantics_KG.nt.gz') as writer:
+            writer.writes_triples(edges, graph)
+            graph = adds_edges_to_graph(graph, edges)
+
+    Attributes:
+        filepath: A string containing the filepath of the N-Triples file.
+        triple_count: An integer storing the number of triples written to the file.
+    """
+
+    def __init__(self, filepath: str) -> None:
+
+        self.filepath = filepath
+        self.triple_count: int = 0
+
+        if filepath.endswith('.gz'):
+            self._file: IO = gzip.open(filepath, 'wt', encoding='utf-8')
+        else:
+            self._file = open(filepath, 'w', encoding='utf-8')
+
+    def __enter__(self) -> 'NTriplesWriter':
+
+        return self
+
+    def __exit__(self, *args) -> None:
+
+        self.close()
+
+    @staticmethod
+    def formats_term(term: Any) -> str:
+        """Formats an rdflib term as N-Triples. Literals are escaped on a single line, as Literal.n3() uses the
+        (invalid in N-Triples) long quotes for strings which contain a newline.
+
+        Args:
+            term: An rdflib URIRef, BNode, or Literal object.
+
+        Returns:
+            A string containing the N-Triples representation of the term.
+        """
+
+        if isinstance(term, Literal):
+            value = str(term).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+            if term.language: return '"{}"@{}'.format(value, term.language)
+            elif term.datatype: return '"{}"^^{}'.format(value, term.datatype.n3())
+            else: return '"{}"'.format(value)
+        else:
+            return term.n3()
+
+    def writes_triples(self, triples: Iterable[Tuple], graph: Optional[Graph] = None) -> int:
+        """Writes triples to the N-Triples file. Triples which are about to be added to a graph are written before
+        they are added, so that the triples the graph already contains (and which were therefore already written) and
+        the triples repeated in the input can be skipped.
+
+        Args:
+            triples: An iterable of triples (e.g. a list of tuples or an rdflib Graph object).
+            graph: An rdflib Graph object whose triples are not written (optional). When it is not provided, every
+                triple is written, which is used to write a graph whose triples are already unique.
+
+        Returns:
+            An integer containing the number of triples written.
+        """
+
+        if graph is not None:
+            triples = dict.fromkeys(x for x in triples if x not in graph)  # keeps the first of repeated triples
+        lines = ['{} {} {} .\n'.format(*[self.formats_term(x) for x in triple]) for triple in triples]
+        self._file.writelines(lines)
+        self.triple_count += len(lines)
+
+        return len(lines)
+
+    def close(self) -> None:
+        """Closes the N-Triples file.
+
+        Returns:
+            None.
+        """
+
+        if not self._file.closed:
+            self._file.close()
+
+        return None
+
+
+def reads_ntriples(graph: Graph, filepath: str) -> Graph:
+    """Reads an N-Triples file, which can be gzip-compressed (i.e. its name ends in '.gz'), into a graph.
+
+    Args:
+        graph: An rdflib Graph object.
+        filepath: A string containing the filepath of an N-Triples file.
+
+    Returns:
+        The rdflib Graph object with the triples from the N-Triples file added to it.
+    """
+
+    with (gzip.open(filepath, 'rb') if filepath.endswith('.gz') else open(filepath, 'rb')) as infile:
+        graph.parse(source=cast(IO[bytes], infile), format='nt')
+
+    return graph
+
+
+def encodes_string_table(strings: Iterable[str]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Encodes a sequence of strings as a single array of utf-8 bytes and an array of offsets, where the i-th string
+    is stored in bytes[offsets[i]:offsets[i + 1]]. Unlike an array of Python strings, the arrays can be memory-mapped.
+
+    Args:
+        strings: An iterable of strings.
+
+    Returns:
+        A tuple containing a uint8 array of bytes and an int64 array of offsets.
+    """
+
+    encoded = [x.encode('utf-8') for x in strings]
+    offsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+    numpy.cumsum([len(x) for x in encoded], out=offsets[1:])
+
+    return numpy.frombuffer(b''.join(encoded), dtype=numpy.uint8), offsets
+
+
+def writes_csr_adjacency(graph: Graph, filepath: str) -> None:
+    """Writes a knowledge graph as a compressed sparse row (CSR) adjacency matrix to an uncompressed numpy .npz file.
+    Each subject and object is assigned a node id and each predicate a relation id (in the order they first appear in
+    the graph). The outgoing edges of node i are stored in indices[indptr[i]:indptr[i + 1]] (the object node ids)
+    and relations[indptr[i]:indptr[i + 1]] (the relation ids), sorted by relation and object. Nodes and relations
+    are identified by their string values, as in maps_node_ids_to_integers(). The file contains the arrays:
+        - indptr: int64 array of length number of nodes + 1.
+        - indices: int32 (or int64 for very large graphs) array of object node ids.
+        - relations: int32 array of relation ids.
+        - node_bytes, node_offsets: the node id table (see encodes_string_table()).
+        - relation_bytes, relation_offsets: the relation id table.
+
+    Args:
+        graph: An rdflib graph object.
+        filepath: A string containing the filepath of the .npz file.
+
+    Returns:
+        None.
+    """
+
+    print('\nWriting Knowledge Graph CSR Adjacency Matrix')
+
+    triples = list(map(str, (node for edge in tqdm(graph, total=len(graph)) for node in edge)))
+    codes, identifiers = pandas.factorize(numpy.array(triples, dtype=object), sort=False)
+    del triples
+    writes_encoded_csr_adjacency(codes.reshape(-1, 3), identifiers, filepath)
+
+    return None
+
+
+def writes_encoded_csr_adjacency(codes: numpy.ndarray, identifiers: numpy.ndarray, filepath: str) -> None:
+    """Writes a knowledge graph whose triples have already been mapped to integers (e.g. by encodes_triples()) as a
+    compressed sparse row (CSR) adjacency matrix. The file is the same as the one written by writes_csr_adjacency()
+    for the graph the triples were read from.
+
+    Args:
+        codes: An integer array with shape (number of triples, 3), where each value is the index of an identifier.
+        identifiers: An array of the identifiers referenced by codes.
+        filepath: A string containing the filepath of the .npz file.
+
+    Returns:
+        None.
+    """
+
+    node_ids, node_codes = pandas.factorize(numpy.concatenate([codes[:, 0], codes[:, 2]]), sort=False)
+    relation_ids, relation_codes = pandas.factorize(codes[:, 1], sort=False)
+    nodes, relations = identifiers[node_codes], identifiers[relation_codes]
+
+    # sort edges by subject, relation, and object
+    int_type = numpy.int32 if len(nodes) < 2 ** 31 else numpy.int64
+    subjects, objects = node_ids[:len(relation_ids)], node_ids[len(relation_ids):]
+    order = numpy.lexsort((objects, relation_ids, subjects))
+    indptr = numpy.zeros(len(nodes) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(subjects, minlength=len(nodes)), out=indptr[1:])
+
+    node_bytes, node_offsets = encodes_string_table(nodes)
+    relation_bytes, relation_offsets = encodes_string_table(relations)
+    with open(filepath, 'wb') as outfile:
+        numpy.savez(outfile, indptr=indptr, indices=objects[order].astype(int_type),
+                    relations=relation_ids[order].astype(numpy.int32), node_bytes=node_bytes,
+                    node_offsets=node_offsets, relation_bytes=relation_bytes, relation_offsets=relation_offsets)
+
+    return None
+
+
+def loads_npz_arrays(filepath: str, mmap: bool = True) -> Dict[str, numpy.ndarray]:
+    """Reads the arrays stored in an uncompressed numpy .npz file (i.e. one written by numpy.savez()). When mmap is
+    True each array is memory-mapped from its position in the file, so only the parts of an array that are used are
+    read from disk.
+
+    Args:
+        filepath: A string containing the filepath of the .npz file.
+        mmap: A bool indicating whether or not the arrays are memory-mapped instead of read into memory.
+
+    Returns:
+        A dict keyed by array name with numpy arrays as values.
+
+    Raises:
+        ValueError: If mmap is True and an array in the file is compressed.
+    """
+
+    if not mmap:
+        with numpy.load(filepath) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    arrays = dict()
+    with zipfile.ZipFile(filepath) as npz, open(filepath, 'rb') as infile:
+        for info in npz.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError('Compressed arrays can not be memory-mapped: {}'.format(info.filename))
+
+            # skip the zip local file header to find the start of the .npy data
+            infile.seek(info.header_offset + 26)
+            name_length, extra_length = numpy.frombuffer(infile.read(4), dtype='<u2')
+            infile.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+            version = npy_format.read_magic(infile)
+            header = npy_format.read_array_header_1_0 if version == (1, 0) else npy_format.read_array_header_2_0
+            shape, fortran_order, dtype = header(infile)
+            if 0 in shape:
+                array = numpy.zeros(shape, dtype=dtype)
+            else:
+                array = numpy.memmap(filepath, dtype=dtype, mode='r', offset=infile.tell(), shape=shape,
+                                     order='F' if fortran_order else 'C')
+            arrays[info.filename[:-4]] = array
+
+    return arrays
+
+
+class CSRAdjacency(object):
+    """Class provides read access to a knowledge graph stored as a compressed sparse row adjacency matrix (see
+    writes_csr_adjacency()). For example:
+        graph = loads_csr_adjacency('PheKnowLator_full_NotClosed_OWLSemantics_KG_CSR_Adjacency.npz')
+        for relation, node in graph.neighbors(graph.finds_node('http://purl.obolibrary.org/obo/HP_0000001')):
+            print(graph.relation(relation), graph.node(node))
+
+    Attributes:
+        indptr: A numpy array of the offsets of each node's edges in indices and relations.
+        indices: A numpy array of the object node id of each edge.
+        relations: A numpy array of the relation id of each edge.
+        node_count: An integer containing the number of nodes.
+        edge_count: An integer containing the number of edges.
+    """
+
+    def __init__(self, arrays: Dict[str, numpy.ndarray]) -> None:
+
+        self.indptr = arrays['indptr']
+        self.indices = arrays['indices']
+        self.relations = arrays['relations']
+        self.node_count: int = len(self.indptr) - 1
+        self.edge_count: int = len(self.indices)
+        self._strings = {'node': (arrays['node_bytes'], arrays['node_offsets']),
+                         'relation': (arrays['relation_bytes'], arrays['relation_offsets'])}
+        self._node_ids: Optional[Dict[str, int]] = None
+
+    def _decodes_string(self, table: str, i: int) -> str:
+
+        table_bytes, offsets = self._strings[table]
+
+        return bytes(table_bytes[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+    def node(self, node_id: int) -> str:
+        """Returns the identifier of a node.
+
+        Args:
+            node_id: An integer containing a node id.
+
+        Returns:
+            A string containing the node identifier (e.g. 'http://purl.obolibrary.org/obo/HP_0000001').
+        """
+
+        return self._decodes_string('node', node_id)
+
+    def relation(self, relation_id: int) -> str:
+        """Returns the identifier of a relation.
+
+        Args:
+            relation_id: An integer containing a relation id.
+
+        Returns:
+            A string containing the relation identifier (e.g. 'http://purl.obolibrary.org/obo/RO_0002435').
+        """
+
+        return self._decodes_string('relation', relation_id)
+
+    def finds_node(self, identifier: str) -> Optional[int]:
+        """Returns the node id of a node identifier. The node id table is read into a dict the first time the method
+        is called.
+
+        Args:
+            identifier: A string containing a node identifier.
+
+        Returns:
+            An integer containing the node id or None if the identifier is not a node in the graph.
+        """
+
+        if self._node_ids is None:
+            self._node_ids = {self.node(i): i for i in range(self.node_count)}
+
+        return self._node_ids.get(identifier)
+
+    def neighbors(self, node_id: int) -> List[Tuple[int, int]]:
+        """Returns the outgoing edges of a node.
+
+        Args:
+            node_id: An integer containing a node id.
+
+        Returns:
+            A list of tuples, one per edge, containing the relation id and object node id of the edge.
+        """
+
+        start, end = self.indptr[node_id], self.indptr[node_id + 1]
+
+        return list(zip(self.relations[start:end].tolist(), self.indices[start:end].tolist()))
+
+
+def loads_csr_adjacency(filepath: str, mmap: bool = True) -> CSRAdjacency:
+    """Reads a knowledge graph CSR adjacency matrix written by writes_csr_adjacency().
+
+    Args:
+        filepath: A string containing the filepath of the .npz file.
+        mmap: A bool indicating whether or not the arrays are memory-mapped instead of read into memory.
+
+    Returns:
+        A CSRAdjacency object.
+    """
+
+    return CSRAdjacency(loads_npz_arrays(filepath, mmap))
+
+
+def writes_binary_triples(int_triples: numpy.ndarray, filepath: str) -> None:
+    """Writes integer triples (e.g. those written to the Triples_Integers.txt file by maps_node_ids_to_integers()) to
+    an uncompressed numpy .npz file, which can be memory-mapped and searched without loading the triples into Python
+    objects (see BinaryTriples). The triples are stored three times, sorted in subject-predicate-object (spo),
+    predicate-object-subject (pos), and object-subject-predicate (osp) order, so triples with a bound subject,
+    predicate, or object are found by a binary search. Each ordering is stored as an array with shape (3, number of
+    triples), whose rows are the columns of the ordering (e.g. for osp: objects, subjects, predicates).
+
+    Args:
+        int_triples: A numpy array of integers with shape (number of triples, 3).
+        filepath: A string containing the filepath of the .npz file.
+
+    Returns:
+        None.
+    """
+
+    int_type = numpy.int32 if len(int_triples) == 0 or int_triples.max() < 2 ** 31 else numpy.int64
+    int_triples = numpy.asarray(int_triples, dtype=int_type).reshape(-1, 3)
+
+    orderings = dict()
+    for name, columns in BinaryTriples.orderings.items():
+        permuted = int_triples[:, list(columns)].T
+        orderings[name] = numpy.ascontiguousarray(permuted[:, numpy.lexsort(permuted[::-1])])
+
+    with open(filepath, 'wb') as outfile:
+        numpy.savez(outfile, **orderings)
+
+    return None
+
+
+class BinaryTriples(object):
+    """Class answers triple pattern queries over a binary triple file written by writes_binary_triples(). The file is
+    memory-mapped by default, so a query only reads the parts of the file that contain matching triples. For example:
+        triples = loads_binary_triples('PheKnowLator_full_NotClosed_OWLSemantics_Triples_Integers.npz')
+        triples.triples(subject=10)  # s??
+        triples.triples(predicate=2)  # ?p?
+        triples.triples(subject=10, obj=15)  # s?o
+
+    Attributes:
+        spo: A numpy array containing the triples sorted by subject, predicate, and object.
+        pos: A numpy array containing the triples sorted by predicate, object, and subject.
+        osp: A numpy array containing the triples sorted by object, subject, and predicate.
+        triple_count: An integer containing the number of triples.
+    """
+
+    # the triple columns (0: subject, 1: predicate, 2: object) of each ordering
+    orderings = {'spo': (0, 1, 2), 'pos': (1, 2, 0), 'osp': (2, 0, 1)}
+
+    def __init__(self, arrays: Dict[str, numpy.ndarray]) -> None:
+
+        self.spo = arrays['spo']
+        self.pos = arrays['pos']
+        self.osp = arrays['osp']
+        self.triple_count: int = self.spo.shape[1]
+
+    def triples(self, subject: Optional[int] = None, predicate: Optional[int] = None,
+                obj: Optional[int] = None) -> numpy.ndarray:
+        """Returns the triples matching a triple pattern, where unbound parts of the pattern are None. The ordering
+        whose leading columns are bound is searched, so each pattern is answered with at most two binary searches and
+        a filter over the matching range.
+
+        Args:
+            subject: An integer containing a subject node id or None.
+            predicate: An integer containing a predicate id or None.
+            obj: An integer containing an object node id or None.
+
+        Returns:
+            A numpy array with shape (number of matching triples, 3) containing the subject, predicate, and object of
+            each matching triple.
+        """
+
+        pattern = (subject, predicate, obj)
+        if subject is not None:
+            name = 'spo' if obj is None or predicate is not None else 'osp'
+        elif predicate is not None:
+            name = 'pos'
+        else:
+            name = 'osp' if obj is not None else 'spo'
+        ordering, columns = getattr(self, name), self.orderings[name]
+
+        # narrow the range using the leading bound columns of the ordering
+        start, end = 0, self.triple_count
+        for row, column in enumerate(columns):
+            value = pattern[column]
+            if value is None:
+                break
+            values = ordering[row, start:end]
+            start, end = start + int(numpy.searchsorted(values, value, 'left')), \
+                start + int(numpy.searchsorted(values, value, 'right'))
+        matches = numpy.asarray(ordering[:, start:end])
+
+        # return triples in subject, predicate, object order
+        return matches[[columns.index(x) for x in range(3)]].T
+
+    def neighbors(self, node: int) -> numpy.ndarray:
+        """Returns the triples containing a node as their subject or object.
+
+        Args:
+            node: An integer containing a node id.
+
+        Returns:
+            A numpy array with shape (number of matching triples, 3).
+        """
+
+        return numpy.concatenate([self.triples(subject=node), self.triples(obj=node)])
+
+
+def loads_binary_triples(filepath: str, mmap: bool = True) -> BinaryTriples:
+    """Reads a binary triple file written by writes_binary_triples().
+
+    Args:
+        filepath: A string containing the filepath of the .npz file.
+        mmap: A bool indicating whether or not the triples are memory-mapped instead of read into memory.
+
+    Returns:
+        A BinaryTriples object.
+    """
+
+    return BinaryTriples(loads_npz_arrays(filepath, mmap))
+
+
+def writes_identifier_map(identifiers: Union[Sequence[str], numpy.ndarray], filepath: str) -> None:
+    """Writes the map between node identifiers and the integers used in place of them (see
+    maps_node_ids_to_integers()) to an uncompressed numpy .npz file, which can be memory-mapped and searched without
+    reading the map into a dict (see IdentifierMap). The identifier with integer i is identifiers[i - 1]. The file
+    contains the arrays:
+        - bytes, offsets: the identifiers, sorted by their utf-8 bytes (see encodes_string_table()).
+        - integers: the integer of each sorted identifier.
+        - positions: the position of each integer's identifier in the sorted identifiers (i.e. integer i is at
+          positions[i - 1]).
+
+    Args:
+        identifiers: A sequence (e.g. a list or numpy array) of strings containing the node identifiers, ordered by
+            their integer.
+        filepath: A string containing the filepath of the .npz file.
+
+    Returns:
+        None.
+    """
+
+    int_type = numpy.int32 if len(identifiers) < 2 ** 31 else numpy.int64
+    order: numpy.ndarray = numpy.array(sorted(range(len(identifiers)), key=identifiers.__getitem__), dtype=int_type)
+    positions = numpy.empty(len(identifiers), dtype=int_type)
+    positions[order] = numpy.arange(len(identifiers), dtype=int_type)
+    table_bytes, offsets = encodes_string_table(identifiers[i] for i in order)
+
+    with open(filepath, 'wb') as outfile:
+        numpy.savez(outfile, bytes=table_bytes, offsets=offsets, integers=order + 1, positions=positions)
+
+    return None
+
+
+class IdentifierMap(object):
+    """Class looks up node identifiers and their integers in an identifier map written by writes_identifier_map().
+    The map is memory-mapped by default, so a lookup only reads the identifiers it compares. An identifier is found
+    from its integer directly and an integer is found from its identifier by a binary search over the sorted
+    identifiers. For example:
+        node_map = loads_identifier_map('PheKnowLator_full_NotClosed_OWLSemantics_Triples_Integer_Identifier_Map.npz')
+        node_map.integer('http://purl.obolibrary.org/obo/HP_0000001')  # 10
+        node_map.identifier(10)  # 'http://purl.obolibrary.org/obo/HP_0000001'
+
+    Attributes:
+        integers: A numpy array of the integer of each identifier, in sorted identifier order.
+        positions: A numpy array of the position of each integer's identifier in sorted identifier order.
+        node_count: An integer containing the number of identifiers.
+    """
+
+    def __init__(self, arrays: Dict[str, numpy.ndarray]) -> None:
+
+        self.integers = arrays['integers']
+        self.positions = arrays['positions']
+        self.node_count: int = len(self.integers)
+        self._bytes, self._offsets = arrays['bytes'], arrays['offsets']
+
+    def __len__(self) -> int:
+
+        return self.node_count
+
+    def _sorted_identifier(self, position: int) -> bytes:
+
+        return bytes(self._bytes[self._offsets[position]:self._offsets[position + 1]])
+
+    def identifiers(self) -> List[str]:
+        """Returns every node identifier, ordered by their integer.
+
+        Returns:
+            A list of strings, where the identifier with integer i is at index i - 1.
+        """
+
+        sorted_identifiers = [self._sorted_identifier(i).decode('utf-8') for i in range(self.node_count)]
+
+        return [sorted_identifiers[i] for i in self.positions.tolist()]
+
+    def identifier(self, integer: int) -> Optional[str]:
+        """Returns the node identifier of an integer.
+
+        Args:
+            integer: An integer assigned to a node identifier.
+
+        Returns:
+            A string containing the node identifier or None if the integer is not in the map.
+        """
+
+        if not 1 <= integer <= self.node_count:
+            return None
+        else:
+            return self._sorted_identifier(self.positions[integer - 1]).decode('utf-8')
+
+    def integer(self, identifier: str) -> Optional[int]:
+        """Returns the integer of a node identifier.
+
+        Args:
+            identifier: A string containing a node identifier.
+
+        Returns:
+            An integer or None if the identifier is not in the map.
+        """
+
+        target, low, high = identifier.encode('utf-8'), 0, self.node_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._sorted_identifier(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self.node_count and self._sorted_identifier(low) == target:
+            return int(self.integers[low])
+        else:
+            return None
+
+
+def loads_identifier_map(filepath: str, mmap: bool = True) -> IdentifierMap:
+    """Reads an identifier map written by writes_identifier_map().
+
+    Args:
+        filepath: A string containing the filepath of the .npz file.
+        mmap: A bool indicating whether or not the map is memory-mapped instead of read into memory.
+
+    Returns:
+        An IdentifierMap object.
+    """
+
+    return IdentifierMap(loads_npz_arrays(filepath, mmap))
+
+
+def reads_identifier_map(filepath: str) -> List[str]:
+    """Reads an identifier map written by maps_node_ids_to_integers(), either as a `.json` file or as a binary `.npz`
+    file (see writes_identifier_map()), into a list of node identifiers ordered by their integer. The map is read
+    entirely into memory, so the file can be overwritten once it has been read.
+
+    Args:
+        filepath: A string containing the filepath of a `.json` or `.npz` identifier map.
+
+    Returns:
+        A list of strings, where the identifier with integer i is at index i - 1.
+
+    Raises:
+        OSError: If the file referenced by filepath does not exist.
+        ValueError: If the integers in the map are not the integers 1 to the number of identifiers.
+    """
+
+    if not os.path.exists(filepath):
+        raise OSError('The {} file does not exist!'.format(filepath))
+    elif filepath.endswith('.npz'):
+        return loads_identifier_map(filepath, mmap=False).identifiers()
+    else:
+        with open(filepath, 'r') as infile:
+            node_map = json.load(infile)
+        identifiers: List[Optional[str]] = [None] * len(node_map)
+        for identifier, integer in node_map.items():
+            if not isinstance(integer, int) or not 1 <= integer <= len(node_map) or \
+                    identifiers[integer - 1] is not None:
+                raise ValueError('The {} identifier map must map identifiers to the integers 1 to {}'.format(
+                    filepath, len(node_map)))
+            identifiers[integer - 1] = identifier
+
+        return identifiers  # type: ignore
+
+
+def writes_typed_edges(edge_dict: Dict, filepath: str) -> None:
+    """Writes the edges of each edge type in a master edge list (e.g. the edge_dict of a KGBuilder) to an uncompressed
+    numpy .npz file, as one coordinate (COO) format array per (subject type, relation, object type), which is the
+    input expected by most heterogeneous graph learning libraries. The subject and object types are the two parts of
+    the edge type (e.g. "chemical" and "gene" for chemical-gene) and the relation is the edge type's edge_relation.
+    The nodes of each node type are numbered from 0 in the order they first appear (reading the edge types in sorted
+    order) and are identified by their uri and identifier (e.g. 'http://purl.uniprot.org/geneid/19'). The file
+    contains the arrays:
+        - edges__{subject type}__{relation}__{object type}: an int64 array with shape (2, number of edges), whose
+          rows are the subject and object node numbers of each edge.
+        - nodes__{node type}__bytes, nodes__{node type}__offsets: the identifiers of each node type, ordered by their
+          number (see encodes_string_table()).
+
+    Args:
+        edge_dict: A nested dict keyed by edge type, containing the edge_relation, uri, and edge_list of each edge
+            type (see CreatesEdgeList).
+        filepath: A string containing the filepath of the .npz file.
+
+    Returns:
+        None.
+    """
+
+    arrays: Dict[str, numpy.ndarray] = dict()
+    node_maps: Dict[str, Dict[str, int]] = dict()
+    for edge_type in sorted(edge_dict.keys()):
+        edge_types, uris = edge_type.split('-'), edge_dict[edge_type]['uri']
+        edges = numpy.zeros((2, len(edge_dict[edge_type]['edge_list'])), dtype=numpy.int64)
+        for row in range(2):
+            node_map = node_maps.setdefault(edge_types[row], dict())
+            edges[row] = [node_map.setdefault(uris[row] + edge[row], len(node_map))
+                          for edge in edge_dict[edge_type]['edge_list']]
+        arrays['edges__' + '__'.join([edge_types[0], edge_dict[edge_type]['edge_relation'], edge_types[1]])] = edges
+
+    for node_type, node_map in node_maps.items():
+        arrays['nodes__' + node_type + '__bytes'], arrays['nodes__' + node_type + '__offsets'] = \
+            encodes_string_table(node_map.keys())
+
+    with open(filepath, 'wb') as outfile:
+        numpy.savez(outfile, **arrays)
+
+    return None
+
+
+class TypedEdges(object):
+    """Class provides read access to the typed edge arrays written by writes_typed_edges(). For example:
+        typed_edges = loads_typed_edges('PheKnowLator_full_NotClosed_OWLSemantics_Typed_Edges.npz')
+        for subject_type, relation, object_type in typed_edges.edge_types:
+            edges = typed_edges.edges((subject_type, relation, object_type))  # shape (2, number of edges)
+
+    Attributes:
+        edge_types: A list of tuples, one per edge array, containing the subject type, relation, and object type.
+        node_types: A list of strings containing the node types.
+    """
+
+    def __init__(self, arrays: Dict[str, numpy.ndarray]) -> None:
+
+        self._arrays = arrays
+        edge_keys = [x.split('__') for x in arrays.keys() if x.startswith('edges__')]
+        self.edge_types: List[Tuple[str, str, str]] = sorted((x[1], x[2], x[3]) for x in edge_keys)
+        self.node_types: List[str] = sorted(x.split('__')[1] for x in arrays.keys() if x.endswith('__offsets'))
+        self._node_indices: Dict[str, Dict[str, int]] = dict()
+
+    def edges(self, edge_type: Tuple[str, str, str]) -> numpy.ndarray:
+        """Returns the edges of an edge type.
+
+        Args:
+            edge_type: A tuple containing a subject type, relation, and object type.
+
+        Returns:
+            An int64 numpy array with shape (2, number of edges) containing the subject and object node numbers.
+        """
+
+        return self._arrays['edges__' + '__'.join(edge_type)]
+
+    def nodes(self, node_type: str) -> List[str]:
+        """Returns the node identifiers of a node type, ordered by their node number.
+
+        Args:
+            node_type: A string containing a node type (e.g. 'gene').
+
+        Returns:
+            A list of strings containing node identifiers.
+        """
+
+        table_bytes = bytes(self._arrays['nodes__' + node_type + '__bytes'])
+        offsets = self._arrays['nodes__' + node_type + '__offsets'].tolist()
+
+        return [table_bytes[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+    def node_index(self, node_type: str, identifier: str) -> Optional[int]:
+        """Returns the node number of a node identifier. The identifiers of a node type are read into a dict the first
+        time the method is called for that type.
+
+        Args:
+            node_type: A string containing a node type (e.g. 'gene').
+            identifier: A string containing a node identifier (e.g. 'http://purl.uniprot.org/geneid/19').
+
+        Returns:
+            An integer containing the node number or None if the identifier is not a node of the node type.
+        """
+
+        if node_type not in self._node_indices:
+            self._node_indices[node_type] = {x: i for i, x in enumerate(self.nodes(node_type))}
+
+        return self._node_indices[node_type].get(identifier)
+
+
+def loads_typed_edges(filepath: str, mmap: bool = True) -> TypedEdges:
+    """Reads the typed edge arrays written by writes_typed_edges().
+
+    Args:
+        filepath: A string containing the filepath of the .npz file.
+        mmap: A bool indicating whether or not the arrays are memory-mapped instead of read into memory.
+
+    Returns:
+        A TypedEdges object.
+    """
+
+    return TypedEdges(loads_npz_arrays(filepath, mmap))
+
+
+def writes_parquet(data: pandas.DataFrame, filepath: str) -> None:
+    """Writes a pandas DataFrame to a Parquet file using pyarrow. String columns are converted to categoricals, which
+    are stored as dictionary-encoded columns, so that each distinct identifier is stored once per column chunk and
+    the columns are read back (e.g. by pandas.read_parquet or Spark) without re-parsing any text.
+
+    Args:
+        data: A pandas DataFrame.
+        filepath: A string containing the filepath of the .parquet file.
+
+    Returns:
+        None.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+
+    try:  # pyarrow is only imported when parquet files are written
+        import pyarrow  # type: ignore
+    except ImportError:
+        raise ImportError('pyarrow is required to write parquet files (e.g. pip install pyarrow)')
+
+    data = data.astype({x: 'category' for x in data.columns if data[x].dtype == object})
+    data.to_parquet(filepath, engine='pyarrow', index=False)
+
+    return None
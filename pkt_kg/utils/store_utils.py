@@ -0,0 +1,449 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Storage Utility Functions.
+
+Disk-Backed Triple Store
+* SQLiteStore
+
+Creates Knowledge Graphs
+* creates_graph
+"""
+
+# import needed libraries
+import os
+import os.path
+import sqlite3
+
+from rdflib import BNode, Graph, Literal, URIRef  # type: ignore
+from rdflib.plugin import register  # type: ignore
+from rdflib.store import Store, VALID_STORE, NO_STORE  # type: ignore
+from rdflib.util import from_n3  # type: ignore
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+
+class SQLiteStore(Store):
+    """Class implements a disk-backed rdflib Store on top of the standard library's sqlite3 module, which allows a
+    knowledge graph to be built on machines that do not have enough memory to hold the entire graph.
+
+    Each rdflib term is stored once in a terms table and triples are stored as integer term identifiers. The triples
+    table is keyed by (subject, predicate, object) and two additional indices over (predicate, object, subject) and
+    (object, subject, predicate) are maintained, so that any triple pattern is answered by a range scan over a single
+    index. Lookups of term identifiers and terms are memoized in bounded in-memory caches.
+
+    The store is not context aware (i.e. it holds a single graph) and it does not support formulae.
+
+    Attributes:
+        batch_size: An integer specifying the number of rows fetched per query page and the number of writes between
+            commits.
+        cache_size: An integer specifying the maximum number of terms held in each of the in-memory term caches.
+        connection: A sqlite3 Connection object.
+        db_file: A string containing the filepath of the sqlite database.
+        triple_count: An integer storing the number of triples in the store.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    # order of the columns in each index, used to pick the index which answers a triple pattern
+    indices = {'s': ('s', 'p', 'o'), 'p': ('p', 'o', 's'), 'o': ('o', 's', 'p')}
+
+    def __init__(self, configuration: Optional[str] = None, identifier: Optional[Any] = None,
+                 batch_size: int = 10000, cache_size: int = 500000) -> None:
+
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.connection: Optional[sqlite3.Connection] = None
+        self.db_file: Optional[str] = None
+        self.triple_count: int = 0
+        self._term_ids: Dict = dict()
+        self._id_terms: Dict = dict()
+        self._pending_writes: int = 0
+
+        super(SQLiteStore, self).__init__(configuration, identifier)
+
+    def open(self, configuration: str, create: bool = False) -> int:
+        """Opens a connection to a sqlite database, creating the tables and indices when create is True.
+
+        Args:
+            configuration: A string containing the filepath of the sqlite database.
+            create: A bool indicating whether or not the database should be created if it does not exist.
+
+        Returns:
+            VALID_STORE if the database was opened, NO_STORE if it does not exist and create is False.
+        """
+
+        if not create and not os.path.exists(configuration):
+            return NO_STORE
+        else:
+            self.db_file = configuration
+            self.connection = sqlite3.connect(configuration)
+            self.connection.execute('PRAGMA journal_mode = WAL')
+            self.connection.execute('PRAGMA synchronous = OFF')
+            self.connection.execute('PRAGMA temp_store = FILE')
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE);
+                CREATE TABLE IF NOT EXISTS triples (s INTEGER NOT NULL, p INTEGER NOT NULL, o INTEGER NOT NULL,
+                                                    PRIMARY KEY (s, p, o)) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS pos_index ON triples (p, o, s);
+                CREATE INDEX IF NOT EXISTS osp_index ON triples (o, s, p);
+                CREATE TABLE IF NOT EXISTS namespaces (prefix TEXT PRIMARY KEY, uri TEXT NOT NULL);
+                """)
+            self.triple_count = self.connection.execute('SELECT COUNT(*) FROM triples').fetchone()[0]
+
+            return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = True) -> None:
+        """Closes the connection to the sqlite database. The store is not transaction aware, writes are only batched
+        into transactions for speed, so pending writes are always committed before the connection is closed.
+
+        Args:
+            commit_pending_transaction: A bool kept for compatibility with the rdflib Store interface.
+
+        Returns:
+            None.
+        """
+
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+        return None
+
+    def destroy(self, configuration: str) -> None:
+        """Closes the store and removes the sqlite database and its write-ahead log files.
+
+        Args:
+            configuration: A string containing the filepath of the sqlite database.
+
+        Returns:
+            None.
+        """
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+        for file_name in [configuration, configuration + '-wal', configuration + '-shm']:
+            if os.path.exists(file_name): os.remove(file_name)
+
+        return None
+
+    def commit(self) -> None:
+        """Commits all pending writes to the sqlite database."""
+
+        if self.connection is not None:
+            self.connection.commit()
+            self._pending_writes = 0
+
+        return None
+
+    def rollback(self) -> None:
+        """Discards all writes since the last commit. The term caches are cleared, as they may contain the ids of terms
+        whose rows were discarded."""
+
+        if self.connection is not None:
+            self.connection.rollback()
+            self._term_ids.clear()
+            self._id_terms.clear()
+            self.triple_count = self.connection.execute('SELECT COUNT(*) FROM triples').fetchone()[0]
+            self._pending_writes = 0
+
+        return None
+
+    @staticmethod
+    def encodes_term(term: Any) -> str:
+        """Converts an rdflib term into the string used to store it in the terms table.
+
+        Args:
+            term: An rdflib URIRef, BNode, or Literal object.
+
+        Returns:
+            A string where the first character indicates the term type.
+        """
+
+        if isinstance(term, URIRef):
+            return 'U' + str(term)
+        elif isinstance(term, BNode):
+            return 'B' + str(term)
+        elif isinstance(term, Literal):
+            return 'L' + str(term) + '\x1f' + str(term.datatype or '') + '\x1f' + str(term.language or '')
+        else:
+            return 'N' + term.n3()
+
+    @staticmethod
+    def decodes_term(encoded_term: str) -> Any:
+        """Converts a string stored in the terms table back into an rdflib term.
+
+        Args:
+            encoded_term: A string created by the encodes_term method.
+
+        Returns:
+            An rdflib URIRef, BNode, or Literal object.
+        """
+
+        term_type, value = encoded_term[0], encoded_term[1:]
+
+        if term_type == 'U':
+            return URIRef(value)
+        elif term_type == 'B':
+            return BNode(value)
+        elif term_type == 'L':
+            lexical, datatype, language = value.rsplit('\x1f', 2)
+            return Literal(lexical, lang=language or None, datatype=URIRef(datatype) if datatype else None)
+        else:
+            return from_n3(value)
+
+    def gets_term_id(self, term: Any, create: bool = False) -> Optional[int]:
+        """Returns the integer identifier of an rdflib term.
+
+        Args:
+            term: An rdflib URIRef, BNode, or Literal object.
+            create: A bool indicating whether or not the term should be added to the terms table if it is missing.
+
+        Returns:
+            An integer identifier or None if the term is not in the store and create is False.
+        """
+
+        encoded_term = self.encodes_term(term)
+        term_id = self._term_ids.get(encoded_term)
+
+        if term_id is None:
+            cursor = self.connection.cursor()  # type: ignore
+            row = cursor.execute('SELECT id FROM terms WHERE term = ?', (encoded_term,)).fetchone()
+
+            if row is not None:
+                term_id = row[0]
+            elif create:
+                term_id = cursor.execute('INSERT INTO terms (term) VALUES (?)', (encoded_term,)).lastrowid
+            else:
+                return None
+
+            if len(self._term_ids) >= self.cache_size: self._term_ids.clear()
+            self._term_ids[encoded_term] = term_id
+
+        return term_id
+
+    def gets_term(self, term_id: int, encoded_term: str) -> Any:
+        """Returns the rdflib term for a term identifier, decoding it only if it is not already cached.
+
+        Args:
+            term_id: An integer term identifier.
+            encoded_term: A string created by the encodes_term method.
+
+        Returns:
+            An rdflib URIRef, BNode, or Literal object.
+        """
+
+        term = self._id_terms.get(term_id)
+
+        if term is None:
+            term = self.decodes_term(encoded_term)
+            if len(self._id_terms) >= self.cache_size: self._id_terms.clear()
+            self._id_terms[term_id] = term
+
+        return term
+
+    def _records_writes(self, count: int) -> None:
+        """Commits pending writes once the number of writes since the last commit exceeds batch_size."""
+
+        self._pending_writes += count
+        if self._pending_writes >= self.batch_size: self.commit()
+
+        return None
+
+    def add(self, triple: Tuple, context: Any = None, quoted: bool = False) -> None:
+        """Adds a triple to the store.
+
+        Args:
+            triple: A tuple containing a subject, predicate, and object.
+            context: An rdflib Graph object (ignored, the store is not context aware).
+            quoted: A bool indicating whether the triple is quoted (not supported).
+
+        Returns:
+            None.
+        """
+
+        Store.add(self, triple, context, quoted)
+        ids = tuple(self.gets_term_id(x, create=True) for x in triple)
+        query = 'INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)'
+        cursor = self.connection.execute(query, ids)  # type: ignore
+        self.triple_count += cursor.rowcount
+        self._records_writes(1)
+
+        return None
+
+    def addN(self, quads: Any) -> None:
+        """Adds a batch of quads to the store, ignoring their contexts.
+
+        Args:
+            quads: An iterable of tuples containing a subject, predicate, object, and context.
+
+        Returns:
+            None.
+        """
+
+        rows = [tuple(self.gets_term_id(x, create=True) for x in quad[:3]) for quad in quads]
+        query = 'INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)'
+        cursor = self.connection.executemany(query, rows)  # type: ignore
+        self.triple_count += cursor.rowcount
+        self._records_writes(len(rows))
+
+        return None
+
+    def remove(self, triple_pattern: Tuple, context: Any = None) -> None:
+        """Removes all triples matching a triple pattern from the store.
+
+        Args:
+            triple_pattern: A tuple containing a subject, predicate, and object, where any element can be None.
+            context: An rdflib Graph object (ignored, the store is not context aware).
+
+        Returns:
+            None.
+        """
+
+        Store.remove(self, triple_pattern, context)
+        bound = {col: term for col, term in zip('spo', triple_pattern) if term is not None}
+        ids = {col: self.gets_term_id(term) for col, term in bound.items()}
+
+        if all(x is not None for x in ids.values()):
+            where = ' AND '.join('{} = ?'.format(col) for col in ids.keys()) or '1'
+            cursor = self.connection.execute('DELETE FROM triples WHERE ' + where, list(ids.values()))  # type: ignore
+            self.triple_count -= cursor.rowcount
+            self._records_writes(cursor.rowcount)
+
+        return None
+
+    def triples(self, triple_pattern: Tuple, context: Any = None) -> Iterator[Tuple[Tuple, Iterator]]:
+        """Generator over the triples matching a triple pattern. Results are read a page at a time using keyset
+        pagination over the index whose leading column is bound, so the store can be modified (e.g. triples removed)
+        while it is being iterated over.
+
+        Args:
+            triple_pattern: A tuple containing a subject, predicate, and object, where any element can be None.
+            context: An rdflib Graph object (ignored, the store is not context aware).
+
+        Returns:
+            An iterator over tuples, where the first item is a triple and the second item is an empty iterator of
+            contexts.
+        """
+
+        bound = {col: term for col, term in zip('spo', triple_pattern) if term is not None}
+        ids = {col: self.gets_term_id(term) for col, term in bound.items()}
+        if any(x is None for x in ids.values()): return
+
+        index = self.indices[[col for col in 'spo' if col in ids][0] if ids else 's']
+        order = [col for col in index if col not in ids]
+        query = 'SELECT t.s, t.p, t.o, a.term, b.term, c.term FROM triples t JOIN terms a ON a.id = t.s ' \
+                'JOIN terms b ON b.id = t.p JOIN terms c ON c.id = t.o WHERE {} ORDER BY {} LIMIT {}'
+        last: Optional[List] = None
+
+        while True:
+            where = ['t.{} = ?'.format(col) for col in ids.keys()]
+            params = list(ids.values())
+            if last is not None and order:
+                where += ['({}) > ({})'.format(', '.join('t.' + col for col in order), ', '.join('?' * len(order)))]
+                params += last
+            rows = self.connection.execute(query.format(' AND '.join(where) or '1',  # type: ignore
+                                                        ', '.join('t.' + col for col in order) or 't.s',
+                                                        self.batch_size), params).fetchall()
+
+            for row in rows:
+                yield (self.gets_term(row[0], row[3]), self.gets_term(row[1], row[4]),
+                       self.gets_term(row[2], row[5])), iter(())
+
+            if len(rows) < self.batch_size or not order:
+                break
+            else:
+                last = [rows[-1]['spo'.index(col)] for col in order]
+
+    def __len__(self, context: Any = None) -> int:
+        """Returns the number of triples in the store."""
+
+        return self.triple_count
+
+    def contexts(self, triple: Optional[Tuple] = None) -> Generator[Graph, None, None]:
+        """Yields no graphs, the store is not context aware."""
+
+        yield from ()
+
+    def bind(self, prefix: str, namespace: Any, override: bool = True) -> None:
+        """Binds a prefix to a namespace.
+
+        Args:
+            prefix: A string containing a namespace prefix (e.g. 'obo').
+            namespace: An rdflib URIRef containing a namespace (e.g. 'http://purl.obolibrary.org/obo/').
+            override: A bool indicating whether an existing binding for the namespace should be replaced.
+
+        Returns:
+            None.
+        """
+
+        existing = self.prefix(namespace)
+
+        if existing is None or override:
+            self.connection.execute('DELETE FROM namespaces WHERE uri = ?', (str(namespace),))  # type: ignore
+            self.connection.execute('INSERT OR REPLACE INTO namespaces (prefix, uri) VALUES (?, ?)',  # type: ignore
+                                    (prefix, str(namespace)))
+
+        return None
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        """Returns the namespace bound to a prefix or None."""
+
+        row = self.connection.execute('SELECT uri FROM namespaces WHERE prefix = ?',  # type: ignore
+                                      (prefix,)).fetchone()
+
+        return URIRef(row[0]) if row else None
+
+    def prefix(self, namespace: Any) -> Optional[str]:
+        """Returns the prefix bound to a namespace or None."""
+
+        row = self.connection.execute('SELECT prefix FROM namespaces WHERE uri = ?',  # type: ignore
+                                      (str(namespace),)).fetchone()
+
+        return row[0] if row else None
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        """Generator over all prefix and namespace bindings."""
+
+        for prefix, uri in self.connection.execute('SELECT prefix, uri FROM namespaces').fetchall():  # type: ignore
+            yield prefix, URIRef(uri)
+
+
+# make the store available to rdflib as Graph(store='SQLite')
+register('SQLite', Store, 'pkt_kg.utils.store_utils', 'SQLiteStore')
+
+
+def creates_graph(storage: str = 'memory', db_file: Optional[str] = None) -> Graph:
+    """Creates an empty rdflib graph which is backed by the requested storage type. When the sqlite storage type is
+    requested any triples remaining in the database from a prior build are removed.
+
+    Args:
+        storage: A string containing the storage type (i.e. "memory" or "sqlite").
+        db_file: A string containing the filepath of the sqlite database, only used for the sqlite storage type.
+
+    Returns:
+        An empty rdflib Graph object.
+
+    Raises:
+        ValueError: If storage is not "memory" or "sqlite".
+        ValueError: If storage is "sqlite" and db_file is None.
+    """
+
+    if storage not in ['memory', 'sqlite']:
+        raise ValueError('storage must be "memory" or "sqlite"')
+    elif storage == 'memory':
+        return Graph()
+    elif db_file is None:
+        raise ValueError('db_file must contain a valid filepath, not None')
+    else:
+        store = SQLiteStore()
+        store.destroy(db_file)
+        store.open(db_file, create=True)
+
+        return Graph(store=store)
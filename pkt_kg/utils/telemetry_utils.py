@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Knowledge Graph Build Telemetry Utility Functions.
+
+Measures Resource Usage
+* gets_resource_usage
+
+Records Build Stages
+* BuildTelemetry
+"""
+
+# import needed libraries
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # resource is only available on unix-like systems
+    resource = None  # type: ignore
+
+
+def gets_resource_usage() -> Dict[str, Optional[float]]:
+    """Returns the cpu time used by the current process and its completed child processes (e.g. owltools or the worker
+    processes used to construct edges) and the peak resident set size (RSS) of each. The peak RSS values are high-water
+    marks over the life of the process and are reported in megabytes. Memory is None if the resource module is not
+    available on the current platform.
+
+    Returns:
+        A dict containing cpu time in seconds and peak RSS in megabytes. For example:
+            {'cpu_seconds': 12.3, 'child_cpu_seconds': 4.0, 'process_peak_rss_mb': 812.4,
+             'process_peak_child_rss_mb': 120.9}
+    """
+
+    if resource is None:
+        return {'cpu_seconds': time.process_time(), 'child_cpu_seconds': None, 'process_peak_rss_mb': None,
+                'process_peak_child_rss_mb': None}
+    else:
+        # ru_maxrss is reported in kilobytes on linux and in bytes on macOS
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        usage, child_usage = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        return {'cpu_seconds': time.process_time(), 'child_cpu_seconds': child_usage.ru_utime + child_usage.ru_stime,
+                'process_peak_rss_mb': usage.ru_maxrss / scale,
+                'process_peak_child_rss_mb': child_usage.ru_maxrss / scale}
+
+
+class BuildTelemetry(object):
+    """Class records performance telemetry for each stage of a knowledge graph build (i.e. wall time, cpu time, peak
+    memory, the number of items processed and processing rate, and the number of triples in the graph) and writes it
+    to a json report, which can be compared between builds and releases to track performance regressions.
+
+    Wall and cpu time are measured for the stage alone. The peak memory of a stage is the peak RSS of the process (and
+    of its largest completed child process) from the start of the process until the stage completed, as the operating
+    system does not report the peak of part of a process' lifetime. It therefore never decreases from one stage to the
+    next, and a stage only used more memory than the stages before it if its process_peak_rss_mb is larger.
+
+    A single object can be shared by the classes that run the stages of a build (e.g. CreatesEdgeList, KGBuilder,
+    Metadata, and OwlNets) so that a single report covers the entire build.
+
+    Attributes:
+        created: A string containing the date and time the object was created.
+        records: A list of dicts, one per completed stage, in the order the stages completed. For example:
+            [{'stage': 'creates_knowledge_graph_edges', 'edge_type': 'gene-gene', 'wall_seconds': 1.52,
+              'cpu_seconds': 1.49, 'child_cpu_seconds': 0.0, 'process_peak_rss_mb': 812.4,
+              'process_peak_child_rss_mb': 0.0, 'items': 10000, 'items_per_second': 6578.9, 'triples': 70000}]
+    """
+
+    def __init__(self) -> None:
+
+        self.created: str = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.records: List[Dict] = []
+
+    @contextmanager
+    def records_stage(self, stage: str, edge_type: Optional[str] = None, items: Optional[int] = None) -> Iterator[Dict]:
+        """Context manager which measures the code run inside of it as a single build stage. The record for the stage
+        is yielded so that the code being measured can set the number of items it processed (used to compute the
+        processing rate) and the number of triples in the resulting graph once they are known. For example:
+            with telemetry.records_stage('maps_node_ids_to_integers') as record:
+                record['items'] = record['triples'] = len(graph)
+
+        Args:
+            stage: A string containing the name of the build stage (e.g. 'creates_knowledge_graph_edges').
+            edge_type: A string containing the edge type processed by the stage, if any (e.g. 'gene-gene').
+            items: An integer containing the number of items the stage will process, if it is known in advance.
+
+        Returns:
+            A dict storing the record for the stage. Any key set on it is included in the report.
+        """
+
+        record: Dict = {'stage': stage, 'edge_type': edge_type, 'items': items, 'triples': None}
+        start_time, start_usage = time.perf_counter(), gets_resource_usage()
+
+        try:
+            yield record
+        finally:
+            end_usage = gets_resource_usage()
+            record['wall_seconds'] = time.perf_counter() - start_time
+
+            for key in ['cpu_seconds', 'child_cpu_seconds']:
+                usage = [x[key] for x in [start_usage, end_usage]]
+                record[key] = usage[1] - usage[0] if None not in usage else None  # type: ignore
+            record['process_peak_rss_mb'] = end_usage['process_peak_rss_mb']
+            record['process_peak_child_rss_mb'] = end_usage['process_peak_child_rss_mb']
+
+            if record['items'] is not None and record['wall_seconds'] > 0:
+                record['items_per_second'] = record['items'] / record['wall_seconds']
+            else:
+                record['items_per_second'] = None
+
+            self.records.append(record)
+
+    def writes_report(self, report_file: str) -> None:
+        """Writes the recorded stages to a json file, along with the information needed to compare reports created on
+        different machines.
+
+        Args:
+            report_file: A string containing the filepath to write the report to.
+
+        Returns:
+            None.
+        """
+
+        report = {'created': self.created,
+                  'written': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                  'python_version': platform.python_version(),
+                  'platform': platform.platform(),
+                  'cpu_count': os.cpu_count(),
+                  'stages': self.records}
+
+        with open(report_file, 'w') as outfile:
+            json.dump(report, outfile, indent=2)
+
+        return None
@@ -39,6 +39,7 @@ test_deps = [
 
 extras = {
     'test': test_deps,
+    'parquet': ['pyarrow'],
 }
 
 setup(
@@ -60,7 +61,7 @@ setup(
         'License :: OSI Approved :: Apache 2.0 License',
         'Programming Language :: Python :: 3'
     ],
-    packages=find_packages(exclude=['contrib', 'docs', 'tests*']),
+    packages=find_packages(exclude=['benchmarks*', 'contrib', 'docs', 'tests*']),
     tests_require=test_deps,
 
     entry_points={
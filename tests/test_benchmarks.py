@@ -0,0 +1,104 @@
+import json
+import os
+import os.path
+import shutil
+import unittest
+
+from benchmarks.run_benchmarks import benchmarks, imports, runs_benchmark, runs_benchmarks
+from benchmarks.synthetic_data import generates_synthetic_data
+from pkt_kg.edge_list import CreatesEdgeList
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Class to test the synthetic data generator and the build benchmarks."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # set-up environment - make temp directory
+        self.temp_dir = self.dir_loc + '/temp'
+        os.mkdir(self.temp_dir)
+
+        return None
+
+    def test_generates_synthetic_data(self):
+        """Tests the generates_synthetic_data method."""
+
+        self.assertRaises(ValueError, generates_synthetic_data, self.temp_dir, 10)
+
+        data = generates_synthetic_data(self.temp_dir + '/run1', 50, seed=7)
+        for directory in ['construction_approach', 'edge_data', 'knowledge_graphs', 'node_data', 'ontologies',
+                          'owl_decoding', 'relations_data']:
+            self.assertTrue(len(os.listdir(data['resources'] + '/' + directory)) > 0)
+
+        # check the data is deterministic
+        data2 = generates_synthetic_data(self.temp_dir + '/run2', 50, seed=7)
+        for edge_type, filepath in data['data_files'].items():
+            with open(filepath) as file1, open(data2['data_files'][edge_type]) as file2:
+                self.assertEqual(file1.read(), file2.read())
+        self.assertEqual([x['edge_list'] for x in data['edge_dict'].values()],
+                         [x['edge_list'] for x in data2['edge_dict'].values()])
+
+        # check the expected master edge list matches the one created from the edge sources
+        edge_list = CreatesEdgeList(data['data_files'], data['resource_info'])
+        edge_list.creates_knowledge_graph_edges()
+        for edge_type in data['edge_dict'].keys():
+            self.assertTrue(len(data['edge_dict'][edge_type]['edge_list']) > 0)
+            self.assertEqual(set(map(tuple, data['edge_dict'][edge_type]['edge_list'])),
+                             set(map(tuple, edge_list.source_info[edge_type]['edge_list'])))
+
+        return None
+
+    def test_runs_benchmark(self):
+        """Tests the runs_benchmark method."""
+
+        data = generates_synthetic_data(self.temp_dir, 50)
+
+        for name in benchmarks.keys():
+            records = runs_benchmark(name, data)
+            self.assertTrue(len(records) > 0)
+            self.assertTrue(all(x['benchmark'] == name and x['wall_seconds'] >= 0 for x in records))
+
+        # check all edge types were benchmarked with each construction approach
+        records = runs_benchmark('construction_approaches', data)
+        self.assertEqual(6, len(records))
+        self.assertEqual({'subclass_constructor', 'instance_constructor'}, set(x['stage'] for x in records))
+
+        return None
+
+    def test_benchmarks_imports(self):
+        """Tests the imports benchmark and that importing the package does not import the libraries only needed by
+        some build stages."""
+
+        records = runs_benchmark('imports', dict())
+        self.assertEqual(list(imports.keys()), [x['edge_type'] for x in records])
+        modules = {x['edge_type']: x['imported_modules'] for x in records}
+        self.assertEqual([], modules['pkt_kg'])
+        self.assertEqual([], modules['pkt_kg.utils.BuildTelemetry'])
+        self.assertEqual([], modules['Main'])
+        self.assertEqual([], modules['pkt_kg.utils.kg_utils'])
+        self.assertEqual([], modules['pkt_kg.knowledge_graph'])
+
+        return None
+
+    def test_runs_benchmarks(self):
+        """Tests the runs_benchmarks method."""
+
+        self.assertRaises(ValueError, runs_benchmarks, self.temp_dir, 50, 1, ['unknown'])
+
+        report = runs_benchmarks(self.temp_dir, 50, 1, ['edge_list'])
+        with open(report) as report_file:
+            stages = json.load(report_file)['stages']
+        self.assertEqual(['creates_edge_list'] * 3, [x['stage'] for x in stages])
+
+        return None
+
+    def tearDown(self):
+
+        # remove temp directory
+        shutil.rmtree(self.temp_dir)
+
+        return None
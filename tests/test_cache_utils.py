@@ -0,0 +1,262 @@
+import json
+import os
+import os.path
+import shutil
+import unittest
+
+from rdflib import BNode, Graph, Literal, URIRef  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+
+from pkt_kg.utils import hashes_file, hashes_build_inputs, StageCache, EdgeTypeCache, writes_graph_cache, \
+    loads_graph_cache, MappingLookup, MappingDataCache
+
+
+class TestCacheUtils(unittest.TestCase):
+    """Class to test the knowledge graph build cache utility methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # set-up environment - make temp directory
+        self.temp_dir = self.dir_loc + '/temp'
+        os.mkdir(self.temp_dir)
+
+        # create input and output files
+        self.input_file = self.temp_dir + '/Master_Edge_List_Dict.json'
+        with open(self.input_file, 'w') as filepath:
+            json.dump({'gene-gene': {'edge_list': [['3075', '1080']]}}, filepath)
+
+        self.output_file = self.temp_dir + '/PheKnowLator_KG.owl'
+        with open(self.output_file, 'w') as filepath:
+            filepath.write('<rdf:RDF></rdf:RDF>')
+
+        self.cache_file = self.temp_dir + '/PheKnowLator_KG_StageCache.json'
+
+        return None
+
+    def test_hashes_file(self):
+        """Tests the hashes_file method."""
+
+        # test fake file name
+        self.assertRaises(OSError, hashes_file, self.temp_dir + '/Master_Edge_List_Dicts.json')
+
+        # test hash is stable and changes with content
+        digest = hashes_file(self.input_file)
+        self.assertEqual(64, len(digest))
+        self.assertEqual(digest, hashes_file(self.input_file, chunk_size=4))
+
+        with open(self.input_file, 'a') as filepath:
+            filepath.write(' ')
+        self.assertNotEqual(digest, hashes_file(self.input_file))
+
+        return None
+
+    def test_hashes_build_inputs(self):
+        """Tests the hashes_build_inputs method."""
+
+        file_hashes = dict()
+        digest = hashes_build_inputs([self.input_file, 'subclass', 'yes'], file_hashes)
+
+        # check file hash was memoized
+        self.assertIn(os.path.abspath(self.input_file), file_hashes.keys())
+        self.assertEqual(digest, hashes_build_inputs([self.input_file, 'subclass', 'yes'], file_hashes))
+
+        # check flags and file contents change the hash
+        self.assertNotEqual(digest, hashes_build_inputs([self.input_file, 'instance', 'yes'], file_hashes))
+
+        with open(self.input_file, 'w') as filepath:
+            json.dump({'gene-gene': {'edge_list': [['3075', '4267']]}}, filepath)
+        self.assertNotEqual(digest, hashes_build_inputs([self.input_file, 'subclass', 'yes']))
+
+        return None
+
+    def test_stage_cache(self):
+        """Tests the StageCache class when a stage is recorded and checked in a later build."""
+
+        # first build - nothing is cached
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file, 'subclass'])
+        self.assertFalse(cache.checks_stage('creates_knowledge_graph_edges'))
+        cache.records_stage('creates_knowledge_graph_edges', [self.output_file])
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        # second build - inputs unchanged
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file, 'subclass'])
+        self.assertTrue(cache.checks_stage('creates_knowledge_graph_edges'))
+
+        # third build - inputs changed
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file, 'instance'])
+        self.assertFalse(cache.checks_stage('creates_knowledge_graph_edges'))
+
+        # fourth build - output removed
+        os.remove(self.output_file)
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file, 'subclass'])
+        self.assertFalse(cache.checks_stage('creates_knowledge_graph_edges'))
+
+        return None
+
+    def test_stage_cache_downstream_invalidation(self):
+        """Tests that invalidating a stage invalidates all of the stages that follow it."""
+
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file])
+        cache.records_stage('creates_knowledge_graph_edges', [self.output_file])
+        cache.creates_stage_key('maps_node_ids_to_integers', [])
+        cache.records_stage('maps_node_ids_to_integers', [self.output_file])
+
+        # change upstream input
+        cache = StageCache(self.cache_file)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file, 'yes'])
+        cache.creates_stage_key('maps_node_ids_to_integers', [])
+        self.assertFalse(cache.checks_stage('creates_knowledge_graph_edges'))
+        self.assertFalse(cache.checks_stage('maps_node_ids_to_integers'))
+
+        return None
+
+    def test_stage_cache_disabled(self):
+        """Tests the StageCache class when caching is disabled."""
+
+        cache = StageCache(self.cache_file, enabled=False)
+        cache.creates_stage_key('creates_knowledge_graph_edges', [self.input_file])
+        cache.records_stage('creates_knowledge_graph_edges', [self.output_file])
+        self.assertFalse(cache.checks_stage('creates_knowledge_graph_edges'))
+        self.assertFalse(os.path.exists(self.cache_file))
+
+        return None
+
+    def test_writes_and_loads_graph_cache(self):
+        """Tests the writes_graph_cache and loads_graph_cache methods."""
+
+        graph = Graph()
+        graph.add((URIRef('http://purl.obolibrary.org/obo/HP_0000001'), RDF.type, OWL.Class))
+        graph.add((URIRef('http://purl.obolibrary.org/obo/HP_0000001'), RDFS.label, Literal('All', lang='en')))
+        graph.add((URIRef('http://purl.obolibrary.org/obo/HP_0000118'), RDFS.subClassOf, BNode('N1')))
+        graph_cache = self.temp_dir + '/PheKnowLator_MergedOntologies_GraphCache.npz'
+
+        # test missing cache
+        self.assertFalse(loads_graph_cache(Graph(), graph_cache, 'abc'))
+
+        # test cache round-trip
+        writes_graph_cache(graph, graph_cache, 'abc')
+        cached_graph = Graph()
+        self.assertTrue(loads_graph_cache(cached_graph, graph_cache, 'abc'))
+        self.assertEqual(set(graph), set(cached_graph))
+
+        # test stale cache
+        stale_graph = Graph()
+        self.assertFalse(loads_graph_cache(stale_graph, graph_cache, 'abd'))
+        self.assertEqual(0, len(stale_graph))
+
+        return None
+
+    def test_edge_type_cache(self):
+        """Tests the EdgeTypeCache class when an edge type is recorded and reused in a later build."""
+
+        cache_dir = self.temp_dir + '/PheKnowLator_KG_EdgeTypeCache'
+        edge_info = {'data_type': 'entity-class', 'edge_relation': 'RO_0003302', 'edge_list': [['2', 'HP_0002511']]}
+        triples = {(URIRef('https://www.ncbi.nlm.nih.gov/gene/2'), RDFS.subClassOf, BNode('N1')),
+                   (BNode('N1'), OWL.someValuesFrom, URIRef('http://purl.obolibrary.org/obo/HP_0002511'))}
+
+        # first build - nothing is cached
+        cache = EdgeTypeCache(cache_dir, 'base')
+        key = cache.creates_edge_type_key(edge_info)
+        self.assertFalse(cache.checks_edge_type('gene-phenotype', key))
+        cache.records_edge_type('gene-phenotype', key, triples, {('2', 'HP_0000716')}, ['2'])
+        cache.records_edge_type('gene-gene', key, set(), set(), [])
+        cache.writes_manifest(['gene-phenotype', 'gene-gene'])
+
+        # second build - edge type unchanged
+        cache = EdgeTypeCache(cache_dir, 'base')
+        self.assertTrue(cache.checks_edge_type('gene-phenotype', key))
+        graph = Graph()
+        self.assertEqual(({('2', 'HP_0000716')}, ['2'], 2), cache.loads_edge_type('gene-phenotype', graph))
+        self.assertEqual(triples, set(graph))
+
+        # third build - edge type changed and gene-gene edge type removed
+        edge_info['edge_list'] += [['2', 'HP_0000716']]
+        self.assertFalse(cache.checks_edge_type('gene-phenotype', cache.creates_edge_type_key(edge_info)))
+        cache.writes_manifest(['gene-phenotype'])
+        self.assertFalse(os.path.exists(cache_dir + '/gene-gene.npz'))
+
+        # fourth build - shared inputs changed
+        cache = EdgeTypeCache(cache_dir, 'new base')
+        self.assertFalse(cache.checks_edge_type('gene-phenotype', key))
+
+        return None
+
+    def test_mapping_lookup(self):
+        """Tests the MappingLookup class."""
+
+        lookup = MappingLookup(['MESH_D1', 'MESH_D2', 'MESH_D1', 'MESH_D3'],
+                               ['CHEBI_1', 'CHEBI_2', 'CHEBI_3', 'CHEBI_4'])
+        self.assertEqual(4, len(lookup))
+        self.assertEqual(['MESH_D1', 'MESH_D2', 'MESH_D3'], list(lookup.index))
+        self.assertEqual(['CHEBI_1', 'CHEBI_3', 'CHEBI_2', 'CHEBI_4'], list(lookup.values))
+        self.assertGreater(lookup.memory_usage(), 0)
+
+        # identifiers are repeated for each identifier they map to and removed if they are not mapped
+        rows, identifiers = lookup.maps(['MESH_D2', 'MESH_D9', 'MESH_D1', 'MESH_D2'])
+        self.assertEqual([0, 2, 2, 3], list(rows))
+        self.assertEqual(['CHEBI_2', 'CHEBI_1', 'CHEBI_3', 'CHEBI_2'], list(identifiers))
+
+        rows, identifiers = lookup.maps(['MESH_D9'])
+        self.assertEqual(([], []), (list(rows), list(identifiers)))
+
+        return None
+
+    def test_mapping_data_cache(self):
+        """Tests the MappingDataCache class."""
+
+        self.assertRaises(ValueError, MappingDataCache, str, -1)
+
+        # create mapping data sets of the same size
+        data = {x: MappingLookup([x + str(i) for i in range(100)], [str(i) for i in range(100)])
+                for x in ['map1', 'map2', 'map3']}
+        size = MappingDataCache.gets_data_size(data['map1'])
+        self.assertEqual(size, MappingDataCache.gets_data_size(data['map2']))
+        reads = []
+
+        def loader(file_path):
+            reads.append(file_path)
+            return data[file_path]
+
+        # check data sets are only read once while they fit in the cache
+        cache = MappingDataCache(loader, (2 * size + 1) / (1024 * 1024))
+        self.assertIs(data['map1'], cache.loads_mapping_data('map1'))
+        self.assertIs(data['map2'], cache.loads_mapping_data('map2'))
+        self.assertIs(data['map1'], cache.loads_mapping_data('map1'))
+        self.assertEqual(['map1', 'map2'], reads)
+        self.assertEqual((1, 2, 0, 2 * size), (cache.hits, cache.misses, cache.evictions, cache.size))
+
+        # check the least recently used data set is evicted
+        cache.loads_mapping_data('map3')
+        self.assertEqual(['map1', 'map3'], list(cache.cache.keys()))
+        cache.loads_mapping_data('map2')
+        self.assertEqual(['map1', 'map2', 'map3', 'map2'], reads)
+        self.assertEqual((1, 4, 2, 2 * size), (cache.hits, cache.misses, cache.evictions, cache.size))
+
+        # check data sets larger than the cache are not cached
+        cache = MappingDataCache(loader, (size - 1) / (1024 * 1024))
+        self.assertIs(data['map1'], cache.loads_mapping_data('map1'))
+        self.assertEqual((0, 0), (len(cache.cache), cache.size))
+
+        # check the cache can be cleared
+        cache = MappingDataCache(loader)
+        cache.loads_mapping_data('map1')
+        cache.clears()
+        self.assertEqual((0, 0), (len(cache.cache), cache.size))
+
+        return None
+
+    def tearDown(self):
+
+        # remove temp directory
+        shutil.rmtree(self.temp_dir)
+
+        return None
@@ -160,6 +160,10 @@ class TestKGConstructionApproach(unittest.TestCase):
         self.assertIsInstance(self.kg_builder.subclass_error, Dict)
         self.assertTrue(len(self.kg_builder.subclass_error) == 0)
 
+        # rejected_edges dict
+        self.assertIsInstance(self.kg_builder.rejected_edges, Dict)
+        self.assertTrue(len(self.kg_builder.rejected_edges) == 0)
+
         return None
 
     def test_maps_node_to_class(self):
@@ -176,7 +180,9 @@ class TestKGConstructionApproach(unittest.TestCase):
         result = self.kg_builder.maps_node_to_class('gene-phenotype', '2', ['2', 'HP_0002511'])
 
         self.assertEqual(None, result)
-        self.assertTrue(edge_list_length > len(self.kg_builder.edge_dict['gene-phenotype']['edge_list']))
+        self.assertEqual({('2', 'HP_0002511')}, self.kg_builder.rejected_edges['gene-phenotype'])
+        self.assertTrue(edge_list_length > len(self.kg_builder.removes_rejected_edges('gene-phenotype')))
+        self.assertNotIn(['2', 'HP_0002511'], self.kg_builder.edge_dict['gene-phenotype']['edge_list'])
 
         return None
 
@@ -3,6 +3,8 @@
 
 import os.path
 import glob
+import shutil
+import tempfile
 
 from unittest import TestCase
 
@@ -97,6 +99,30 @@ class TestLinkedData(TestCase):
 
         return None
 
+    def test_links_data_file(self):
+        """Tests links_data_file method."""
+
+        temp_dir = tempfile.mkdtemp()
+        source_file = temp_dir + '/chemical-gene_CTD_chem_gene_ixns.tsv'
+        link_file = temp_dir + '/chemical-protein_CTD_chem_gene_ixns.tsv'
+        shutil.copy(self.dir_loc + '/edge_data/chemical-disease_CTD_chemicals_diseases.tsv', source_file)
+
+        # check the file is linked, rather than copied
+        self.data.links_data_file(source_file, link_file)
+        self.assertTrue(os.path.samefile(source_file, link_file))
+
+        # check linking a file to itself and replacing an existing copy
+        self.data.links_data_file(source_file, source_file)
+        os.remove(link_file)
+        shutil.copy(source_file, link_file)
+        self.data.links_data_file(source_file, link_file)
+        self.assertTrue(os.path.samefile(source_file, link_file))
+
+        # clean up environment
+        shutil.rmtree(temp_dir)
+
+        return None
+
     def test_generates_source_metadata(self):
         """Tests whether or not metadata is being generated."""
 
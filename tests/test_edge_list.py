@@ -1,8 +1,11 @@
 import os.path
 import pandas
 import re
+import shutil
+import tempfile
 import unittest
 
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Tuple
 
 from pkt_kg.edge_list import CreatesEdgeList
@@ -93,6 +96,82 @@ class TestCreatesEdgeList(unittest.TestCase):
 
         return None
 
+    def test_skip_row_finder(self):
+        """Tests the skip_row_finder method."""
+
+        # chemical-disease data (metadata rows)
+        splitter, skip = self.master_edge_list.skip_row_finder(self.edge_data_files['chemical-disease'], 't')
+        self.assertEqual('\t', splitter)
+        self.assertEqual(list(range(27)) + [28], skip)
+
+        # gene-disease data (no metadata rows)
+        self.assertEqual(('\t', []), self.master_edge_list.skip_row_finder(self.edge_data_files['gene-disease'], 't'))
+
+        return None
+
+    def test_data_chunk_reader(self):
+        """Tests the data_chunk_reader method."""
+
+        for edge_type in ['chemical-disease', 'gene-disease']:
+            file_path = self.edge_data_files[edge_type]
+            delimiter = self.master_edge_list.source_info[edge_type]['delimiter']
+            chunks = list(self.master_edge_list.data_chunk_reader(file_path, delimiter, 4))
+            self.assertTrue(len(chunks) > 1)
+            self.assertTrue(all(len(x) <= 4 for x in chunks))
+
+            # check the chunks contain the same data as data_reader
+            data = self.master_edge_list.data_reader(file_path, delimiter)
+            self.assertTrue(data.equals(pandas.concat(chunks, ignore_index=True)))
+
+        return None
+
+    def test_data_chunk_reader_types(self):
+        """Tests that the data_chunk_reader method reads each chunk with the data types of the entire data set."""
+
+        # write data with an empty cell in the last row of an integer column and text in the last row of another column
+        rows = ['subject\tobject\tscore'] + ['   {}\t{}\t0.{}'.format(x, x, x) for x in range(20)] + ['MESH:1\t\t0.5']
+        file_path = self.dir_loc + '/edge_data/chunked_data.tsv'
+        with open(file_path, 'w') as outfile:
+            outfile.write('\n'.join(rows) + '\n')
+
+        data = self.master_edge_list.data_reader(file_path, 't')
+        chunks = list(self.master_edge_list.data_chunk_reader(file_path, 't', 5))
+        self.assertEqual(5, len(chunks))
+        self.assertTrue(data.equals(pandas.concat(chunks, ignore_index=True)))
+        self.assertEqual(['   0', 0.0], list(chunks[0].iloc[0])[:2])
+        os.remove(file_path)
+
+        return None
+
+    def test_data_chunk_processor_mixed_types(self):
+        """Tests that the data_chunk_processor method compares a column containing numbers and text the same way as
+        when the data is read in full."""
+
+        # write data where only the last row of the score column is text
+        rows = ['gene{}\tdisease{}\t{}'.format(x, x, 9 if x % 2 else 50) for x in range(40)] + ['gene\tdisease\tnone']
+        file_path = self.dir_loc + '/edge_data/chunked_data.tsv'
+        with open(file_path, 'w') as outfile:
+            outfile.write('\n'.join(rows) + '\n')
+        self.master_edge_list.data_files['gene-gene'] = file_path
+        self.master_edge_list.source_info['gene-gene'] = dict(self.master_edge_list.source_info['gene-disease'])
+        self.master_edge_list.source_info['gene-gene']['column_idx'] = '0;1'
+
+        # the score column is compared as text by the first criteria, and as numbers once the text row is removed
+        for evidence, count in [('2;>=;10', 41), ("1;!=;'disease'::2;>=;10", 20)]:
+            self.master_edge_list.source_info['gene-gene']['evidence_criteria'] = evidence
+            edge_data = self.master_edge_list.data_reader(file_path, 't')
+            edge_data = self.master_edge_list.filter_data(edge_data, 'None', evidence)
+            edge_data = self.master_edge_list.data_reducer('0;1', edge_data)
+            edge_data = self.master_edge_list.label_formatter(edge_data, ';;')
+
+            self.master_edge_list.chunk_size = 10
+            chunked_data = self.master_edge_list.data_chunk_processor(['gene-gene'])[0]['gene-gene']
+            self.assertEqual(count, len(edge_data))
+            self.assertEqual(edge_data.values.tolist(), chunked_data.values.tolist())
+        os.remove(file_path)
+
+        return None
+
     def test_filter_fixer(self):
         """Tests the filter_fixer method."""
 
@@ -136,6 +215,45 @@ class TestCreatesEdgeList(unittest.TestCase):
 
         return None
 
+    def test_criteria_compiler(self):
+        """Tests the criteria_compiler method."""
+
+        edge_data = pandas.DataFrame({'a': ['1', '2', '3', '4', '5'],
+                                      'b': ['gene_1', 'gene_2', 'protein_3', 'gene_4', 'None'],
+                                      'c': ['0.5', '0.9', 'None', '0.7', '0.1'],
+                                      'd': ['Homo sapiens', 'Homo sapiens', 'Mus musculus', 'Homo sapiens', "'"]})
+
+        def filtered(crit):
+            return list(self.master_edge_list.criteria_compiler(crit)(edge_data.copy())['a'])
+
+        # numbers (missing values are treated as 0)
+        self.assertEqual(['2', '4'], filtered('2;>=;0.70'))
+        self.assertEqual(['3', '5'], filtered('2;<;0.5'))
+        self.assertEqual([1.0], filtered('0;==;1'))
+        self.assertEqual(['1', '2', '3', '4', '5'], filtered('1;!=;1'))  # non-numeric columns are compared as strings
+
+        # strings
+        self.assertEqual(['1', '2', '4'], filtered('3;==;Homo sapiens'))
+        self.assertEqual(['3', '5'], filtered("3;!=;'Homo sapiens'"))
+        self.assertEqual(['1', '2', '4'], filtered("1;.startswith('gene');"))
+        self.assertEqual(['5'], filtered('1;.isalpha();'))
+        self.assertEqual(['1', '2', '5'], filtered('1;in;gene_1 gene_2 None'))
+
+        # lists
+        self.assertEqual(['3', '5'], filtered('1;in;["protein_3", "None"]'))
+        self.assertEqual(['1', '2', '4'], filtered('1;not in;["protein_3", "None"]'))
+
+        # deduplication
+        self.assertEqual(['3', '2', '5'], filtered('2-3;dedup;desc'))
+        self.assertEqual(['5', '1', '3'], filtered('2-3;dedup;asc'))
+
+        # unsupported criteria
+        for crit in ['1;.lower();', '1;.__class__();', "1;in;__import__('os')", '1;is;None', '2;in;0.5', '1;==;[1, 2]',
+                     '1;.startswith(os.sep);']:
+            self.assertRaises(ValueError, self.master_edge_list.criteria_compiler, crit)
+
+        return None
+
     def test_data_reducer(self):
         """Tests the data_reducer method."""
 
@@ -224,6 +342,18 @@ class TestCreatesEdgeList(unittest.TestCase):
         self.assertIsInstance(merged_data1_col2[0], str)
         self.assertIsInstance(merged_data1_col2[1], pandas.DataFrame)
 
+        # check the mapping data is read once and is not modified by merging
+        cache = self.master_edge_list.mapping_cache
+        self.assertEqual({self.dir_loc + '/MESH_CHEBI_MAP.txt', self.dir_loc + '/DISEASE_DOID_MAP.txt'},
+                         set(cache.cache.keys()))
+        map_file = self.dir_loc + '/MESH_CHEBI_MAP.txt'
+        lookup = self.master_edge_list.mapping_data_reader(map_file)
+        self.assertTrue(cache.cache[map_file][0].index.equals(lookup.index))
+        self.assertEqual(list(lookup.values), list(cache.cache[map_file][0].values))
+        self.assertEqual(merged_data1_col1[1].values.tolist(),
+                         self.master_edge_list.data_merger(0, mapping_data1, labeled_data1)[1].values.tolist())
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
         # data set 2
         file_path2 = self.edge_data_files['gene-disease']
         delimiter2 = self.master_edge_list.source_info['gene-disease']['delimiter']
@@ -297,6 +427,7 @@ class TestCreatesEdgeList(unittest.TestCase):
         """Tests creates_knowledge_graph_edges method."""
 
         self.master_edge_list.creates_knowledge_graph_edges()
+        self.assertEqual(0, len(self.master_edge_list.mapping_cache.cache))
 
         # edge type 1
         self.assertIsInstance(self.master_edge_list.source_info['chemical-disease']['edge_list'], List)
@@ -308,4 +439,102 @@ class TestCreatesEdgeList(unittest.TestCase):
         self.assertEqual(5, len(self.master_edge_list.source_info['gene-disease']['edge_list']))
         self.assertIn(('19', 'DOID_1936'), self.master_edge_list.source_info['gene-disease']['edge_list'])
 
+        # check telemetry was recorded for each edge type and written next to the master edge list
+        records = {x['edge_type']: x for x in self.master_edge_list.telemetry.records}
+        self.assertEqual({'chemical-disease', 'gene-disease'}, set(records.keys()))
+        self.assertEqual(5, records['gene-disease']['edges'])
+        self.assertTrue(os.path.exists(self.dir_loc + '/Master_Edge_List_Telemetry.json'))
+        os.remove(self.dir_loc + '/Master_Edge_List_Telemetry.json')
+
+        return None
+
+    def tests_creates_knowledge_graph_edges_chunks(self):
+        """Tests creates_knowledge_graph_edges method when reading the edge data in chunks."""
+
+        self.assertRaises(ValueError, CreatesEdgeList, self.edge_data_files, self.dir_loc + '/resource_info.txt',
+                          None, 0)
+
+        self.master_edge_list.creates_knowledge_graph_edges()
+        edge_lists = {k: v['edge_list'] for k, v in self.master_edge_list.source_info.items()}
+
+        # check the edge lists match those created from the full data
+        for chunk_size in [1, 4, 1000]:
+            self.master_edge_list.chunk_size = chunk_size
+            self.master_edge_list.creates_knowledge_graph_edges()
+            self.assertEqual(edge_lists, {k: v['edge_list'] for k, v in self.master_edge_list.source_info.items()})
+            self.assertEqual(5, len(self.master_edge_list.source_info['gene-disease']['edge_list']))
+
+        # check telemetry counts the rows of every chunk
+        records = [x for x in self.master_edge_list.telemetry.records if x['edge_type'] == 'gene-disease']
+        self.assertEqual(1, len(set(x['items'] for x in records)))
+        os.remove(self.dir_loc + '/Master_Edge_List_Telemetry.json')
+
+        return None
+
+    def tests_creates_knowledge_graph_edges_processes(self):
+        """Tests creates_knowledge_graph_edges method when creating the edge lists in separate processes."""
+
+        file_loc = self.dir_loc + '/resource_info.txt'
+        self.assertRaises(ValueError, CreatesEdgeList, self.edge_data_files, file_loc, cpus=0)
+        self.assertRaises(ValueError, CreatesEdgeList, self.edge_data_files, file_loc, memory_mb=-1)
+
+        self.master_edge_list.creates_knowledge_graph_edges()
+        edge_lists = {k: v['edge_list'] for k, v in self.master_edge_list.source_info.items()}
+
+        # check the edge lists match those created in a single process, with and without a memory budget
+        for memory_mb in [None, 1000.0, 0.0]:
+            self.master_edge_list.cpus, self.master_edge_list.memory_mb = 2, memory_mb
+            self.master_edge_list.telemetry.records = []
+            self.master_edge_list.creates_knowledge_graph_edges()
+            self.assertEqual(edge_lists, {k: v['edge_list'] for k, v in self.master_edge_list.source_info.items()})
+
+            # check the telemetry of each process was returned
+            records = {x['edge_type']: x for x in self.master_edge_list.telemetry.records}
+            self.assertEqual({'chemical-disease', 'gene-disease'}, set(records.keys()))
+            self.assertEqual(5, records['gene-disease']['edges'])
+        os.remove(self.dir_loc + '/Master_Edge_List_Telemetry.json')
+
+        # check the build fails, rather than waiting forever, when a worker process dies
+        self.master_edge_list.creates_edge_lists = lambda edge_types, telemetry: os._exit(1)
+        self.assertRaises(BrokenProcessPool, self.master_edge_list.creates_knowledge_graph_edges)
+        del self.master_edge_list.creates_edge_lists
+
+        # check the memory estimate includes the data and mapping files
+        estimate = self.master_edge_list.estimates_edge_list_memory(['gene-disease'])
+        size = os.path.getsize(self.edge_data_files['gene-disease']) + \
+            os.path.getsize(self.dir_loc + '/DISEASE_DOID_MAP.txt')
+        self.assertAlmostEqual(10 * size / (1024 * 1024), estimate)
+
+        return None
+
+    def tests_creates_knowledge_graph_edges_shared_source(self):
+        """Tests creates_knowledge_graph_edges method when several edge types share a data source."""
+
+        # add an edge type whose data is a copy of the gene-disease data, with different evidence criteria
+        temp_dir = tempfile.mkdtemp()
+        shutil.copy(self.edge_data_files['gene-disease'], temp_dir + '/gene-phenotype_curated.tsv')
+        self.master_edge_list.data_files['gene-phenotype'] = temp_dir + '/gene-phenotype_curated.tsv'
+        self.master_edge_list.source_info['gene-phenotype'] = dict(self.master_edge_list.source_info['gene-disease'])
+        self.master_edge_list.source_info['gene-phenotype']['evidence_criteria'] = "10;>=;0.3::3;!=;'a'"
+
+        # check the edge types are grouped by data source
+        groups = [['chemical-disease'], ['gene-disease', 'gene-phenotype']]
+        self.assertEqual(groups, self.master_edge_list.groups_edge_types())
+
+        # check the edge lists match those created when each edge type reads the data itself
+        for chunk_size in [None, 4]:
+            self.master_edge_list.chunk_size = chunk_size
+            edge_lists = dict()
+            for edge_type in ['gene-disease', 'gene-phenotype']:
+                edge_lists.update(self.master_edge_list.creates_edge_lists([edge_type], self.master_edge_list.telemetry))
+            shared_edge_lists = self.master_edge_list.creates_edge_lists(groups[1], self.master_edge_list.telemetry)
+            self.assertEqual(edge_lists, shared_edge_lists)
+            self.assertEqual(5, len(shared_edge_lists['gene-disease']))
+            self.assertLess(5, len(shared_edge_lists['gene-phenotype']))
+
+        self.master_edge_list.creates_knowledge_graph_edges()
+        self.assertEqual(edge_lists['gene-phenotype'], self.master_edge_list.source_info['gene-phenotype']['edge_list'])
+        os.remove(self.dir_loc + '/Master_Edge_List_Telemetry.json')
+        shutil.rmtree(temp_dir)
+
         return None
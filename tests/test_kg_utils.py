@@ -1,14 +1,18 @@
 import glob
+import json
 import os
 import os.path
+import pandas
 import unittest
 
 from typing import List, Set
 from rdflib import Graph, URIRef, BNode
+from rdflib.namespace import RDFS
 
 from pkt_kg.utils import gets_ontology_statistics, merges_ontologies, ontology_file_formatter, \
     maps_node_ids_to_integers, adds_edges_to_graph, finds_node_type, converts_rdflib_to_networkx, \
-    gets_ontology_classes, gets_deprecated_ontology_classes, gets_object_properties
+    gets_ontology_classes, gets_deprecated_ontology_classes, gets_object_properties, loads_binary_triples, \
+    loads_identifier_map, encodes_triples
 
 
 class TestKGUtils(unittest.TestCase):
@@ -188,17 +192,96 @@ class TestKGUtils(unittest.TestCase):
         maps_node_ids_to_integers(graph=graph,
                                   write_location=self.dir_loc,
                                   output_ints='/so_with_imports_Triples_Integers.txt',
-                                  output_ints_map='/so_with_imports_Triples_Integer_Identifier_Map.json')
+                                  output_ints_map='/so_with_imports_Triples_Integer_Identifier_Map.json',
+                                  output_binary='/so_with_imports_Triples_Integers.npz',
+                                  output_binary_map='/so_with_imports_Triples_Integer_Identifier_Map.npz')
 
         # check that files were created
         self.assertTrue(os.path.exists(self.dir_loc + '/so_with_imports_Triples_Integers.txt'))
         self.assertTrue(os.path.exists(self.dir_loc + '/so_with_imports_Triples_Identifiers.txt'))
         self.assertTrue(os.path.exists(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.json'))
 
+        # check that the integer triples match the identifier triples
+        with open(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.json', 'r') as file_name:
+            node_map = json.load(file_name)
+        self.assertEqual(list(range(1, len(node_map) + 1)), list(node_map.values()))
+        ints = pandas.read_csv(self.dir_loc + '/so_with_imports_Triples_Integers.txt', sep='\t')
+        with open(self.dir_loc + '/so_with_imports_Triples_Identifiers.txt', 'r') as file_name:
+            ids = [x.strip('\n').split('\t') for x in file_name.readlines()[1:]]
+        self.assertEqual(['subject', 'predicate', 'object'], list(ints.columns))
+        self.assertEqual(len(graph), len(ints))
+        self.assertEqual(ints.values.tolist(), [[node_map[x] for x in triple] for triple in ids])
+        binary = loads_binary_triples(self.dir_loc + '/so_with_imports_Triples_Integers.npz')
+        self.assertEqual(sorted(ints.values.tolist()), binary.triples().tolist())
+        binary_map = loads_identifier_map(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.npz')
+        self.assertEqual(node_map, {binary_map.identifier(i): i for i in range(1, len(binary_map) + 1)})
+        self.assertEqual(list(node_map.values()), [binary_map.integer(x) for x in node_map.keys()])
+
         # clean up the environment
         os.remove(self.dir_loc + '/so_with_imports_Triples_Integers.txt')
         os.remove(self.dir_loc + '/so_with_imports_Triples_Identifiers.txt')
         os.remove(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.json')
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Integers.npz')
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.npz')
+
+        return None
+
+    def test_maps_node_ids_to_integers_previous_map(self):
+        """Tests the maps_node_ids_to_integers method when integers are seeded from a previous identifier map."""
+
+        # set-up input variables
+        graph = Graph()
+        graph.parse(self.good_ontology_file_location)
+        maps_node_ids_to_integers(graph, self.dir_loc, '/so_with_imports_Triples_Integers.txt',
+                                  '/so_with_imports_Triples_Integer_Identifier_Map.json')
+        with open(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.json', 'r') as file_name:
+            previous_map = json.load(file_name)
+
+        # remove and add triples, then map the graph using the previous map
+        removed = list(graph.triples((None, None, URIRef('http://purl.obolibrary.org/obo/SO_0000110'))))
+        for triple in removed: graph.remove(triple)
+        graph.add((URIRef('http://purl.obolibrary.org/obo/SO_9999999'), RDFS.subClassOf,
+                   URIRef('http://purl.obolibrary.org/obo/SO_0000110')))
+        for output_map in ['.json', '.npz']:
+            maps_node_ids_to_integers(graph, self.dir_loc, '/so_with_imports_Triples_Integers.txt', None,
+                                      output_binary_map='/so_with_imports_Triples_Integer_Identifier_Map.npz',
+                                      previous_map=self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map' +
+                                      output_map)
+
+            # check existing identifiers keep their integers and the new identifier is appended
+            node_map = loads_identifier_map(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.npz',
+                                            mmap=False)
+            self.assertEqual(len(previous_map) + 1, len(node_map))
+            self.assertEqual(list(previous_map.values()), [node_map.integer(x) for x in previous_map.keys()])
+            self.assertEqual(len(previous_map) + 1, node_map.integer('http://purl.obolibrary.org/obo/SO_9999999'))
+
+            # check the integer triples use the seeded integers
+            ints = pandas.read_csv(self.dir_loc + '/so_with_imports_Triples_Integers.txt', sep='\t')
+            with open(self.dir_loc + '/so_with_imports_Triples_Identifiers.txt', 'r') as file_name:
+                ids = [x.strip('\n').split('\t') for x in file_name.readlines()[1:]]
+            self.assertEqual(ints.values.tolist(), [[node_map.integer(x) for x in triple] for triple in ids])
+
+        # clean up the environment
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Integers.txt')
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Identifiers.txt')
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.json')
+        os.remove(self.dir_loc + '/so_with_imports_Triples_Integer_Identifier_Map.npz')
+
+        return None
+
+    def test_encodes_triples(self):
+        """Tests the encodes_triples method."""
+
+        # set-up input variables
+        graph = Graph()
+        graph.parse(self.good_ontology_file_location)
+        codes, nodes = encodes_triples(graph)
+
+        # check every triple is encoded and the graph is not modified
+        self.assertEqual((len(graph), 3), codes.shape)
+        self.assertEqual(len(set(str(x) for triple in graph for x in triple)), len(nodes))
+        self.assertEqual(sorted(tuple(str(x) for x in triple) for triple in graph),
+                         sorted(tuple(x) for x in nodes[codes].tolist()))
 
         return None
 
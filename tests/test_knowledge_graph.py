@@ -1,4 +1,5 @@
 import glob
+import importlib.util
 import json
 import os
 import os.path
@@ -296,6 +297,110 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_class_initialization_parameters_cache(self):
+        """Tests the class initialization parameters for the stage cache."""
+
+        self.assertRaises(TypeError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 1)
+
+        self.assertRaises(ValueError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'ye')
+
+        # check cache is disabled by default
+        self.assertFalse(self.kg_subclass.stage_cache.enabled)
+        kg = FullBuild('v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                       self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'yes')
+        self.assertTrue(kg.stage_cache.enabled)
+        self.assertTrue(kg.stage_cache.cache_file.endswith('NoOWLSemantics_KG_StageCache.json'))
+
+        return None
+
+    def test_class_initialization_parameters_storage(self):
+        """Tests the class initialization parameters for the triple storage."""
+
+        self.assertRaises(TypeError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'no', 1)
+
+        self.assertRaises(ValueError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'no',
+                          'disk')
+
+        # check triples are stored in memory by default
+        self.assertEqual('memory', self.kg_subclass.storage)
+        kg = FullBuild('v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                       self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'no',
+                       'sqlite')
+        self.assertEqual('sqlite', kg.storage)
+        self.assertTrue(kg.triple_store.endswith('NoOWLSemantics_KG_TripleStore.db'))
+
+        return None
+
+    def test_class_initialization_parameters_cpus(self):
+        """Tests the class initialization parameters for parallel edge construction."""
+
+        self.assertRaises(TypeError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'no',
+                          'memory', '2')
+
+        self.assertRaises(ValueError,
+                          FullBuild, 'v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'subclass',
+                          self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'yes', 'yes', 'yes', 'yes', 'no',
+                          'memory', 0)
+
+        # check edges are constructed by a single process by default
+        self.assertEqual(1, self.kg_subclass.cpus)
+
+        return None
+
+    def test_class_initialization_parameters_output_formats(self):
+        """Tests the class initialization parameters for the knowledge graph output formats."""
+
+        edges = self.dir_loc_resources + '/Master_Edge_List_Dict.json'
+        write_loc = self.dir_loc_resources + '/knowledge_graphs'
+
+        self.assertRaises(TypeError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', ntriples=1)
+        self.assertRaises(TypeError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', rdf_xml=1)
+        self.assertRaises(ValueError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', ntriples='bz2')
+        self.assertRaises(ValueError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', ntriples='yes',
+                          rdf_xml='maybe')
+        self.assertRaises(ValueError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', rdf_xml='no')
+
+        # check only the rdf/xml file is written by default
+        self.assertIsNone(self.kg_subclass.ntriples)
+        self.assertTrue(self.kg_subclass.rdf_xml)
+        self.assertEqual([self.kg_subclass.write_location + self.kg_subclass.full_kg],
+                         self.kg_subclass.gets_knowledge_graph_files())
+
+        # check n-triples only
+        kg = FullBuild('v2.0.0', write_loc, 'subclass', edges, 'yes', 'yes', 'yes', 'yes', ntriples='gzip',
+                       rdf_xml='no')
+        self.assertEqual('.nt.gz', kg.ntriples)
+        self.assertFalse(kg.rdf_xml)
+        self.assertEqual([kg.write_location + kg.full_kg[:-4] + '.nt.gz'], kg.gets_knowledge_graph_files())
+
+        # check parquet outputs
+        self.assertRaises(TypeError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', parquet=1)
+        self.assertRaises(ValueError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', parquet='arrow')
+        self.assertFalse(self.kg_subclass.parquet)
+        if importlib.util.find_spec('pyarrow') is None:
+            self.assertRaises(ImportError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes', parquet='yes')
+        else:
+            self.assertTrue(FullBuild('v2.0.0', write_loc, 'subclass', edges, 'yes', parquet='yes').parquet)
+
+        # check previous identifier map
+        self.assertIsNone(self.kg_subclass.previous_map)
+        self.assertRaises(OSError, FullBuild, 'v2.0.0', write_loc, 'subclass', edges, 'yes',
+                          previous_map=write_loc + '/PheKnowLator_Triples_Integer_Identifier_Map.json')
+        kg = FullBuild('v2.0.0', write_loc, 'subclass', edges, 'yes', previous_map=edges)
+        self.assertEqual(edges, kg.previous_map)
+
+        return None
+
     def test_class_initialization(self):
         """Tests the class initialization."""
 
@@ -413,6 +518,9 @@ class TestKGBuilder(unittest.TestCase):
         new_relation = URIRef('http://purl.obolibrary.org/obo/' + 'RO_0002566')
         self.kg_subclass.verifies_object_property(new_relation)
 
+        # make sure that the object property index was updated without re-querying the graph
+        self.assertIn(new_relation, self.kg_subclass.obj_properties)
+
         # update list of object properties
         self.kg_subclass.obj_properties = gets_object_properties(self.kg_subclass.graph)
 
@@ -612,6 +720,71 @@ class TestKGBuilder(unittest.TestCase):
 
         return None
 
+    def test_creates_knowledge_graph_edges_instance_inverse_parallel(self):
+        """Tests the creates_knowledge_graph_edges method when applied to a kg with instance-based construction with
+        inverse relations and edges are constructed by multiple processes."""
+
+        self.kg_instance2.sets_up_environment()
+        self.kg_instance2.reverse_relation_processor()
+        self.kg_instance2.cpus = 2
+
+        # make sure that kg is empty
+        self.kg_instance2.graph = Graph()
+
+        # initialize metadata class
+        metadata = Metadata(self.kg_instance2.kg_version, self.kg_instance2.write_location, self.kg_instance2.full_kg,
+                            self.kg_instance2.node_data, self.kg_instance2.node_dict)
+        metadata.node_metadata_processor()
+
+        # test method
+        self.kg_instance2.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
+
+        # check that the same edges were added to the graph as when using a single process
+        self.assertEqual(len(self.kg_instance2.graph), 200)
+        self.assertEqual([], self.kg_instance2.edge_dict['gene-phenotype']['edge_list'])
+        self.assertEqual(8, len(self.kg_instance2.edge_dict['gene-gene']['edge_list']))
+        self.assertEqual([], self.kg_instance2.edge_dict['disease-disease']['edge_list'])
+
+        # check that telemetry was recorded for each edge type
+        records = {x['edge_type']: x for x in self.kg_instance2.telemetry.records
+                   if x['stage'] == 'creates_knowledge_graph_edges'}
+        self.assertEqual(set(self.kg_instance2.edge_dict.keys()), set(records.keys()))
+        self.assertEqual(8, records['gene-gene']['items'])
+
+        # check graph was saved
+        kg_filename = 'PheKnowLator_partial_InverseRelations_NotClosed_OWLSemantics_KG.owl'
+        self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + kg_filename))
+
+        return None
+
+    def test_creates_knowledge_graph_edges_instance_inverse_cached(self):
+        """Tests the creates_knowledge_graph_edges method when applied to a kg with instance-based construction with
+        inverse relations and unchanged edge types are reused from a prior build."""
+
+        edge_data = self.dir_loc_resources + '/Master_Edge_List_Dict_instance.json'
+        for build in range(2):
+            kg = PartialBuild('v2.0.0', self.dir_loc_resources + '/knowledge_graphs', 'instance', edge_data,
+                              'yes', 'yes', 'yes', 'no', 'yes')
+            kg.owl_tools = self.kg_instance2.owl_tools
+            kg.sets_up_environment()
+            kg.reverse_relation_processor()
+            kg.graph = Graph()
+            metadata = Metadata(kg.kg_version, kg.write_location, kg.full_kg, kg.node_data, kg.node_dict)
+            metadata.node_metadata_processor()
+
+            # test method
+            kg.creates_knowledge_graph_edges(metadata.adds_node_metadata, metadata.adds_ontology_annotations)
+            self.assertEqual(len(kg.graph), 200)
+            self.assertEqual(8, len(kg.edge_dict['gene-gene']['edge_list']))
+
+        # check edge types were cached
+        cache_dir = self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + \
+            'PheKnowLator_partial_InverseRelations_NotClosed_OWLSemantics_KG_EdgeTypeCache'
+        self.assertEqual(['disease-disease.npz', 'gene-gene.npz', 'gene-phenotype.npz', 'manifest.json'],
+                         sorted(os.listdir(cache_dir)))
+
+        return None
+
     def test_creates_knowledge_graph_edges_adding_metadata_to_kg_bad(self):
         """Tests the creates_knowledge_graph_edges method and adds node metadata to the KG, but also makes sure that
         a log file is writen for genes that are not in the subclass_map."""
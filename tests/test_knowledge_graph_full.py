@@ -1,4 +1,5 @@
 import glob
+import gzip
 import json
 import os
 import os.path
@@ -7,8 +8,11 @@ import pickle
 import shutil
 import unittest
 
+from rdflib import Graph, Literal, URIRef  # type: ignore
+from rdflib.namespace import RDFS  # type: ignore
 
-from pkt_kg.knowledge_graph import FullBuild
+from pkt_kg.knowledge_graph import FullBuild, builds_knowledge_graph_variants
+from pkt_kg.utils import reads_ntriples
 
 
 class TestFullBuild(unittest.TestCase):
@@ -155,9 +159,82 @@ class TestFullBuild(unittest.TestCase):
         ints = 'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_Triples_Integers.txt'
         self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + ints))
 
+        # edge list - binary integers
+        binary = 'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_Triples_Integers.npz'
+        self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + binary))
+
+        # typed edge arrays
+        typed = 'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_Typed_Edges.npz'
+        self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + typed))
+
         # edge list map
         int_map = 'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_Triples_Integer_Identifier_Map.json'
         self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + int_map))
+        self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' +
+                                       int_map[:-5] + '.npz'))
+
+        # csr adjacency matrix
+        csr = 'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_KG_CSR_Adjacency.npz'
+        self.assertTrue(os.path.exists(self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + csr))
+
+        return None
+
+    def test_construct_knowledge_graph_parallel_outputs(self):
+        """Tests the construct_knowledge_graph method when the output files are written by several processes."""
+
+        self.kg.cpus = 3
+
+        # test out the build
+        self.kg.construct_knowledge_graph()
+
+        # check for output files
+        kg = self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + \
+            'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_'
+        for output in ['KG_Networkx_MultiDiGraph.gpickle', 'KG_CSR_Adjacency.npz', 'Triples_Integers.npz',
+                       'Triples_Integer_Identifier_Map.npz']:
+            self.assertTrue(os.path.exists(kg + output))
+
+        # check the integer and identifier edge lists match
+        with open(kg + 'Triples_Integer_Identifier_Map.json', 'r') as file_name:
+            node_map = json.load(file_name)
+        with open(kg + 'Triples_Integers.txt', 'r') as file_name:
+            ints = [x.strip('\n').split('\t') for x in file_name.readlines()[1:]]
+        with open(kg + 'Triples_Identifiers.txt', 'r') as file_name:
+            ids = [x.strip('\n').split('\t') for x in file_name.readlines()[1:]]
+        self.assertEqual(ints, [[str(node_map[x]) for x in triple] for triple in ids])
+
+        # check the writers run in the worker processes were recorded
+        stages = [x['stage'] for x in self.kg.telemetry.records]
+        for stage in ['writes_integer_triples', 'writes_identifier_triples', 'writes_node_id_map',
+                      'writes_csr_adjacency', 'converts_rdflib_to_networkx']:
+            self.assertIn(stage, stages)
+
+        return None
+
+    def test_construct_knowledge_graph_ntriples(self):
+        """Tests the construct_knowledge_graph method when the knowledge graph is only written as N-Triples."""
+
+        self.kg.ntriples, self.kg.rdf_xml = '.nt.gz', False
+
+        # test out the build
+        self.kg.construct_knowledge_graph()
+
+        # check for output files
+        kg = self.dir_loc_resources + '/knowledge_graphs/inverse_relations/' + \
+            'PheKnowLator_full_InverseRelations_NotClosed_NoOWLSemantics_KG'
+        self.assertTrue(os.path.exists(kg + '.nt.gz'))
+        self.assertFalse(os.path.exists(kg + '.owl'))
+        self.assertTrue(os.path.exists(kg + '_Networkx_MultiDiGraph.gpickle'))
+
+        # check the streamed file contains the knowledge graph edges
+        graph = reads_ntriples(Graph(), kg + '.nt.gz')
+        self.assertIn((URIRef('https://www.ncbi.nlm.nih.gov/gene/3075'), RDFS.subClassOf,
+                       URIRef('http://purl.obolibrary.org/obo/SO_0001217')), graph)
+        self.assertIn((URIRef('https://www.ncbi.nlm.nih.gov/gene/3075'), RDFS.label, Literal('CFH')), graph)
+
+        # check each triple was only written once
+        with gzip.open(kg + '.nt.gz', 'rt') as infile:
+            self.assertEqual(len(graph), len(infile.readlines()))
 
         return None
 
@@ -174,6 +251,47 @@ class TestFullBuild(unittest.TestCase):
 
         return None
 
+    def test_builds_knowledge_graph_variants(self):
+        """Tests the builds_knowledge_graph_variants method."""
+
+        variants = [{'construction': 'subclass', 'inverse_relations': 'yes', 'decode_owl': 'yes'},
+                    {'construction': 'instance', 'inverse_relations': 'no', 'decode_owl': 'no'}]
+        kwargs = {'kg_version': 'v2.0.0', 'write_location': self.dir_loc_resources + '/knowledge_graphs',
+                  'edge_data': self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'node_data': 'yes',
+                  'kg_metadata_flag': 'yes'}
+
+        # test out the build
+        kg_files = builds_knowledge_graph_variants(FullBuild, variants, self.kg.owl_tools, **kwargs)
+
+        # check for output files - the construction approach is added to the filenames
+        self.assertEqual(['/'.join(x.split('/')[-2:]) for x in kg_files],
+                         ['inverse_relations/PheKnowLator_full_Subclass_InverseRelations_NotClosed_'
+                          'NoOWLSemantics_KG.owl',
+                          'relations_only/PheKnowLator_full_Instance_NotClosed_OWLSemantics_KG.owl'])
+        for kg_file in kg_files:
+            self.assertTrue(os.path.exists(kg_file))
+            self.assertTrue(os.path.exists(kg_file[:-6] + 'Triples_Integer_Identifier_Map.json'))
+        self.assertTrue(os.path.exists(kg_files[0][:-21] + 'OWLNETS.owl'))
+
+        return None
+
+    def test_builds_knowledge_graph_variants_bad_variants(self):
+        """Tests the builds_knowledge_graph_variants method when passed no or duplicate variants."""
+
+        kwargs = {'kg_version': 'v2.0.0', 'write_location': self.dir_loc_resources + '/knowledge_graphs',
+                  'edge_data': self.dir_loc_resources + '/Master_Edge_List_Dict.json', 'node_data': 'yes',
+                  'kg_metadata_flag': 'yes'}
+
+        # no variants
+        self.assertRaises(ValueError, builds_knowledge_graph_variants, FullBuild, [], self.kg.owl_tools, **kwargs)
+
+        # duplicate variants
+        variants = [{'construction': 'subclass', 'inverse_relations': 'yes', 'decode_owl': 'yes'}] * 2
+        self.assertRaises(ValueError, builds_knowledge_graph_variants, FullBuild, variants, self.kg.owl_tools,
+                          **kwargs)
+
+        return None
+
     def tearDown(self):
 
         # remove resource directory
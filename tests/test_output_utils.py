@@ -0,0 +1,280 @@
+import gzip
+import importlib.util
+import json
+import numpy
+import os
+import os.path
+import pandas
+import shutil
+import unittest
+
+from rdflib import BNode, Graph, Literal, URIRef  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS  # type: ignore
+
+from pkt_kg.utils import BinaryTriples, CSRAdjacency, IdentifierMap, NTriplesWriter, loads_binary_triples, \
+    loads_csr_adjacency, loads_identifier_map, loads_typed_edges, reads_identifier_map, reads_ntriples, TypedEdges, \
+    writes_binary_triples, writes_csr_adjacency, writes_encoded_csr_adjacency, writes_identifier_map, writes_parquet, \
+    writes_typed_edges
+
+
+class TestOutputUtils(unittest.TestCase):
+    """Class to test the knowledge graph output utility methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # set-up environment - make temp directory
+        self.temp_dir = self.dir_loc + '/temp'
+        os.mkdir(self.temp_dir)
+
+        # create triples
+        obo = 'http://purl.obolibrary.org/obo/'
+        self.triples = [(URIRef(obo + 'HP_0000001'), RDF.type, OWL.Class),
+                        (URIRef(obo + 'HP_0000001'), RDFS.label, Literal('All "phenotypes"\nand more')),
+                        (BNode('N1'), RDF.type, OWL.Restriction)]
+
+        return None
+
+    def test_writes_triples(self):
+        """Tests the NTriplesWriter writes_triples method."""
+
+        with NTriplesWriter(self.temp_dir + '/PheKnowLator_KG.nt') as writer:
+            self.assertEqual(3, writer.writes_triples(self.triples))
+
+            # triples already in the graph or repeated in the input are not written
+            graph = Graph()
+            for triple in self.triples: graph.add(triple)
+            new_triple = (URIRef('https://example.com/1'), RDF.type, OWL.Class)
+            self.assertEqual(1, writer.writes_triples([new_triple, new_triple] + self.triples, graph))
+            self.assertEqual(4, writer.triple_count)
+
+        # check the file - literals are escaped on a single line
+        with open(self.temp_dir + '/PheKnowLator_KG.nt', 'r') as infile:
+            lines = infile.readlines()
+        self.assertEqual(4, len(lines))
+        self.assertTrue(all(x.endswith(' .\n') for x in lines))
+        self.assertIn('<http://purl.obolibrary.org/obo/HP_0000001> <http://www.w3.org/2000/01/rdf-schema#label> '
+                      '"All \\"phenotypes\\"\\nand more" .\n', lines)
+
+        graph = reads_ntriples(Graph(), self.temp_dir + '/PheKnowLator_KG.nt')
+        self.assertEqual(4, len(graph))
+        self.assertIn(self.triples[1], graph)
+
+        # check typed and language-tagged literals
+        self.assertEqual('"1"^^<http://www.w3.org/2001/XMLSchema#integer>', NTriplesWriter.formats_term(Literal(1)))
+        self.assertEqual('"gene"@en', NTriplesWriter.formats_term(Literal('gene', lang='en')))
+
+        return None
+
+    def test_writes_triples_gzip(self):
+        """Tests the NTriplesWriter writes_triples method with a gzip-compressed file."""
+
+        writer = NTriplesWriter(self.temp_dir + '/PheKnowLator_KG.nt.gz')
+        writer.writes_triples(self.triples)
+        writer.close()
+
+        # check the file is compressed
+        with gzip.open(self.temp_dir + '/PheKnowLator_KG.nt.gz', 'rt') as infile:
+            self.assertEqual(3, len(infile.readlines()))
+
+        graph = reads_ntriples(Graph(), self.temp_dir + '/PheKnowLator_KG.nt.gz')
+        self.assertEqual(3, len(graph))
+        self.assertEqual(set(self.triples[:2]), set(x for x in graph if not isinstance(x[0], BNode)))
+
+        return None
+
+    def test_writes_csr_adjacency(self):
+        """Tests the writes_csr_adjacency and loads_csr_adjacency methods."""
+
+        graph = Graph()
+        for triple in self.triples + [(URIRef('http://purl.obolibrary.org/obo/HP_0000002'), RDFS.subClassOf,
+                                       URIRef('http://purl.obolibrary.org/obo/HP_0000001'))]:
+            graph.add(triple)
+        writes_csr_adjacency(graph, self.temp_dir + '/PheKnowLator_KG_CSR_Adjacency.npz')
+
+        for mmap in [True, False]:
+            csr = loads_csr_adjacency(self.temp_dir + '/PheKnowLator_KG_CSR_Adjacency.npz', mmap)
+            self.assertIsInstance(csr, CSRAdjacency)
+            self.assertEqual(isinstance(csr.indices, numpy.memmap), mmap)
+            self.assertEqual(4, csr.edge_count)
+            self.assertEqual(len(csr.indptr) - 1, csr.node_count)
+
+            # check the edges match the graph
+            edges = set((csr.node(i), csr.relation(rel), csr.node(obj)) for i in range(csr.node_count)
+                        for rel, obj in csr.neighbors(i))
+            self.assertEqual(set((str(s), str(p), str(o)) for s, p, o in graph), edges)
+
+            # check node lookups
+            node = csr.finds_node('http://purl.obolibrary.org/obo/HP_0000002')
+            self.assertEqual([(str(RDFS.subClassOf), 'http://purl.obolibrary.org/obo/HP_0000001')],
+                             [(csr.relation(x), csr.node(y)) for x, y in csr.neighbors(node)])
+            self.assertIsNone(csr.finds_node('http://purl.obolibrary.org/obo/HP_9999999'))
+
+        return None
+
+    def test_writes_encoded_csr_adjacency(self):
+        """Tests the writes_encoded_csr_adjacency method."""
+
+        graph = Graph()
+        for triple in self.triples + [(URIRef('http://purl.obolibrary.org/obo/HP_0000002'), RDFS.subClassOf,
+                                       URIRef('http://purl.obolibrary.org/obo/HP_0000001'))]:
+            graph.add(triple)
+        writes_csr_adjacency(graph, self.temp_dir + '/PheKnowLator_KG_CSR_Adjacency.npz')
+
+        # encode the triples with unused identifiers, which are not added to the matrix
+        codes, identifiers = pandas.factorize(numpy.array([str(x) for triple in graph for x in triple], dtype=object))
+        codes, identifiers = codes.reshape(-1, 3) + 1, numpy.concatenate([['N2'], identifiers])
+        writes_encoded_csr_adjacency(codes, identifiers, self.temp_dir + '/PheKnowLator_KG_Encoded_CSR_Adjacency.npz')
+
+        csr = loads_csr_adjacency(self.temp_dir + '/PheKnowLator_KG_CSR_Adjacency.npz')
+        encoded_csr = loads_csr_adjacency(self.temp_dir + '/PheKnowLator_KG_Encoded_CSR_Adjacency.npz')
+        self.assertEqual(csr.node_count, encoded_csr.node_count)
+        self.assertEqual([csr.node(i) for i in range(csr.node_count)],
+                         [encoded_csr.node(i) for i in range(encoded_csr.node_count)])
+        self.assertEqual([csr.neighbors(i) for i in range(csr.node_count)],
+                         [encoded_csr.neighbors(i) for i in range(encoded_csr.node_count)])
+
+        return None
+
+    def test_writes_binary_triples(self):
+        """Tests the writes_binary_triples and loads_binary_triples methods."""
+
+        int_triples = numpy.array([[1, 2, 3], [4, 5, 1], [1, 6, 4], [3, 2, 1], [1, 2, 4]])
+        writes_binary_triples(int_triples, self.temp_dir + '/PheKnowLator_KG_Triples_Integers.npz')
+
+        for mmap in [True, False]:
+            triples = loads_binary_triples(self.temp_dir + '/PheKnowLator_KG_Triples_Integers.npz', mmap)
+            self.assertIsInstance(triples, BinaryTriples)
+            self.assertEqual(isinstance(triples.spo, numpy.memmap), mmap)
+            self.assertEqual(numpy.int32, triples.spo.dtype)
+            self.assertEqual(5, triples.triple_count)
+
+            # check triple pattern queries
+            self.assertEqual(sorted(int_triples.tolist()), triples.triples().tolist())
+            self.assertEqual([[1, 2, 3], [1, 2, 4], [1, 6, 4]], triples.triples(subject=1).tolist())
+            self.assertEqual([[3, 2, 1], [1, 2, 3], [1, 2, 4]], triples.triples(predicate=2).tolist())
+            self.assertEqual([[3, 2, 1], [4, 5, 1]], triples.triples(obj=1).tolist())
+            self.assertEqual([[1, 2, 4], [1, 6, 4]], triples.triples(subject=1, obj=4).tolist())
+            self.assertEqual([[1, 6, 4]], triples.triples(subject=1, predicate=6, obj=4).tolist())
+            self.assertEqual([], triples.triples(subject=2).tolist())
+            self.assertEqual(3, len(triples.neighbors(4)))
+
+        return None
+
+    def test_writes_identifier_map(self):
+        """Tests the writes_identifier_map and loads_identifier_map methods."""
+
+        identifiers = ['http://purl.obolibrary.org/obo/HP_0000002', str(RDF.type), 'All "phenotypes"\nand more',
+                       'http://purl.obolibrary.org/obo/HP_0000001', 'N1', 'caf\u00e9', 'cafe', '']
+        writes_identifier_map(identifiers, self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.npz')
+
+        for mmap in [True, False]:
+            node_map = loads_identifier_map(self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.npz', mmap)
+            self.assertIsInstance(node_map, IdentifierMap)
+            self.assertEqual(isinstance(node_map.integers, numpy.memmap), mmap)
+            self.assertEqual(8, len(node_map))
+
+            # check lookups in both directions
+            self.assertEqual(identifiers, [node_map.identifier(i) for i in range(1, 9)])
+            self.assertEqual(list(range(1, 9)), [node_map.integer(x) for x in identifiers])
+            self.assertIsNone(node_map.identifier(0))
+            self.assertIsNone(node_map.identifier(9))
+            self.assertIsNone(node_map.integer('http://purl.obolibrary.org/obo/HP_0000003'))
+            self.assertIsNone(node_map.integer('zzz'))
+            self.assertEqual(identifiers, node_map.identifiers())
+
+        return None
+
+    def test_reads_identifier_map(self):
+        """Tests the reads_identifier_map method."""
+
+        identifiers = ['http://purl.obolibrary.org/obo/HP_0000002', str(RDF.type), '', 'N1']
+        writes_identifier_map(identifiers, self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.npz')
+        with open(self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.json', 'w') as outfile:
+            json.dump({x: i for i, x in enumerate(identifiers, 1)}, outfile)
+
+        self.assertEqual(identifiers, reads_identifier_map(self.temp_dir +
+                                                           '/PheKnowLator_KG_Triples_Integer_Identifier_Map.npz'))
+        self.assertEqual(identifiers, reads_identifier_map(self.temp_dir +
+                                                           '/PheKnowLator_KG_Triples_Integer_Identifier_Map.json'))
+        self.assertRaises(OSError, reads_identifier_map, self.temp_dir + '/PheKnowLator_KG_Map.json')
+
+        # check maps whose integers are not 1 to the number of identifiers
+        for node_map in [{'N1': 1, 'N2': 3}, {'N1': 1, 'N2': 1}, {'N1': 0}, {'N1': '1'}]:
+            with open(self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.json', 'w') as outfile:
+                json.dump(node_map, outfile)
+            self.assertRaises(ValueError, reads_identifier_map,
+                              self.temp_dir + '/PheKnowLator_KG_Triples_Integer_Identifier_Map.json')
+
+        return None
+
+    def test_writes_typed_edges(self):
+        """Tests the writes_typed_edges and loads_typed_edges methods."""
+
+        obo, gene = 'http://purl.obolibrary.org/obo/', 'http://purl.uniprot.org/geneid/'
+        edge_dict = {'gene-disease': {'edge_relation': 'RO_0003302', 'uri': [gene, obo],
+                                      'edge_list': [['19', 'DOID_1936'], ['19', 'DOID_2348'], ['20', 'DOID_1936']]},
+                     'gene-gene': {'edge_relation': 'RO_0002435', 'uri': [gene, gene],
+                                   'edge_list': [['21', '19']]},
+                     'chemical-disease': {'edge_relation': 'RO_0002606', 'uri': [obo, obo], 'edge_list': []}}
+        writes_typed_edges(edge_dict, self.temp_dir + '/PheKnowLator_KG_Typed_Edges.npz')
+
+        for mmap in [True, False]:
+            typed_edges = loads_typed_edges(self.temp_dir + '/PheKnowLator_KG_Typed_Edges.npz', mmap)
+            self.assertIsInstance(typed_edges, TypedEdges)
+            self.assertEqual([('chemical', 'RO_0002606', 'disease'), ('gene', 'RO_0002435', 'gene'),
+                              ('gene', 'RO_0003302', 'disease')], typed_edges.edge_types)
+            self.assertEqual(['chemical', 'disease', 'gene'], typed_edges.node_types)
+
+            # check node numbers are shared by the edge types of a node type
+            self.assertEqual([gene + '19', gene + '20', gene + '21'], typed_edges.nodes('gene'))
+            self.assertEqual([obo + 'DOID_1936', obo + 'DOID_2348'], typed_edges.nodes('disease'))
+            self.assertEqual([], typed_edges.nodes('chemical'))
+            self.assertEqual(2, typed_edges.node_index('gene', gene + '21'))
+            self.assertIsNone(typed_edges.node_index('disease', gene + '21'))
+
+            # check the edges of each edge type
+            edges = typed_edges.edges(('gene', 'RO_0003302', 'disease'))
+            self.assertEqual(numpy.int64, edges.dtype)
+            self.assertEqual([[0, 0, 1], [0, 1, 0]], edges.tolist())
+            self.assertEqual([[2], [0]], typed_edges.edges(('gene', 'RO_0002435', 'gene')).tolist())
+            self.assertEqual((2, 0), typed_edges.edges(('chemical', 'RO_0002606', 'disease')).shape)
+
+        return None
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is not None, 'pyarrow is installed')
+    def test_writes_parquet_without_pyarrow(self):
+        """Tests the writes_parquet method when pyarrow is not installed."""
+
+        data = pandas.DataFrame([['HP_0000001', 'label']], columns=['node_id', 'label'])
+        self.assertRaises(ImportError, writes_parquet, data, self.temp_dir + '/PheKnowLator_KG_NodeLabels.parquet')
+        self.assertFalse(os.path.exists(self.temp_dir + '/PheKnowLator_KG_NodeLabels.parquet'))
+
+        return None
+
+    @unittest.skipIf(importlib.util.find_spec('pyarrow') is None, 'pyarrow is not installed')
+    def test_writes_parquet(self):
+        """Tests the writes_parquet method."""
+
+        data = pandas.DataFrame([[str(s), str(p), str(o)] for s, p, o in self.triples],
+                                columns=['subject', 'predicate', 'object'])
+        data['count'] = range(len(data))
+        writes_parquet(data, self.temp_dir + '/PheKnowLator_KG_Triples_Identifiers.parquet')
+
+        # check the string columns are dictionary-encoded and the data is unchanged
+        parquet_data = pandas.read_parquet(self.temp_dir + '/PheKnowLator_KG_Triples_Identifiers.parquet')
+        self.assertEqual(['category', 'category', 'category'], [str(parquet_data[x].dtype) for x in data.columns[:3]])
+        parquet_data = parquet_data.astype({x: object for x in data.columns[:3]})
+        self.assertEqual(data.values.tolist(), parquet_data.values.tolist())
+
+        return None
+
+    def tearDown(self):
+
+        # remove temp directory
+        shutil.rmtree(self.temp_dir)
+
+        return None
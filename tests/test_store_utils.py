@@ -0,0 +1,141 @@
+import glob
+import os
+import os.path
+import shutil
+import unittest
+
+from rdflib import BNode, Graph, Literal, URIRef  # type: ignore
+from rdflib.namespace import OWL, RDF, RDFS, XSD  # type: ignore
+
+from pkt_kg.utils import SQLiteStore, creates_graph
+
+
+class TestStoreUtils(unittest.TestCase):
+    """Class to test the knowledge graph storage utility methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # set-up environment - make temp directory
+        self.temp_dir = self.dir_loc + '/temp'
+        os.mkdir(self.temp_dir)
+        self.db_file = self.temp_dir + '/PheKnowLator_KG_TripleStore.db'
+
+        # create triples
+        self.triples = [(URIRef('http://purl.obolibrary.org/obo/HP_0000001'), RDF.type, OWL.Class),
+                        (URIRef('http://purl.obolibrary.org/obo/HP_0000001'), RDFS.label, Literal('All')),
+                        (URIRef('http://purl.obolibrary.org/obo/HP_0000001'), RDFS.comment, Literal('x', lang='en')),
+                        (URIRef('http://purl.obolibrary.org/obo/HP_0000118'), RDFS.subClassOf,
+                         URIRef('http://purl.obolibrary.org/obo/HP_0000001')),
+                        (URIRef('http://purl.obolibrary.org/obo/HP_0000118'), RDF.type, OWL.Class),
+                        (BNode('N1'), OWL.cardinality, Literal('1', datatype=XSD.nonNegativeInteger))]
+
+        return None
+
+    def test_creates_graph(self):
+        """Tests the creates_graph method."""
+
+        self.assertRaises(ValueError, creates_graph, 'disk', self.db_file)
+        self.assertRaises(ValueError, creates_graph, 'sqlite', None)
+
+        # in-memory graph
+        self.assertIsInstance(creates_graph('memory').store, type(Graph().store))
+
+        # sqlite graph - prior triples are removed
+        graph = creates_graph('sqlite', self.db_file)
+        self.assertIsInstance(graph.store, SQLiteStore)
+        graph.add(self.triples[0])
+        graph.close()
+        self.assertEqual(0, len(creates_graph('sqlite', self.db_file)))
+
+        return None
+
+    def test_sqlite_store_add_and_query(self):
+        """Tests adding triples to and querying the SQLiteStore."""
+
+        graph = creates_graph('sqlite', self.db_file)
+        for triple in self.triples + self.triples[:2]:
+            graph.add(triple)
+
+        # check duplicate triples were ignored and all terms round-trip
+        self.assertEqual(6, len(graph))
+        self.assertEqual(set(self.triples), set(graph))
+
+        # check triple patterns
+        self.assertEqual(2, len(list(graph.triples((None, RDF.type, None)))))
+        self.assertEqual(3, len(list(graph.triples((URIRef('http://purl.obolibrary.org/obo/HP_0000001'), None,
+                                                    None)))))
+        self.assertEqual(2, len(list(graph.subjects(RDF.type, OWL.Class))))
+        self.assertEqual([], list(graph.triples((None, RDF.type, OWL.ObjectProperty))))
+        self.assertIn(self.triples[2], graph)
+
+        # check triples can be added in batches
+        graph.addN((URIRef('http://purl.obolibrary.org/obo/GO_' + str(x)), RDF.type, OWL.Class, graph)
+                   for x in range(25))
+        self.assertEqual(31, len(graph))
+
+        return None
+
+    def test_sqlite_store_remove(self):
+        """Tests removing triples from the SQLiteStore while iterating over it."""
+
+        store = SQLiteStore(batch_size=2)
+        store.open(self.db_file, create=True)
+        graph = Graph(store=store)
+        for triple in self.triples:
+            graph.add(triple)
+
+        # remove triples while iterating over paginated results
+        for triple in graph:
+            graph.remove(triple)
+        self.assertEqual(0, len(graph))
+        self.assertEqual([], list(graph))
+
+        return None
+
+    def test_sqlite_store_rollback(self):
+        """Tests that triples added after a rollback of the SQLiteStore can be queried."""
+
+        graph = creates_graph('sqlite', self.db_file)
+        graph.add(self.triples[0])
+        graph.commit()
+
+        # discard a triple whose terms are new, then add it again
+        graph.add(self.triples[3])
+        graph.rollback()
+        self.assertEqual({self.triples[0]}, set(graph))
+        graph.add(self.triples[3])
+        self.assertEqual(2, len(graph))
+        self.assertEqual({self.triples[0], self.triples[3]}, set(graph))
+        self.assertEqual([self.triples[3]], list(graph.triples((None, RDFS.subClassOf, None))))
+
+        return None
+
+    def test_sqlite_store_persistence(self):
+        """Tests that triples and namespaces are persisted when the SQLiteStore is re-opened."""
+
+        graph = creates_graph('sqlite', self.db_file)
+        graph.bind('obo', URIRef('http://purl.obolibrary.org/obo/'))
+        for triple in self.triples:
+            graph.add(triple)
+        graph.close()
+
+        store = SQLiteStore()
+        self.assertEqual(1, store.open(self.db_file, create=False))
+        graph = Graph(store=store)
+        self.assertEqual(set(self.triples), set(graph))
+        self.assertEqual(URIRef('http://purl.obolibrary.org/obo/'), store.namespace('obo'))
+        store.destroy(self.db_file)
+        self.assertEqual([], glob.glob(self.db_file + '*'))
+
+        return None
+
+    def tearDown(self):
+
+        # remove temp directory
+        shutil.rmtree(self.temp_dir)
+
+        return None
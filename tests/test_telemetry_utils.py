@@ -0,0 +1,103 @@
+import json
+import os
+import os.path
+import shutil
+import unittest
+
+from pkt_kg.utils import BuildTelemetry, gets_resource_usage
+
+
+class TestTelemetryUtils(unittest.TestCase):
+    """Class to test the knowledge graph build telemetry utility methods."""
+
+    def setUp(self):
+        # initialize data location
+        current_directory = os.path.dirname(__file__)
+        dir_loc = os.path.join(current_directory, 'data')
+        self.dir_loc = os.path.abspath(dir_loc)
+
+        # set-up environment - make temp directory
+        self.temp_dir = self.dir_loc + '/temp'
+        os.mkdir(self.temp_dir)
+        self.report_file = self.temp_dir + '/PheKnowLator_KG_Telemetry.json'
+
+        return None
+
+    def test_gets_resource_usage(self):
+        """Tests the gets_resource_usage method."""
+
+        usage = gets_resource_usage()
+        self.assertEqual({'cpu_seconds', 'child_cpu_seconds', 'process_peak_rss_mb', 'process_peak_child_rss_mb'},
+                         set(usage.keys()))
+        self.assertGreater(usage['cpu_seconds'], 0)
+        self.assertGreater(usage['process_peak_rss_mb'], 0)
+
+        return None
+
+    def test_records_stage(self):
+        """Tests the records_stage method."""
+
+        telemetry = BuildTelemetry()
+
+        # stage with items known in advance
+        with telemetry.records_stage('creates_knowledge_graph_edges', 'gene-gene', 1000) as record:
+            total = sum(range(100000))
+            record['triples'] = 7000
+        self.assertEqual(4999950000, total)
+
+        # stage with items set while it runs
+        with telemetry.records_stage('maps_node_ids_to_integers') as record:
+            record['items'] = 50
+
+        # stage without items
+        with telemetry.records_stage('reverse_relation_processor'):
+            pass
+
+        self.assertEqual(3, len(telemetry.records))
+        record = telemetry.records[0]
+        self.assertEqual(('creates_knowledge_graph_edges', 'gene-gene', 1000, 7000),
+                         (record['stage'], record['edge_type'], record['items'], record['triples']))
+        self.assertGreater(record['wall_seconds'], 0)
+        self.assertGreaterEqual(record['cpu_seconds'], 0)
+        self.assertAlmostEqual(1000 / record['wall_seconds'], record['items_per_second'])
+        self.assertEqual(50, telemetry.records[1]['items'])
+        self.assertIsNone(telemetry.records[1]['edge_type'])
+        self.assertIsNone(telemetry.records[2]['items_per_second'])
+
+        return None
+
+    def test_records_stage_error(self):
+        """Tests the records_stage method when the stage raises an error."""
+
+        telemetry = BuildTelemetry()
+
+        with self.assertRaises(ValueError):
+            with telemetry.records_stage('merges_ontologies'):
+                raise ValueError('failed')
+        self.assertEqual(1, len(telemetry.records))
+        self.assertEqual('merges_ontologies', telemetry.records[0]['stage'])
+
+        return None
+
+    def test_writes_report(self):
+        """Tests the writes_report method."""
+
+        telemetry = BuildTelemetry()
+        with telemetry.records_stage('loads_merged_ontologies') as record:
+            record['items'] = record['triples'] = 100
+        telemetry.writes_report(self.report_file)
+
+        # check report contents
+        with open(self.report_file) as report_file:
+            report = json.load(report_file)
+        self.assertEqual({'created', 'written', 'python_version', 'platform', 'cpu_count', 'stages'}, set(report))
+        self.assertEqual(telemetry.records, report['stages'])
+
+        return None
+
+    def tearDown(self):
+
+        # remove temp directory
+        shutil.rmtree(self.temp_dir)
+
+        return None